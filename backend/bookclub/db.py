@@ -0,0 +1,81 @@
+"""
+SQLite connection profiles and read/write routing.
+
+The development profile is a plain ``sqlite3`` file with Django's defaults.
+The production profile (``BOOKCLUB_DB_PROFILE=production``) tunes it for
+many concurrent requests:
+
+* WAL journal, so readers never block the writer and vice versa;
+* ``BEGIN IMMEDIATE`` transactions, so a transaction takes the write lock
+  up front and waits on the busy timeout, instead of failing with
+  "database is locked" when it later upgrades from a read lock;
+* ``synchronous=NORMAL`` (safe with WAL), a bigger page cache and mmap I/O;
+* optionally, persistent connections (``CONN_MAX_AGE``), so the pragmas
+  and the page cache survive across requests. They are off by default:
+  under ASGI, which the async views are written for, Django runs each
+  request's database work on threads it cannot close connections on, so
+  persistent connections pile up instead of being reused (Django's docs
+  advise against them there). Only turn them on under a WSGI server;
+* a second, query-only connection to the same file that serves reads
+  (``ReadReplicaRouter``), leaving the write connection to writers.
+"""
+from django.db import connections
+
+PRAGMAS = [
+    # WAL is a property of the database file, so whichever connection opens
+    # first switches it; the others just confirm it.
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA cache_size = -32000',  # KiB, i.e. 32 MB per connection
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA temp_store = MEMORY',
+]
+
+
+def sqlite_database(name, *, read_only=False, busy_timeout=20, conn_max_age=0):
+    """``DATABASES`` entry for the production SQLite profile."""
+    if read_only:
+        pragmas = PRAGMAS + ['PRAGMA query_only = ON']
+        options = {}
+    else:
+        pragmas = PRAGMAS
+        options = {'transaction_mode': 'IMMEDIATE'}
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+        'CONN_MAX_AGE': conn_max_age,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'timeout': busy_timeout,
+            'init_command': '; '.join(pragmas),
+            **options,
+        },
+        # Tests run against the primary; the replica is the same file anyway.
+        'TEST': {'MIRROR': 'default'} if read_only else {},
+    }
+
+
+class ReadReplicaRouter:
+    """Send reads to the ``replica`` connection and writes to ``default``.
+
+    Reads made inside a transaction on ``default`` stay on ``default`` so
+    they see that transaction's own, not yet committed, writes. Outside a
+    transaction WAL gives the replica every committed write immediately.
+    """
+    primary = 'default'
+    replica = 'replica'
+
+    def db_for_read(self, model, **hints):
+        if connections[self.primary].in_atomic_block:
+            return self.primary
+        return self.replica
+
+    def db_for_write(self, model, **hints):
+        return self.primary
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases are the same database file.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != self.replica
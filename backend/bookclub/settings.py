@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from .db import sqlite_database
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -43,6 +46,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover the whole stack (see bookclub_app/instrumentation.py)
+    'bookclub_app.instrumentation.RequestMetricsMiddleware',
+    # Gzips large bodies on their way out; streams pass through (see bookclub_app/compression.py)
+    'bookclub_app.compression.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -76,12 +83,109 @@ WSGI_APPLICATION = 'bookclub.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# BOOKCLUB_DB_PROFILE=production enables WAL, tuned pragmas and a separate
+# read connection (see bookclub/db.py). BOOKCLUB_CONN_MAX_AGE keeps its
+# connections open for that many seconds; leave it at 0 under ASGI (uvicorn,
+# daphne), where Django cannot reuse or close persistent connections.
+DB_PROFILE = os.environ.get('BOOKCLUB_DB_PROFILE', 'development')
+DB_CONN_MAX_AGE = int(os.environ.get('BOOKCLUB_CONN_MAX_AGE', 0))
+
+if DB_PROFILE == 'production':
+    DATABASES = {
+        'default': sqlite_database(BASE_DIR / 'db.sqlite3', conn_max_age=DB_CONN_MAX_AGE),
+        'replica': sqlite_database(BASE_DIR / 'db.sqlite3', read_only=True, conn_max_age=DB_CONN_MAX_AGE),
     }
-}
+    DATABASE_ROUTERS = ['bookclub.db.ReadReplicaRouter']
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        }
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Version stamps (ETags, cached stats), sessions and signed-in users live
+# here. LocMemCache is per process, so it is only correct with a single
+# worker process: another worker would never see a version bump and would
+# keep answering 304 to stale ETags. With several workers set
+# BOOKCLUB_REDIS_URL (needs `pip install redis`) to share one Redis cache;
+# `manage.py check` warns when the production profile runs on locmem.
+
+if os.environ.get('BOOKCLUB_REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['BOOKCLUB_REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'bookclub',
+            # Sessions and signed-in users are cached here too
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+# Identify the caller without queries: sessions are read from the cache
+# (written through to the database) and so are users, which are dropped from
+# the cache when saved (see bookclub_app/backends.py). Logout and password
+# changes take effect at once in this process; with several workers the cache
+# must be shared for them to take effect everywhere.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+AUTHENTICATION_BACKENDS = [
+    'bookclub_app.backends.CachedModelBackend',
+    # Sessions started before the cached backend keep working
+    'django.contrib.auth.backends.ModelBackend',
+]
+AUTH_USER_CACHE_TIMEOUT = 300
+
+# check_username answers from an in-memory Bloom filter plus set of taken
+# usernames (see bookclub_app/usernames.py), rebuilt after MAX_AGE seconds to
+# pick up users created by other processes. Each client IP may check
+# USERNAME_CHECK_RATE names per second, in bursts of up to USERNAME_CHECK_BURST.
+USERNAME_INDEX_MAX_AGE = 300
+USERNAME_INDEX_ERROR_RATE = 0.01
+USERNAME_CHECK_RATE = 2
+USERNAME_CHECK_BURST = 20
+
+# Seconds a group's progress stats may be served from cache. Entries are also
+# invalidated whenever a member's progress or the membership list changes.
+GROUP_STATS_CACHE_TIMEOUT = 60
+
+# Comments embedded in each post of a discussion page (the latest ones); the
+# full thread is paginated at /api/posts/<id>/comments/.
+COMMENT_PREVIEW_SIZE = 3
+
+# Pub/sub backend for discussion push events (see bookclub_app/realtime.py).
+# LocalBroker fans out in-process, which is enough for a single ASGI server.
+REALTIME_BROKER = 'bookclub_app.realtime.LocalBroker'
+
+# max-age (seconds) browsers may reuse catalog and chapter responses before
+# revalidating them with If-None-Match (see bookclub_app/conditional.py).
+CATALOG_CACHE_MAX_AGE = 60
+
+# Write-behind for page-turn progress updates (see bookclub_app/progress_buffer.py).
+# When enabled, PUTs that only change current_page are buffered in-process and
+# written in batches every PROGRESS_FLUSH_INTERVAL seconds or once
+# PROGRESS_FLUSH_THRESHOLD users have pending pages, and at shutdown.
+PROGRESS_WRITE_BEHIND = False
+PROGRESS_FLUSH_INTERVAL = 5
+PROGRESS_FLUSH_THRESHOLD = 500
+
+# `manage.py send_deadline_reminders` (run daily) notifies members about
+# unfinished chapters due within this many days.
+NOTIFICATION_DEADLINE_DAYS = 3
+
+# Request instrumentation (bookclub_app/instrumentation.py): add Server-Timing
+# headers to responses, and log a query once it repeats this many times in
+# one request.
+SERVER_TIMING = DEBUG
+QUERY_DUPLICATE_THRESHOLD = 3
 
 
 # Password validation
@@ -134,7 +238,19 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.BasicAuthentication',
     ],
+    # orjson when installed, else the stdlib (see bookclub_app/renderers.py)
+    'DEFAULT_RENDERER_CLASSES': [
+        'bookclub_app.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
+# Responses at least this large are gzipped for clients that accept it
+GZIP_MIN_LENGTH = 1024
+# Keyset pagination for list endpoints (see bookclub_app/pagination.py).
+# Clients may ask for ?page_size= up to API_MAX_PAGE_SIZE.
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 200
+
 # Allow React dev server
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
@@ -158,6 +274,9 @@ CORS_ALLOW_HEADERS = [
     'x-requested-with',
 ]
 
+# Let the frontend read pagination cursors
+CORS_EXPOSE_HEADERS = ['Link']
+
 CORS_ALLOW_METHODS = [
     'DELETE',
     'GET',
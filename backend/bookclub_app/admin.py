@@ -2,7 +2,7 @@
 # Register your models here.
 # bookclub_app/admin.py
 from django.contrib import admin
-from .models import Book, Chapter, ReadingGroup, GroupMembership, DiscussionPost, Comment
+from .models import Book, Chapter, ReadingGroup, GroupMembership, DiscussionPost, Comment, Notification
 
 @admin.register(Book)
 class BookAdmin(admin.ModelAdmin):
@@ -17,6 +17,7 @@ class ChapterAdmin(admin.ModelAdmin):
 class ReadingGroupAdmin(admin.ModelAdmin):
     list_display = ['name', 'book', 'creator', 'start_date', 'end_date', 'member_count']
     list_filter = ['book', 'creator']
+    list_select_related = ['book', 'creator']
 
 @admin.register(GroupMembership)
 class GroupMembershipAdmin(admin.ModelAdmin):
@@ -30,4 +31,10 @@ class DiscussionPostAdmin(admin.ModelAdmin):
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
-    list_display = ['post', 'author', 'created_at']
\ No newline at end of file
+    list_display = ['post', 'author', 'created_at']
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    list_display = ['recipient', 'kind', 'message', 'created_at', 'read_at']
+    list_filter = ['kind']
+    list_select_related = ['recipient']
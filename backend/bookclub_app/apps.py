@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db import connections
 
 
 class BookclubAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'bookclub_app'
+
+    def ready(self):
+        from . import checks, signals  # noqa: F401
+        from .instrumentation import install_query_recorder
+
+        # Connections opened before this point (e.g. by checks) get the recorder too
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(sender=None, connection=connection)
@@ -0,0 +1,182 @@
+# bookclub_app/async_views.py
+"""Async read path for the hottest GET endpoints.
+
+DRF function views are synchronous, so under ASGI each of them holds a
+thread for as long as it waits on the database. The views here answer GET
+(and HEAD) natively on the event loop with Django's async ORM, and hand every
+other method to the existing DRF view, so URLs, validation and write paths
+are unchanged.
+
+They authenticate with the same DRF authentication classes and return the
+same JSON bodies (rendered with the first ``DEFAULT_RENDERER_CLASSES``),
+error payloads and ``Link`` pagination headers as the sync views they stand
+in for.
+
+Independent queries are awaited together with ``asyncio.gather``. The ORM
+still runs them one at a time on the request's database connection; the win
+is that no worker thread is parked while a request waits, so one process can
+keep many more readers in flight.
+"""
+import asyncio
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import APIException, AuthenticationFailed, NotAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from . import views
+from .caching import aget_version
+from .conditional import conditional
+from .instrumentation import timed
+from .pagination import KeysetPagination
+from .row_serializers import book_rows
+from .permissions import aload_member_group
+from .serializers import DiscussionPostSerializer
+
+
+def render(data, status=status.HTTP_200_OK, headers=None):
+    """A DRF ``Response`` rendered as JSON (there is no APIView to negotiate it)."""
+    response = Response(data, status=status, headers=headers)
+    response.accepted_renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    response.accepted_media_type = response.accepted_renderer.media_type
+    response.renderer_context = {}
+    return response.render()
+
+
+def _error_response(request, exc):
+    detail = exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail}
+    if isinstance(exc, (NotAuthenticated, AuthenticationFailed)):
+        # As APIView does: 401 only if the first authenticator can issue a challenge
+        challenge = request.authenticators[0].authenticate_header(request) if request.authenticators else None
+        if not challenge:
+            return render(detail, status=status.HTTP_403_FORBIDDEN)
+        return render(detail, status=status.HTTP_401_UNAUTHORIZED, headers={"WWW-Authenticate": challenge})
+    return render(detail, status=exc.status_code)
+
+
+def _authenticate(request):
+    user = request.user  # runs the DRF authenticators (sessions hit the database)
+    if not user.is_authenticated:
+        raise NotAuthenticated()
+    return user
+
+
+def async_read(sync_view):
+    """Serve GET/HEAD with the decorated coroutine and other methods with ``sync_view``.
+
+    The coroutine receives a DRF ``Request`` with an authenticated ``user``.
+    ``APIException``s it raises become the usual ``{"detail": ...}`` or
+    ``{"error": ...}`` JSON responses.
+    """
+    def decorator(handler):
+        @csrf_exempt  # like every DRF view; SessionAuthentication enforces CSRF itself
+        @wraps(handler)
+        async def view(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return await sync_to_async(sync_view)(request, *args, **kwargs)
+
+            request = Request(
+                request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+            )
+            try:
+                await sync_to_async(_authenticate)(request)
+                return await handler(request, *args, **kwargs)
+            except APIException as exc:
+                return _error_response(request, exc)
+        return view
+    return decorator
+
+
+async def _paginated(request, queryset, ordering, serializer_class):
+    paginator = KeysetPagination(ordering)
+    page = await paginator.apaginate_queryset(queryset, request)
+    link_header = paginator.get_link_header()
+    with timed("serialize"):
+        data = serializer_class(page, many=True).data
+    return render(data, headers={"Link": link_header} if link_header else None)
+
+
+async def _paginated_rows(request, queryset, ordering, row_serializer):
+    paginator = KeysetPagination(ordering)
+    page = await paginator.apaginate_queryset(row_serializer.queryset(queryset, *paginator.ordering_names()), request)
+    link_header = paginator.get_link_header()
+    with timed("serialize"):
+        data = row_serializer.many(page)
+    return render(data, headers={"Link": link_header} if link_header else None)
+
+
+# ==== BOOKS ====
+
+async def _catalog_validators(request):
+    return f"catalog-{await aget_version('catalog')}"
+
+
+@async_read(views.book_list)
+@conditional(_catalog_validators)
+async def book_list(request):
+    """Async ``views.book_list``."""
+    # Building the query may probe the database once for FTS5 support
+    books, ordering = await sync_to_async(views.catalog_query)(request)
+    return await _paginated_rows(request, books, ordering, book_rows)
+
+
+# ==== GROUPS ====
+
+@async_read(views.group_discussion)
+async def group_discussion(request, group_id):
+    """Async GET of ``views.group_discussion``; POST goes to the DRF view."""
+    group = await aload_member_group(request.user, group_id)
+    return await _paginated(
+        request, views.discussion_posts(group, request.user), ("-created_at", "-id"), DiscussionPostSerializer
+    )
+
+
+@async_read(views.group_detail)
+async def group_detail(request, group_id):
+    """Async ``views.group_detail``: the group and its members load together."""
+    group, memberships = await asyncio.gather(
+        aload_member_group(request.user, group_id),
+        _list(views.group_members(group_id)),
+    )
+    with timed("serialize"):
+        data = views.group_detail_data(group, memberships)
+    return render(data)
+
+
+@async_read(views.group_progress_stats)
+async def group_progress_stats(request, group_id):
+    """Async ``views.group_progress_stats``, sharing its cache entries."""
+    today = timezone.localdate()
+    group, version = await asyncio.gather(
+        aload_member_group(request.user, group_id),
+        aget_version("group-progress", int(group_id)),
+    )
+    cache_key = views.group_stats_cache_key(group, version, today)
+    stats = await cache.aget(cache_key)
+    if stats is None:
+        members = await _list(views.group_progress_rows(group))
+        stats = views.compute_group_progress_stats(group, today, members)
+        await cache.aset(cache_key, stats, settings.GROUP_STATS_CACHE_TIMEOUT)
+    return render(stats)
+
+
+@async_read(views.dashboard)
+async def dashboard(request):
+    """Async ``views.dashboard``: its three queries are awaited together."""
+    groups, progress, schedules = await asyncio.gather(
+        *(_list(queryset) for queryset in views.dashboard_querysets(request.user))
+    )
+    with timed("serialize"):
+        data = views.dashboard_data(groups, progress, schedules)
+    return render(data)
+
+
+async def _list(queryset):
+    return [obj async for obj in queryset]
@@ -0,0 +1,43 @@
+# bookclub_app/backends.py
+"""Authentication backend that identifies signed-in users from the cache.
+
+With the ``cached_db`` session engine the session is read from the cache,
+and ``CachedModelBackend.get_user`` serves the user row from the cache too,
+so an authenticated request needs no query to know who is calling. Users
+are cached as they sign in.
+
+Cached users are dropped whenever a ``User`` is saved or deleted (see
+``signals.py``). That includes a password change, after which Django's
+session hash check rejects every other session of that user. Logging out
+deletes the session from the cache and the database. Entries also expire
+after ``AUTH_USER_CACHE_TIMEOUT`` seconds, which bounds how long a change
+made without signals (``QuerySet.update``) can go unnoticed.
+"""
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+
+def user_cache_key(user_id):
+    return f'auth-user:{user_id}'
+
+
+def remember_user(user):
+    cache.set(user_cache_key(user.pk), user, settings.AUTH_USER_CACHE_TIMEOUT)
+
+
+def forget_user(user_id):
+    """Make the next request by this user load it from the database."""
+    cache.delete(user_cache_key(user_id))
+
+
+class CachedModelBackend(ModelBackend):
+    def get_user(self, user_id):
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            remember_user(user)
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,414 @@
+# bookclub_app/benchmarking.py
+"""Synthetic data and traffic replay for ``manage.py benchmark``.
+
+``seed`` fills the current database with generated users, books, groups,
+discussion threads and reading progress using chunked ``bulk_create``.
+That sends no signals, so it fills in what they would have maintained
+itself (member, comment and reaction counts, the search index). ``replay``
+sends a weighted mix of API requests through Django's test client, in
+process, as a pool of signed-in members, and ``summarize`` turns the samples
+into latency percentiles, queries per request and throughput. ``compare``
+diffs two summaries to flag regressions. ``time_serializers`` times the list
+endpoints' row serializers against the DRF serializers they replace, and
+``time_rendering`` compares JSON encoders and gzip sizes on real pages.
+"""
+import datetime
+import platform
+import re
+import statistics
+import time
+from collections import Counter, defaultdict
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import Client, override_settings
+from django.utils import timezone
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+
+from . import row_serializers, search, views
+from .models import (
+    Book, Chapter, Comment, DiscussionPost, GroupMembership, Reaction, ReactionCount, ReadingGroup,
+    ReadingProgress,
+)
+from .renderers import FastJSONRenderer
+from .serializers import BookSerializer, DiscussionPostSerializer, ReadingGroupSerializer, ReadingProgressSerializer
+
+SCALES = {
+    'tiny': dict(users=60, books=10, groups=12, posts=150, comments=300, reactions=300, progress=40),
+    'small': dict(users=2_000, books=50, groups=200, posts=10_000, comments=20_000, reactions=20_000, progress=1_000),
+    'large': dict(
+        users=100_000, books=500, groups=10_000, posts=300_000, comments=400_000, reactions=300_000,
+        progress=50_000,
+    ),
+}
+
+EMOJIS = ['👍', '❤️', '😂', '😮', '😢', '🔥']
+WORDS = (
+    'chapter ending character plot twist author theme reading favourite quote scene '
+    'mystery romance history journey letter family secret war garden river night'
+).split()
+
+
+# ==== SEEDING ====
+
+def _sentence(rng, words=12):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _chunks(rows, size):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _bulk(model, rows, batch_size):
+    for chunk in _chunks(rows, batch_size):
+        model.objects.bulk_create(chunk, batch_size=batch_size)
+
+
+def seed(volumes, rng, batch_size=5000, log=lambda message: None):
+    """Generate ``volumes`` (see ``SCALES``) of data. Returns the counts written."""
+    today = timezone.localdate()
+    password = make_password('benchmark')  # hashing once keeps 100k users fast
+
+    # bulk_create sets primary keys on SQLite 3.35+ and PostgreSQL (RETURNING)
+    with transaction.atomic():
+        first_user = (User.objects.order_by('-id').values_list('id', flat=True).first() or 0) + 1
+        users = [User(username=f'bench{first_user + n}', password=password) for n in range(volumes['users'])]
+        _bulk(User, users, batch_size)
+        user_ids = [user.pk for user in users]
+        log(f"users: {len(user_ids)}")
+
+        books = [
+            Book(title=f'{_sentence(rng, 3)[:-1]} {n}', author=f'Author {n % 97}', genre=rng.choice(
+                ['Fiction', 'Mystery', 'Romance', 'History', 'Science']
+            ), description=_sentence(rng, 30), total_pages=rng.randint(150, 600), total_chapters=12)
+            for n in range(volumes['books'])
+        ]
+        _bulk(Book, books, batch_size)
+        _bulk(Chapter, [
+            Chapter(book=book, chapter_number=number, title=f'Chapter {number}')
+            for book in books for number in range(1, book.total_chapters + 1)
+        ], batch_size)
+        log(f"books: {len(books)}")
+
+        groups = []
+        for n in range(volumes['groups']):
+            members = rng.sample(user_ids, k=min(len(user_ids), rng.randint(2, ReadingGroup.MAX_MEMBERS)))
+            start = today + datetime.timedelta(days=rng.randint(-60, 30))
+            groups.append((ReadingGroup(
+                name=f'Group {n}', book=rng.choice(books), creator_id=members[0], start_date=start,
+                end_date=start + datetime.timedelta(days=rng.randint(14, 90)), member_count=len(members),
+            ), members))
+        _bulk(ReadingGroup, [group for group, _ in groups], batch_size)
+        _bulk(GroupMembership, [
+            GroupMembership(user_id=user_id, group=group) for group, members in groups for user_id in members
+        ], batch_size)
+        log(f"groups: {len(groups)}")
+
+        posts = [
+            DiscussionPost(group=group, author_id=rng.choice(members), content=_sentence(rng, 25))
+            for group, members in (rng.choice(groups) for _ in range(volumes['posts']))
+        ]
+        members_of = {group.pk: members for group, members in groups}
+        comments = [
+            Comment(post=post, author_id=rng.choice(members_of[post.group_id]), content=_sentence(rng, 10))
+            for post in (rng.choice(posts) for _ in range(volumes['comments']))
+        ]
+        for comment in comments:
+            comment.post.comment_count += 1
+        _bulk(DiscussionPost, posts, batch_size)
+        _bulk(Comment, comments, batch_size)
+        reactions = {}
+        for _ in range(volumes['reactions']):
+            post = rng.choice(posts)
+            key = (post.pk, rng.choice(members_of[post.group_id]), rng.choice(EMOJIS))
+            reactions[key] = Reaction(post_id=key[0], user_id=key[1], emoji=key[2])
+        _bulk(Reaction, list(reactions.values()), batch_size)
+        _bulk(ReactionCount, [
+            ReactionCount(post_id=post_id, emoji=emoji, count=count)
+            for (post_id, emoji), count in Counter((key[0], key[2]) for key in reactions).items()
+        ], batch_size)
+        log(f"posts: {len(posts)}, comments: {volumes['comments']}, reactions: {len(reactions)}")
+
+        progress = {}
+        while len(progress) < min(volumes['progress'], sum(len(m) for _, m in groups)):
+            group, members = rng.choice(groups)
+            user_id = rng.choice(members)
+            progress[(user_id, group.pk)] = ReadingProgress(
+                user_id=user_id, book=group.book, group=group, reading_speed_minutes=2,
+                current_page=rng.randint(1, group.book.total_pages),
+            )
+        _bulk(ReadingProgress, list(progress.values()), batch_size)
+        log(f"progress: {len(progress)}")
+
+    search.rebuild_index()
+    return {
+        'users': len(user_ids), 'books': len(books), 'groups': len(groups), 'posts': len(posts),
+        'comments': volumes['comments'], 'reactions': len(reactions), 'progress': len(progress),
+    }
+
+
+# ==== TRAFFIC ====
+
+# (name, weight, method, path template, request body)
+TRAFFIC_MIX = [
+    ('book-list', 6, 'get', '/api/books/', None),
+    ('book-search', 4, 'get', '/api/books/?search={word}', None),
+    ('book-detail', 5, 'get', '/api/books/{book}/', None),
+    ('dashboard', 12, 'get', '/api/dashboard/', None),
+    ('group-detail', 8, 'get', '/api/groups/{group}/', None),
+    ('group-discussion', 18, 'get', '/api/groups/{group}/discussion/', None),
+    ('comment-list', 4, 'get', '/api/posts/{post}/comments/', None),
+    ('group-progress-stats', 8, 'get', '/api/groups/{group}/progress-stats/', None),
+    ('reading-progress', 8, 'get', '/api/groups/{group}/progress/', None),
+    ('notification-unread-count', 12, 'get', '/api/notifications/unread-count/', None),
+    ('notification-list', 4, 'get', '/api/notifications/', None),
+    ('progress-update', 6, 'put', '/api/groups/{group}/progress/', {'current_page': '{page}'}),
+    ('post-create', 3, 'post', '/api/groups/{group}/discussion/', {'content': '{sentence}'}),
+    ('comment-create', 3, 'post', '/api/posts/{post}/comments/', {'content': '{sentence}'}),
+    ('reaction-toggle', 3, 'post', '/api/posts/{post}/reactions/', {'emoji': '{emoji}'}),
+]
+
+_QUERIES_RE = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+
+class Reader:
+    """A signed-in member and the groups and posts they can reach."""
+
+    def __init__(self, user, group_ids, post_ids):
+        self.client = Client()
+        self.client.force_login(user)
+        self.group_ids = group_ids
+        self.post_ids = post_ids
+
+
+def readers(count, rng):
+    """Up to ``count`` members of at least one group, each with a logged-in client."""
+    memberships = defaultdict(list)
+    for user_id, group_id in GroupMembership.objects.values_list('user_id', 'group_id').order_by('id')[:count * 20]:
+        memberships[user_id].append(group_id)
+    chosen = rng.sample(sorted(memberships), k=min(count, len(memberships)))
+    posts = defaultdict(list)
+    group_ids = {group_id for user_id in chosen for group_id in memberships[user_id]}
+    for post_id, group_id in DiscussionPost.objects.filter(group_id__in=group_ids).values_list('id', 'group_id')[:50_000]:
+        posts[group_id].append(post_id)
+    users = User.objects.in_bulk(chosen)
+    return [
+        Reader(users[user_id], memberships[user_id], [p for g in memberships[user_id] for p in posts[g]])
+        for user_id in chosen
+    ]
+
+
+def _request(reader, entry, rng, book_ids):
+    name, _, method, path, body = entry
+    if not reader.post_ids and '{post}' in path:
+        return None
+    values = {
+        'group': rng.choice(reader.group_ids),
+        'post': rng.choice(reader.post_ids) if reader.post_ids else None,
+        'book': rng.choice(book_ids),
+        'word': rng.choice(WORDS),
+        'page': rng.randint(1, 150),
+        'sentence': _sentence(rng),
+        'emoji': rng.choice(EMOJIS),
+    }
+    url = path.format(**values)
+    data = {key: value.format(**values) for key, value in body.items()} if body else None
+    if method == 'get':
+        return lambda: reader.client.get(url)
+    return lambda: getattr(reader.client, method)(url, data, content_type='application/json')
+
+
+def replay(requests, rng, reader_count=25, warmup=50, mix=TRAFFIC_MIX):
+    """Send ``requests`` weighted requests; returns ``(samples, elapsed_seconds)``.
+
+    Each sample is ``(name, status, latency_seconds, queries, sql_seconds)``.
+    """
+    pool = readers(reader_count, rng)
+    if not pool:
+        raise ValueError("No group members to replay traffic as; seed some data first.")
+    book_ids = list(Book.objects.values_list('id', flat=True))
+    weights = [entry[1] for entry in mix]
+
+    samples = []
+    with override_settings(SERVER_TIMING=True):
+        began = None
+        for n in range(warmup + requests):
+            if n == warmup:
+                began = time.perf_counter()
+            entry = rng.choices(mix, weights)[0]
+            send = _request(rng.choice(pool), entry, rng, book_ids)
+            if send is None:
+                continue
+            started = time.perf_counter()
+            response = send()
+            latency = time.perf_counter() - started
+            if n < warmup:
+                continue
+            match = _QUERIES_RE.search(response.get('Server-Timing', ''))
+            sql_ms, queries = (float(match.group(1)), int(match.group(2))) if match else (0.0, 0)
+            samples.append((entry[0], response.status_code, latency, queries, sql_ms / 1000))
+        elapsed = time.perf_counter() - (began or time.perf_counter())
+    return samples, elapsed
+
+
+# ==== SERIALIZERS ====
+
+# name -> (page query, DRF serializer, row serializer); the DRF side gets the
+# select_related it needs so both make one query per page
+SERIALIZER_CASES = {
+    'book-list': (
+        lambda: Book.objects.order_by('title', 'id'),
+        BookSerializer, row_serializers.book_rows,
+    ),
+    'group-list': (
+        lambda: ReadingGroup.objects.select_related('book', 'creator').order_by('created_at', 'id'),
+        ReadingGroupSerializer, row_serializers.group_rows,
+    ),
+    'reading-progress-list': (
+        lambda: ReadingProgress.objects.select_related('book', 'current_chapter').order_by('created_at', 'id'),
+        ReadingProgressSerializer, row_serializers.progress_rows,
+    ),
+}
+
+
+def _best_time(function, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def time_serializers(rounds=20, page_size=50):
+    """Best-of-``rounds`` time to fetch and serialize one page, both ways.
+
+    Returns ``{name: {'rows', 'drf_ms', 'rows_ms', 'speedup'}}`` and raises
+    ``AssertionError`` if the two outputs differ.
+    """
+    results = {}
+    for name, (query, serializer_class, rows) in SERIALIZER_CASES.items():
+        def drf():
+            return serializer_class(list(query()[:page_size]), many=True).data
+
+        def fast():
+            return rows.many(rows.queryset(query()[:page_size]))
+
+        page = fast()
+        assert page == drf(), f"{name}: row serializer output differs from {serializer_class.__name__}"
+        drf_time, rows_time = _best_time(drf, rounds), _best_time(fast, rounds)
+        results[name] = {
+            'rows': len(page),
+            'drf_ms': round(drf_time * 1000, 3),
+            'rows_ms': round(rows_time * 1000, 3),
+            'speedup': round(drf_time / rows_time, 2) if rows_time else None,
+        }
+    return results
+
+
+def _discussion_page(page_size):
+    group = ReadingGroup.objects.filter(posts__isnull=False).order_by('-id').first()
+    if group is None:
+        return []
+    posts = views.discussion_posts(group, group.creator).order_by('-created_at', '-id')[:page_size]
+    return DiscussionPostSerializer(posts, many=True).data
+
+
+def time_rendering(rounds=20, page_size=50):
+    """Encode time and wire size of one page of the heaviest list responses.
+
+    Compares DRF's stdlib ``JSONRenderer`` with ``FastJSONRenderer`` (whose
+    backend is reported) and the body with its gzipped size, as sent by
+    ``CompressionMiddleware``. Raises ``AssertionError`` if the two renderers
+    disagree.
+    """
+    pages = {'group-discussion': _discussion_page(page_size)}
+    for name, (query, serializer_class, _) in SERIALIZER_CASES.items():
+        pages[name] = serializer_class(query()[:page_size], many=True).data
+
+    stdlib, fast = JSONRenderer(), FastJSONRenderer()
+    results = {}
+    for name, data in pages.items():
+        body = fast.render(data)
+        assert body == stdlib.render(data), f"{name}: {fast.backend} output differs from JSONRenderer"
+        stdlib_time = _best_time(lambda: stdlib.render(data), rounds)
+        fast_time = _best_time(lambda: fast.render(data), rounds)
+        compressed = len(compress_string(body, max_random_bytes=100))
+        gzipped = len(body) >= settings.GZIP_MIN_LENGTH
+        results[name] = {
+            'rows': len(data),
+            'backend': fast.backend,
+            'stdlib_ms': round(stdlib_time * 1000, 3),
+            'fast_ms': round(fast_time * 1000, 3),
+            'speedup': round(stdlib_time / fast_time, 2) if fast_time else None,
+            'bytes': len(body),
+            'wire_bytes': compressed if gzipped else len(body),
+        }
+    return results
+
+
+# ==== REPORTING ====
+
+def _percentile(ordered, percent):
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _stats(samples, elapsed=None):
+    latencies = sorted(sample[2] * 1000 for sample in samples)
+    queries = [sample[3] for sample in samples]
+    stats = {
+        'requests': len(samples),
+        'errors': sum(1 for sample in samples if sample[1] >= 500),
+        'p50_ms': round(_percentile(latencies, 50), 2),
+        'p95_ms': round(_percentile(latencies, 95), 2),
+        'p99_ms': round(_percentile(latencies, 99), 2),
+        'mean_queries': round(statistics.fmean(queries), 2) if queries else 0.0,
+        'max_queries': max(queries, default=0),
+        'mean_sql_ms': round(statistics.fmean(s[4] * 1000 for s in samples), 2) if samples else 0.0,
+    }
+    if elapsed:
+        stats['throughput_rps'] = round(len(samples) / elapsed, 1)
+    return stats
+
+
+def summarize(samples, elapsed, meta):
+    by_endpoint = defaultdict(list)
+    for sample in samples:
+        by_endpoint[sample[0]].append(sample)
+    return {
+        'meta': {
+            **meta,
+            'recorded_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+        },
+        'overall': _stats(samples, elapsed),
+        'endpoints': {name: _stats(group) for name, group in sorted(by_endpoint.items())},
+    }
+
+
+def compare(baseline, current, tolerance=0.10):
+    """Endpoints whose p95 latency or mean queries got worse by more than ``tolerance``.
+
+    Returns ``(rows, regressions)``: every endpoint's before/after figures and
+    the human-readable regressions among them.
+    """
+    rows, regressions = [], []
+    for name, after in sorted(current['endpoints'].items()):
+        before = baseline['endpoints'].get(name)
+        if before is None:
+            continue
+        rows.append((name, before, after))
+        if after['mean_queries'] > before['mean_queries'] * (1 + tolerance) + 0.01:
+            regressions.append(f"{name}: queries {before['mean_queries']} -> {after['mean_queries']}")
+        if after['p95_ms'] > before['p95_ms'] * (1 + tolerance) + 1:
+            regressions.append(f"{name}: p95 {before['p95_ms']} ms -> {after['p95_ms']} ms")
+    return rows, regressions
@@ -0,0 +1,64 @@
+# bookclub_app/caching.py
+"""Version stamps for cache invalidation and HTTP validators.
+
+Cached values embed the current version of whatever they were computed from
+in their key. Writers bump the version instead of hunting down keys, so stale
+entries simply stop being read and expire on their own. ETags embed versions
+too, which is what lets a 304 be answered without touching the database.
+
+Versions live in the default cache, so they are only as shared as it is:
+with the per-process ``LocMemCache`` a bump made by one worker is invisible
+to the others, which go on confirming stale ETags. Run a single process on
+locmem, or point the cache at a shared backend (see ``CACHES`` in settings).
+"""
+import time
+
+from django.core.cache import cache
+
+
+def _version_key(namespace, key):
+    return f'version:{namespace}:{key}'
+
+
+def _fresh_version():
+    # Seeded from the clock so a counter that was evicted and recreated never
+    # reuses a number that older cache entries were stored under.
+    return time.time_ns() // 1000
+
+
+def get_version(namespace, key=''):
+    """Current version for ``namespace``/``key`` (created on first read)."""
+    version_key = _version_key(namespace, key)
+    version = cache.get(version_key)
+    if version is None:
+        version = _fresh_version()
+        if not cache.add(version_key, version, timeout=None):
+            version = cache.get(version_key, version)
+    return version
+
+
+async def aget_version(namespace, key=''):
+    """``get_version`` for async views."""
+    version_key = _version_key(namespace, key)
+    version = await cache.aget(version_key)
+    if version is None:
+        version = _fresh_version()
+        if not await cache.aadd(version_key, version, timeout=None):
+            version = await cache.aget(version_key, version)
+    return version
+
+
+def bump_version(namespace, key=''):
+    """Invalidate everything cached under ``namespace``/``key``.
+
+    An atomic ``incr``, so racing bumps each produce a new version. A counter
+    that is missing (never read, or evicted) starts again from the clock.
+    """
+    version_key = _version_key(namespace, key)
+    while True:
+        try:
+            return cache.incr(version_key)
+        except ValueError:
+            version = _fresh_version()
+            if cache.add(version_key, version, timeout=None):
+                return version
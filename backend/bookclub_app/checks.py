@@ -0,0 +1,18 @@
+# bookclub_app/checks.py
+"""System checks for deployment settings the app depends on."""
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+@register(deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """Version stamps must be shared by every worker (see caching.py)."""
+    backend = settings.CACHES['default']['BACKEND']
+    if getattr(settings, 'DB_PROFILE', None) == 'production' and backend.endswith('.LocMemCache'):
+        return [Warning(
+            "The default cache is per-process LocMemCache.",
+            hint="Version stamps, ETags and sessions are only consistent with a single worker process; "
+                 "set BOOKCLUB_REDIS_URL to share a cache between workers.",
+            id='bookclub_app.W001',
+        )]
+    return []
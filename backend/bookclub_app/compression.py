@@ -0,0 +1,21 @@
+# bookclub_app/compression.py
+"""Gzip for API responses, negotiated on ``Accept-Encoding``.
+
+This is Django's ``GZipMiddleware`` (including its ``Vary: Accept-Encoding``,
+weak ETags and BREACH padding) with two changes:
+
+* bodies under ``GZIP_MIN_LENGTH`` bytes go out as they are; below about a
+  kilobyte the CPU spent compressing buys back almost nothing on the wire;
+* streaming responses are never compressed. The gzip stream buffers its
+  input, which would hold server-sent events back until enough of them
+  piled up to fill a block.
+"""
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+
+
+class CompressionMiddleware(GZipMiddleware):
+    def process_response(self, request, response):
+        if response.streaming or len(response.content) < settings.GZIP_MIN_LENGTH:
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,65 @@
+# bookclub_app/conditional.py
+"""HTTP conditional GET for function views.
+
+Django's ``@condition`` runs before the view, i.e. before DRF has
+authenticated the request or checked permissions. ``@conditional`` goes
+*under* ``@api_view``/``@permission_classes`` instead, so those checks still
+run, and then answers ``If-None-Match`` with a 304 before any query or
+serializer in the view body runs.
+
+The ETag is the only validator. Versions change within a second, so a
+``Last-Modified`` date, with its one-second resolution, could confirm a copy
+that was replaced in the same second.
+"""
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+
+
+def _not_modified(request, etag):
+    return get_conditional_response(request, etag=etag)
+
+
+def _add_validators(request, response, etag):
+    if request.method in ("GET", "HEAD") and (
+        response.status_code == 304 or 200 <= response.status_code < 300
+    ):
+        response.headers.setdefault("ETag", etag)
+        patch_cache_control(
+            response, private=True, max_age=settings.CATALOG_CACHE_MAX_AGE
+        )
+    return response
+
+
+def conditional(validators):
+    """Decorate a view with ETag handling.
+
+    ``validators(request, *args, **kwargs)`` receives the view's arguments and
+    returns the (unquoted) ETag. It should be cheap (version stamps, not
+    queries) since it runs on every request. Async views take an async
+    ``validators``.
+    """
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapped(request, *args, **kwargs):
+                etag = quote_etag(await validators(request, *args, **kwargs))
+                response = _not_modified(request, etag)
+                if response is None:
+                    response = await view(request, *args, **kwargs)
+                return _add_validators(request, response, etag)
+            return async_wrapped
+
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            etag = quote_etag(validators(request, *args, **kwargs))
+            response = _not_modified(request, etag)
+            if response is None:
+                response = view(request, *args, **kwargs)
+            return _add_validators(request, response, etag)
+        return wrapped
+    return decorator
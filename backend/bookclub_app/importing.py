@@ -0,0 +1,303 @@
+# bookclub_app/importing.py
+"""Streaming catalog import for ``manage.py import_catalog``.
+
+A catalog is a stream of book records: NDJSON (one object per line), CSV
+(one row per book, chapter titles separated by ``|``) or a JSON array. A
+record has the ``Book`` fields plus an optional ``chapters`` list of titles:
+
+    {"title": "The Alchemist", "author": "Paulo Coelho", "genre": "Fiction",
+     "description": "...", "total_pages": 208, "cover_image": "https://...",
+     "chapters": ["Part One - Chapter 1", "..."]}
+
+Books are matched on (title, author), which is unique. Records are read
+lazily and written a chunk at a time, each chunk in one transaction: new and
+changed books in one ``bulk_create`` upsert on that pair, new chapters with
+``bulk_create`` and retitled ones with ``bulk_update``. A record only needs
+the fields it changes when its book already exists, so a file of titles,
+authors and cover URLs updates covers. Chapters are matched on their number; chapters
+past the end of an imported list are kept, since schedules and posts may
+point at them.
+
+Bulk writes send no signals, so each chunk refreshes the search index and
+bumps the cache versions for the books it touched itself. The optional
+synthetic groups get their ``member_count`` written with them.
+"""
+import csv
+import datetime
+import json
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from . import search
+from .caching import bump_version
+from .models import Book, Chapter, GroupMembership, ReadingGroup, ReadingProgress
+
+FORMATS = ('ndjson', 'csv', 'json')
+BOOK_FIELDS = ('title', 'author', 'genre', 'description', 'total_pages', 'total_chapters', 'cover_image')
+INTEGER_FIELDS = ('total_pages', 'total_chapters')
+CSV_CHAPTER_SEPARATOR = '|'
+
+
+class CatalogError(ValueError):
+    """A record that cannot be imported; ``line`` is its position in the input."""
+
+    def __init__(self, message, line=None):
+        super().__init__(f'line {line}: {message}' if line is not None else message)
+        self.line = line
+
+
+def detect_format(path):
+    """Format implied by a file name (``.jsonl`` counts as NDJSON)."""
+    suffix = str(path).rsplit('.', 1)[-1].lower()
+    if suffix in ('ndjson', 'jsonl'):
+        return 'ndjson'
+    if suffix in ('csv', 'json'):
+        return suffix
+    return None
+
+
+# ==== READING ====
+
+def read_records(stream, fmt):
+    """Yield ``(line, record)`` pairs from ``stream``.
+
+    NDJSON and CSV are read a line at a time. A JSON array has to be parsed
+    whole, so use NDJSON for very large catalogs.
+    """
+    if fmt == 'ndjson':
+        for line, text in enumerate(stream, 1):
+            if text.strip():
+                yield line, _load_json(text, line)
+    elif fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            record = {key: value for key, value in row.items() if key and value not in (None, '')}
+            if 'chapters' in record:
+                record['chapters'] = [
+                    title.strip() for title in record['chapters'].split(CSV_CHAPTER_SEPARATOR) if title.strip()
+                ]
+            yield reader.line_num, record
+    elif fmt == 'json':
+        records = _load_json(stream.read(), None)
+        if not isinstance(records, list):
+            raise CatalogError("a JSON catalog must be an array of books")
+        yield from enumerate(records, 1)
+    else:
+        raise CatalogError(f"unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+
+
+def _load_json(text, line):
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise CatalogError(f"invalid JSON ({exc})", line) from None
+
+
+def _clean(record, line):
+    if not isinstance(record, dict):
+        raise CatalogError("a book must be an object", line)
+    values = {field: record[field] for field in BOOK_FIELDS if record.get(field) not in (None, '')}
+    for field in ('title', 'author'):
+        if field not in values:
+            raise CatalogError(f"'{field}' is required", line)
+        values[field] = str(values[field]).strip()
+    for field in INTEGER_FIELDS:
+        if field in values:
+            try:
+                values[field] = int(values[field])
+            except (TypeError, ValueError):
+                raise CatalogError(f"'{field}' must be a whole number", line) from None
+            if values[field] < 0:
+                raise CatalogError(f"'{field}' must not be negative", line)
+
+    chapters = record.get('chapters')
+    if chapters is not None:
+        if not isinstance(chapters, list) or not all(isinstance(title, str) for title in chapters):
+            raise CatalogError("'chapters' must be a list of titles", line)
+        if values.setdefault('total_chapters', len(chapters)) != len(chapters):
+            raise CatalogError(
+                f"'total_chapters' is {values['total_chapters']} but {len(chapters)} chapters are listed", line
+            )
+    return values, chapters
+
+
+# ==== WRITING ====
+
+class CatalogImport:
+    """Import book records chunk by chunk; ``stats`` counts what was written.
+
+    With ``update=False`` existing books (and their chapters) are left alone.
+    ``groups_per_book`` > 0 also creates that many reading groups for every
+    new book, filled with ``members_per_group`` synthetic readers drawn from
+    ``users`` (see ``synthetic_users``), with reading progress when
+    ``with_progress`` is set.
+    """
+
+    def __init__(self, *, update=True, chunk_size=1000, users=(), groups_per_book=0,
+                 members_per_group=6, with_progress=False, rng=None, log=lambda message: None):
+        self.update = update
+        self.chunk_size = chunk_size
+        self.users = list(users)
+        self.groups_per_book = groups_per_book if self.users else 0
+        self.members_per_group = max(1, min(members_per_group, ReadingGroup.MAX_MEMBERS, len(self.users) or 1))
+        self.with_progress = with_progress
+        self.rng = rng
+        self.log = log
+        self.stats = dict.fromkeys(
+            ('created', 'updated', 'unchanged', 'chapters_created', 'chapters_updated',
+             'groups', 'memberships', 'progress'),
+            0,
+        )
+
+    def run(self, records):
+        records = iter(records)
+        while chunk := list(islice(records, self.chunk_size)):
+            self.import_chunk(chunk)
+            self.log(f"{self.stats['created']} created, {self.stats['updated']} updated")
+        return self.stats
+
+    def import_chunk(self, chunk):
+        # Later records for the same book win
+        parsed = {}
+        for line, record in chunk:
+            values, chapters = _clean(record, line)
+            parsed[(values['title'], values['author'])] = (line, values, chapters)
+
+        with transaction.atomic():
+            # A range read of the (title, author) unique index per chunk
+            existing = {
+                (book.title, book.author): book
+                for book in Book.objects.filter(title__in={title for title, _ in parsed})
+            }
+            created, updated, chapter_lists = [], [], {}
+            for key, (line, values, chapters) in parsed.items():
+                book = existing.get(key)
+                if book is None:
+                    if 'total_pages' not in values:
+                        raise CatalogError(
+                            f"no book {key[0]!r} by {key[1]} to update, and 'total_pages' is missing", line
+                        )
+                    book = Book(**{'genre': '', 'description': '', 'total_chapters': 0, **values})
+                    created.append(book)
+                elif not self.update:
+                    self.stats['unchanged'] += 1
+                    continue
+                elif any(getattr(book, field) != value for field, value in values.items()):
+                    # Without its pk, so it goes into the same INSERT as the
+                    # new books; the upsert hands the pk back
+                    book = Book(**{**{field: getattr(book, field) for field in BOOK_FIELDS}, **values})
+                    updated.append(book)
+                else:
+                    self.stats['unchanged'] += 1
+                if chapters is not None:
+                    chapter_lists[key] = (book, chapters)
+
+            # One upsert for both: a book another import created since the
+            # lookup above is updated instead of failing the chunk
+            Book.objects.bulk_create(
+                created + updated, batch_size=self.chunk_size,
+                update_conflicts=True, unique_fields=BOOK_FIELDS[:2], update_fields=BOOK_FIELDS[2:],
+            )
+            changed_chapters = self._write_chapters(chapter_lists.values())
+            self.stats['created'] += len(created)
+            self.stats['updated'] += len(updated)
+
+            search.index_books(created + updated)
+            if self.groups_per_book:
+                self._write_groups(created)
+
+        self._bump_versions(created, updated, changed_chapters)
+
+    def _write_chapters(self, chapter_lists):
+        """Create or retitle chapters; returns the ids of books whose chapters changed."""
+        wanted = {
+            (book.pk, number): title
+            for book, chapters in chapter_lists
+            for number, title in enumerate(chapters, 1)
+        }
+        if not wanted:
+            return set()
+        current = {
+            (chapter.book_id, chapter.chapter_number): chapter
+            for chapter in Chapter.objects.filter(book_id__in={book_id for book_id, _ in wanted})
+        }
+        new, retitled = [], []
+        for (book_id, number), title in wanted.items():
+            chapter = current.get((book_id, number))
+            if chapter is None:
+                new.append(Chapter(book_id=book_id, chapter_number=number, title=title))
+            elif chapter.title != title:
+                chapter.title = title
+                retitled.append(chapter)
+        Chapter.objects.bulk_create(new, batch_size=self.chunk_size)
+        Chapter.objects.bulk_update(retitled, ['title'], batch_size=self.chunk_size)
+        self.stats['chapters_created'] += len(new)
+        self.stats['chapters_updated'] += len(retitled)
+        return {chapter.book_id for chapter in new + retitled}
+
+    def _write_groups(self, books):
+        today = timezone.localdate()
+        groups = []
+        for book in books:
+            for n in range(1, self.groups_per_book + 1):
+                members = self.rng.sample(self.users, k=self.members_per_group)
+                start = today + datetime.timedelta(days=self.rng.randint(-30, 14))
+                groups.append((ReadingGroup(
+                    name=f'{book.title} circle {n}', book=book, creator_id=members[0], start_date=start,
+                    end_date=start + datetime.timedelta(days=max(14, book.total_pages // 10)),
+                    member_count=len(members),
+                ), members))
+        ReadingGroup.objects.bulk_create([group for group, _ in groups], batch_size=self.chunk_size)
+        memberships = [
+            GroupMembership(user_id=user_id, group=group) for group, members in groups for user_id in members
+        ]
+        GroupMembership.objects.bulk_create(memberships, batch_size=self.chunk_size)
+        self.stats['groups'] += len(groups)
+        self.stats['memberships'] += len(memberships)
+
+        if self.with_progress:
+            progress = [
+                ReadingProgress(
+                    user_id=user_id, book=group.book, group=group,
+                    current_page=self.rng.randint(1, max(1, group.book.total_pages)),
+                    reading_speed_minutes=self.rng.randint(1, 4),
+                )
+                for group, members in groups for user_id in members
+            ]
+            ReadingProgress.objects.bulk_create(progress, batch_size=self.chunk_size, ignore_conflicts=True)
+            self.stats['progress'] += len(progress)
+
+    def _bump_versions(self, created, updated, changed_chapters):
+        if created or updated:
+            bump_version("catalog")
+        # New books have no cached versions yet (ids are never reused)
+        for book_id in ({book.pk for book in updated} | changed_chapters) - {book.pk for book in created}:
+            bump_version("book", book_id)
+
+
+def synthetic_users(count, prefix='reader', password=None, batch_size=1000):
+    """Ids of users ``{prefix}1`` .. ``{prefix}{count}``, creating the missing ones.
+
+    Without a ``password`` the accounts cannot sign in.
+    """
+    usernames = [f'{prefix}{n}' for n in range(1, count + 1)]
+    hashed = make_password(password)  # hashed once for every account
+    with transaction.atomic():
+        existing = set()
+        for start in range(0, count, batch_size):
+            existing.update(
+                User.objects.filter(username__in=usernames[start:start + batch_size])
+                .values_list('username', flat=True)
+            )
+        User.objects.bulk_create(
+            [User(username=username, password=hashed) for username in usernames if username not in existing],
+            batch_size=batch_size, ignore_conflicts=True,
+        )
+        ids = []
+        for start in range(0, count, batch_size):
+            ids += User.objects.filter(username__in=usernames[start:start + batch_size]).values_list('id', flat=True)
+    return ids
@@ -0,0 +1,216 @@
+# bookclub_app/instrumentation.py
+"""Per-request query and timing instrumentation.
+
+``RequestMetricsMiddleware`` records, for every request, the number of SQL
+queries, the time spent in SQL, the time spent serializing (code wrapped in
+``timed("serialize")``) and the total latency. It reports them in a
+``Server-Timing`` header (visible in the browser's network panel) and folds
+them into per-view histograms that staff can read at ``/api/metrics/``.
+
+Queries are counted through a database execute wrapper that every new
+connection gets, so queries run from ``sync_to_async`` threads by the async
+views are attributed to their request too (the metrics travel in a context
+variable). When one SQL statement runs ``QUERY_DUPLICATE_THRESHOLD`` times
+in a request (an N+1 pattern) it is logged with the line of app code that
+issued it.
+"""
+import bisect
+import logging
+import threading
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar('request_metrics', default=None)
+
+_PROJECT_ROOT = str(Path(settings.BASE_DIR).resolve())
+_SKIP_FILES = (__file__, '/site-packages/', '/django/', '/rest_framework/', '/asgiref/')
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.sql_time = 0.0
+        self.timings = Counter()
+        self.statements = Counter()
+        self.view_name = None
+
+    def record_query(self, sql, duration):
+        self.queries += 1
+        self.sql_time += duration
+        self.statements[sql] += 1
+        if self.statements[sql] == getattr(settings, 'QUERY_DUPLICATE_THRESHOLD', 3):
+            logger.warning(
+                "Repeated query (%d times so far) in %s at %s: %s",
+                self.statements[sql], self.view_name or 'request', _app_location(), sql,
+            )
+
+    @property
+    def total_time(self):
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total):
+        parts = [f'db;dur={self.sql_time * 1000:.1f};desc="{self.queries} queries"']
+        parts += [f'{name};dur={duration * 1000:.1f}' for name, duration in self.timings.items()]
+        parts.append(f'total;dur={total * 1000:.1f}')
+        return ', '.join(parts)
+
+
+def _app_location():
+    """``file:line in function`` of the innermost project frame outside the frameworks."""
+    for frame in reversed(traceback.extract_stack()):
+        if frame.filename.startswith(_PROJECT_ROOT) and not any(
+            skip in frame.filename for skip in _SKIP_FILES
+        ):
+            return f'{frame.filename[len(_PROJECT_ROOT) + 1:]}:{frame.lineno} in {frame.name}'
+    return 'unknown location'
+
+
+@contextmanager
+def timed(name):
+    """Add the time spent in the block to the current request's ``name`` timing."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] += time.perf_counter() - started
+
+
+def record_queries(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.record_query(sql, time.perf_counter() - started)
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    if record_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_queries)
+
+
+# ==== HISTOGRAMS ====
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    def as_dict(self):
+        labels = [f'<={bound}' for bound in self.bounds] + [f'>{self.bounds[-1]}']
+        return {'buckets': dict(zip(labels, self.counts)), 'sum': round(self.total, 3)}
+
+
+class MetricsRegistry:
+    """In-process per-view histograms (each worker process keeps its own)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def observe(self, view_name, metrics, total):
+        with self._lock:
+            view = self._views.get(view_name)
+            if view is None:
+                view = self._views[view_name] = {
+                    'requests': 0,
+                    'latency_ms': Histogram(LATENCY_BUCKETS_MS),
+                    'sql_ms': Histogram(LATENCY_BUCKETS_MS),
+                    'serialize_ms': Histogram(LATENCY_BUCKETS_MS),
+                    'queries': Histogram(QUERY_BUCKETS),
+                }
+            view['requests'] += 1
+            view['latency_ms'].observe(total * 1000)
+            view['sql_ms'].observe(metrics.sql_time * 1000)
+            view['serialize_ms'].observe(metrics.timings['serialize'] * 1000)
+            view['queries'].observe(metrics.queries)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {key: value if key == 'requests' else value.as_dict() for key, value in view.items()}
+                for name, view in sorted(self._views.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+registry = MetricsRegistry()
+
+
+# ==== MIDDLEWARE ====
+
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics, token = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics, token = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics)
+
+    def _start(self):
+        metrics = RequestMetrics()
+        return metrics, _current.set(metrics)
+
+    def _finish(self, request, response, metrics):
+        total = metrics.total_time
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else '<unresolved>'
+        registry.observe(view_name, metrics, total)
+        if getattr(settings, 'SERVER_TIMING', False):
+            response['Server-Timing'] = metrics.server_timing(total)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = _current.get()
+        if metrics is not None and request.resolver_match:
+            metrics.view_name = request.resolver_match.view_name
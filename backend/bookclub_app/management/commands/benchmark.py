@@ -0,0 +1,133 @@
+import json
+import random
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+
+from bookclub_app import benchmarking
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a scratch database with synthetic data and replay a weighted mix of API "
+        "requests in process. Reports p50/p95/p99 latency, queries per request and "
+        "throughput per endpoint, optionally saves them as JSON and compares them "
+        "with an earlier run. Never touches the project database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=sorted(benchmarking.SCALES), default='small',
+                            help="Data volume preset (default: small; 'large' is 100k users, 1M posts/comments/reactions).")
+        for name in benchmarking.SCALES['small']:
+            parser.add_argument(f'--{name}', type=int, help=f"Override the preset's number of {name}.")
+        parser.add_argument('--requests', type=int, default=2000, help="Requests to replay (default: 2000).")
+        parser.add_argument('--warmup', type=int, default=100, help="Unrecorded requests sent first (default: 100).")
+        parser.add_argument('--readers', type=int, default=25, help="Distinct signed-in members (default: 25).")
+        parser.add_argument('--seed', type=int, default=1, help="Random seed for data and traffic (default: 1).")
+        parser.add_argument('--database-file',
+                            help="Keep the seeded SQLite database in this file and reuse it on later runs "
+                                 "(default: a throwaway in-memory database).")
+        parser.add_argument('--serializers', action='store_true',
+                            help="Also time the list endpoints' row serializers against the DRF serializers.")
+        parser.add_argument('--rendering', action='store_true',
+                            help="Also compare JSON encode time and gzipped size of the heaviest list pages.")
+        parser.add_argument('--output', help="Write the results as JSON to this path.")
+        parser.add_argument('--compare', help="Earlier JSON results to compare against.")
+        parser.add_argument('--tolerance', type=float, default=0.10,
+                            help="Allowed relative slowdown before --compare reports a regression (default: 0.10).")
+
+    def handle(self, *args, **options):
+        volumes = dict(benchmarking.SCALES[options['scale']])
+        volumes.update({name: options[name] for name in volumes if options[name] is not None})
+        baseline = self.load(options['compare']) if options['compare'] else None
+        rng = random.Random(options['seed'])
+
+        if options['database_file']:
+            connections['default'].settings_dict['TEST']['NAME'] = str(Path(options['database_file']).resolve())
+        setup_test_environment(debug=False)
+        old_config = setup_databases(
+            verbosity=0, interactive=False, keepdb=bool(options['database_file']), aliases={'default'},
+        )
+        try:
+            from django.contrib.auth.models import User
+            if User.objects.filter(username__startswith='bench').exists():
+                self.stdout.write("Reusing the seeded database.")
+                counts = None
+            else:
+                self.stdout.write(f"Seeding {options['scale']} data set...")
+                counts = benchmarking.seed(volumes, rng, log=lambda line: self.stdout.write(f"  {line}"))
+
+            self.stdout.write(f"Replaying {options['requests']} requests...")
+            samples, elapsed = benchmarking.replay(
+                options['requests'], rng, reader_count=options['readers'], warmup=options['warmup'],
+            )
+            serializer_timings = benchmarking.time_serializers() if options['serializers'] else None
+            rendering_timings = benchmarking.time_rendering() if options['rendering'] else None
+        finally:
+            teardown_databases(old_config, verbosity=0, keepdb=bool(options['database_file']))
+            teardown_test_environment()
+
+        results = benchmarking.summarize(samples, elapsed, {
+            'scale': options['scale'], 'volumes': counts or volumes, 'requests': options['requests'],
+            'seed': options['seed'],
+        })
+        if serializer_timings:
+            results['serializers'] = serializer_timings
+        if rendering_timings:
+            results['rendering'] = rendering_timings
+        self.report(results)
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2, ensure_ascii=False) + '\n')
+            self.stdout.write(f"Results written to {options['output']}")
+        if baseline is not None:
+            self.compare(baseline, results, options['tolerance'])
+
+    def load(self, path):
+        try:
+            return json.loads(Path(path).read_text())
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read benchmark results from {path}: {exc}")
+
+    def report(self, results):
+        self.stdout.write(f"{'endpoint':<28}{'n':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}")
+        rows = list(results['endpoints'].items()) + [('overall', results['overall'])]
+        for name, stats in rows:
+            self.stdout.write(
+                f"{name:<28}{stats['requests']:>6}{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}"
+                f"{stats['p99_ms']:>9.1f}{stats['mean_queries']:>9.1f}"
+            )
+        overall = results['overall']
+        self.stdout.write(f"Throughput: {overall['throughput_rps']} requests/s, {overall['errors']} server errors")
+        if 'serializers' in results:
+            self.stdout.write(f"{'serializer (one page)':<28}{'rows':>6}{'DRF ms':>9}{'rows ms':>9}{'speedup':>9}")
+            for name, timing in results['serializers'].items():
+                self.stdout.write(
+                    f"{name:<28}{timing['rows']:>6}{timing['drf_ms']:>9.2f}{timing['rows_ms']:>9.2f}"
+                    f"{timing['speedup']:>8.1f}x"
+                )
+        if 'rendering' in results:
+            backend = next(iter(results['rendering'].values()))['backend']
+            self.stdout.write(
+                f"{'rendering (one page)':<28}{'rows':>6}{'json ms':>9}{backend + ' ms':>11}{'speedup':>9}"
+                f"{'bytes':>10}{'wire':>9}{'saved':>7}"
+            )
+            for name, timing in results['rendering'].items():
+                saved = 1 - timing['wire_bytes'] / timing['bytes'] if timing['bytes'] else 0
+                self.stdout.write(
+                    f"{name:<28}{timing['rows']:>6}{timing['stdlib_ms']:>9.2f}{timing['fast_ms']:>11.2f}"
+                    f"{timing['speedup']:>8.1f}x{timing['bytes']:>10}{timing['wire_bytes']:>9}{saved:>7.0%}"
+                )
+
+    def compare(self, baseline, results, tolerance):
+        rows, regressions = benchmarking.compare(baseline, results, tolerance)
+        for name, before, after in rows:
+            self.stdout.write(
+                f"{name:<28} p95 {before['p95_ms']:>8.1f} -> {after['p95_ms']:<8.1f}"
+                f" queries {before['mean_queries']:>6.1f} -> {after['mean_queries']:.1f}"
+            )
+        if regressions:
+            raise CommandError("Regressions against the baseline:\n  " + "\n  ".join(regressions))
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
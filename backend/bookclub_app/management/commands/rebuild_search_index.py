@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from bookclub_app import search
+
+
+class Command(BaseCommand):
+    help = "Build the full-text book search index (SQLite FTS5)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--incremental', action='store_true',
+            help="Only index books missing from the index and drop stale entries.",
+        )
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        if not search.fts_available(options['database']):
+            self.stdout.write(self.style.WARNING(
+                "FTS5 is not available on this database; search uses the icontains fallback."
+            ))
+            return
+
+        indexed = search.rebuild_index(
+            using=options['database'],
+            chunk_size=options['chunk_size'],
+            incremental=options['incremental'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} book(s)."))
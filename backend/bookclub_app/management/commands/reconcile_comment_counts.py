@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from bookclub_app.models import Comment, DiscussionPost
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute DiscussionPost.comment_count from Comment rows and fix "
+        "posts whose stored count has drifted (e.g. after bulk loads or raw SQL)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Report drifted posts without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        actual = (
+            Comment.objects.filter(post=OuterRef('pk'))
+            .order_by().values('post').annotate(n=Count('pk')).values('n')
+        )
+        with transaction.atomic():
+            drifted = (
+                DiscussionPost.objects.annotate(actual_count=Coalesce(Subquery(actual), 0))
+                .exclude(comment_count=F('actual_count'))
+            )
+            rows = list(drifted.values_list('id', 'comment_count', 'actual_count'))
+            for post_id, stored, counted in rows:
+                self.stdout.write(f"post {post_id}: stored {stored}, actual {counted}")
+
+            if rows and not options['dry_run']:
+                DiscussionPost.objects.filter(id__in=[row[0] for row in rows]).update(
+                    comment_count=Coalesce(Subquery(actual), 0)
+                )
+
+        verb = "Found" if options['dry_run'] else "Repaired"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {len(rows)} post(s) with a drifted comment count."))
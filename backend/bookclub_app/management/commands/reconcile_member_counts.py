@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from bookclub_app.models import GroupMembership, ReadingGroup
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute ReadingGroup.member_count from GroupMembership rows and fix "
+        "groups whose stored count has drifted (e.g. after admin or script edits)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Report drifted groups without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        actual = (
+            GroupMembership.objects.filter(group=OuterRef('pk'))
+            .order_by().values('group').annotate(n=Count('pk')).values('n')
+        )
+        with transaction.atomic():
+            drifted = (
+                ReadingGroup.objects.annotate(actual_count=Coalesce(Subquery(actual), 0))
+                .exclude(member_count=F('actual_count'))
+            )
+            rows = list(drifted.values_list('id', 'name', 'member_count', 'actual_count'))
+            for group_id, name, stored, counted in rows:
+                self.stdout.write(f"{name} (id={group_id}): stored {stored}, actual {counted}")
+
+            if rows and not options['dry_run']:
+                ReadingGroup.objects.filter(id__in=[row[0] for row in rows]).update(
+                    member_count=Coalesce(Subquery(actual), 0)
+                )
+
+        verb = "Found" if options['dry_run'] else "Repaired"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {len(rows)} group(s) with a drifted member count."))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from bookclub_app.models import Reaction, ReactionCount
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute ReactionCount rows from Reaction rows and fix counters that have "
+        "drifted (e.g. after bulk loads or raw SQL that bypassed the signals)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Report drifted counters without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            actual = {
+                (post_id, emoji): n
+                for post_id, emoji, n in Reaction.objects.order_by()
+                .values_list('post_id', 'emoji').annotate(n=Count('pk')).iterator()
+            }
+            stale, missing = [], []
+            for counter in ReactionCount.objects.iterator():
+                counted = actual.pop((counter.post_id, counter.emoji), 0)
+                if counter.count != counted:
+                    self.stdout.write(f"post {counter.post_id} {counter.emoji}: stored {counter.count}, actual {counted}")
+                    counter.count = counted
+                    stale.append(counter)
+            for (post_id, emoji), counted in actual.items():
+                self.stdout.write(f"post {post_id} {emoji}: stored none, actual {counted}")
+                missing.append(ReactionCount(post_id=post_id, emoji=emoji, count=counted))
+
+            if not options['dry_run']:
+                ReactionCount.objects.bulk_update(stale, ['count'], batch_size=1000)
+                ReactionCount.objects.bulk_create(missing, batch_size=1000)
+
+        verb = "Found" if options['dry_run'] else "Repaired"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {len(stale) + len(missing)} drifted reaction counter(s)."
+        ))
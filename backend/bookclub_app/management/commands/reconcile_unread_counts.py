@@ -0,0 +1,47 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from bookclub_app.models import Notification, NotificationInbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute NotificationInbox.unread_count from unread Notification rows and "
+        "fix inboxes whose stored count has drifted (e.g. after a group was deleted)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Report drifted inboxes without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        actual = (
+            Notification.objects.filter(recipient=OuterRef('pk'), read_at__isnull=True)
+            .order_by().values('recipient').annotate(n=Count('pk')).values('n')
+        )
+        stored = NotificationInbox.objects.filter(user=OuterRef('pk')).values('unread_count')
+        with transaction.atomic():
+            drifted = (
+                User.objects.annotate(
+                    stored_count=Coalesce(Subquery(stored), 0),
+                    actual_count=Coalesce(Subquery(actual), 0),
+                )
+                .exclude(stored_count=F('actual_count'))
+            )
+            rows = list(drifted.values_list('id', 'username', 'stored_count', 'actual_count'))
+            for user_id, username, stored_count, actual_count in rows:
+                self.stdout.write(f"{username} (id={user_id}): stored {stored_count}, actual {actual_count}")
+
+            if rows and not options['dry_run']:
+                for user_id, _, _, actual_count in rows:
+                    NotificationInbox.objects.update_or_create(
+                        user_id=user_id, defaults={'unread_count': actual_count}
+                    )
+
+        verb = "Found" if options['dry_run'] else "Repaired"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {len(rows)} inbox(es) with a drifted unread count."))
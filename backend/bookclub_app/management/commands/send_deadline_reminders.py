@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.utils.dateparse import parse_date
+
+from bookclub_app.notifications import queue_deadline_reminders
+
+
+class Command(BaseCommand):
+    help = (
+        "Notify members about unfinished chapters due within the next few days. "
+        "Safe to re-run: each schedule is reminded once per target date. Run daily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=None,
+            help="Look-ahead window in days (default: settings.NOTIFICATION_DEADLINE_DAYS).",
+        )
+        parser.add_argument(
+            '--today', type=parse_date, default=None,
+            help="Pretend today is this YYYY-MM-DD date.",
+        )
+
+    def handle(self, *args, **options):
+        created = queue_deadline_reminders(today=options['today'], days_ahead=options['days'])
+        self.stdout.write(self.style.SUCCESS(f"Sent {len(created)} deadline reminder(s)."))
@@ -0,0 +1,191 @@
+import random
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections, transaction
+from django.utils import timezone
+
+from bookclub.db import sqlite_database
+from bookclub_app.benchmarking import _percentile
+from bookclub_app.models import (
+    Book, Chapter, DiscussionPost, GroupMembership, ReadingGroup, ReadingProgress,
+)
+
+SCHEMA = [User, Book, Chapter, ReadingGroup, GroupMembership, DiscussionPost, ReadingProgress]
+
+
+class Command(BaseCommand):
+    help = (
+        "Hammer a scratch SQLite database with concurrent page turns, new posts and "
+        "discussion reads, once with Django's default SQLite settings and once with "
+        "the production profile (bookclub/db.py), and compare throughput and "
+        "'database is locked' errors. Never touches the project database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help="Concurrent threads (default: 8).")
+        parser.add_argument('--operations', type=int, default=300, help="Operations per worker (default: 300).")
+        parser.add_argument(
+            '--write-ratio', type=float, default=0.3,
+            help="Share of operations that write (default: 0.3).",
+        )
+        parser.add_argument(
+            '--profile', choices=['development', 'production'], action='append',
+            help="Profile to run (repeatable; default: both).",
+        )
+
+    def handle(self, *args, **options):
+        if options['workers'] < 1 or options['operations'] < 1:
+            raise CommandError("--workers and --operations must be positive.")
+        if not 0 <= options['write_ratio'] <= 1:
+            raise CommandError("--write-ratio must be between 0 and 1.")
+
+        results = {}
+        for profile in options['profile'] or ['development', 'production']:
+            results[profile] = self.run_profile(profile, options)
+            self.report(profile, results[profile])
+
+        if {'development', 'production'} <= results.keys():
+            before, after = results['development'], results['production']
+            self.stdout.write(self.style.SUCCESS(
+                f"production: {after['throughput'] / max(before['throughput'], 1e-9):.1f}x the "
+                f"throughput, {before['errors']} -> {after['errors']} lock errors"
+            ))
+
+    # ---- setup ----
+
+    def register(self, alias, settings_dict):
+        configured = connections.configure_settings({'default': connections.settings['default'], alias: settings_dict})
+        connections.settings[alias] = configured[alias]
+
+    def unregister(self, alias):
+        connections[alias].close()
+        del connections.settings[alias]
+
+    def run_profile(self, profile, options):
+        directory = Path(tempfile.mkdtemp(prefix='bookclub-stress-'))
+        path = directory / 'stress.sqlite3'
+        write_alias, read_alias = f'stress_{profile}', f'stress_{profile}_read'
+        if profile == 'production':
+            self.register(write_alias, sqlite_database(path))
+            self.register(read_alias, sqlite_database(path, read_only=True))
+        else:
+            self.register(write_alias, {'ENGINE': 'django.db.backends.sqlite3', 'NAME': path})
+            read_alias = write_alias
+        try:
+            fixtures = self.create_fixtures(write_alias, options['workers'])
+            return self.run_workers(write_alias, read_alias, fixtures, options)
+        finally:
+            for alias in {write_alias, read_alias}:
+                self.unregister(alias)
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def create_fixtures(self, alias, workers):
+        with connections[alias].schema_editor() as editor:
+            for model in SCHEMA:
+                editor.create_model(model)
+
+        # bulk_create: no signals, so nothing is written to the project database
+        users = User.objects.using(alias).bulk_create(
+            [User(username=f'reader{n}', password='!') for n in range(workers)]
+        )
+        book = Book.objects.using(alias).bulk_create([Book(
+            title='Stress', author='Test', genre='Fiction', description='', total_pages=500, total_chapters=1,
+        )])[0]
+        group = ReadingGroup.objects.using(alias).bulk_create([ReadingGroup(
+            name='Stress', book=book, creator=users[0], start_date=timezone.localdate(),
+            end_date=timezone.localdate(), member_count=len(users),
+        )])[0]
+        GroupMembership.objects.using(alias).bulk_create([GroupMembership(user=u, group=group) for u in users])
+        progress = ReadingProgress.objects.using(alias).bulk_create(
+            [ReadingProgress(user=u, book=book, group=group) for u in users]
+        )
+        DiscussionPost.objects.using(alias).bulk_create(
+            [DiscussionPost(group=group, author=users[n % len(users)], content=f'Post {n}') for n in range(200)]
+        )
+        return {'group': group, 'users': users, 'progress': progress}
+
+    # ---- workload ----
+
+    def page_turn(self, alias, progress, page):
+        # Read-then-write, like the progress PUT: with deferred transactions
+        # two of these can deadlock on the lock upgrade and one fails at once.
+        with transaction.atomic(using=alias):
+            current = ReadingProgress.objects.using(alias).get(pk=progress.pk)
+            ReadingProgress.objects.using(alias).filter(pk=current.pk).update(
+                current_page=page, last_read_at=timezone.now()
+            )
+
+    def new_post(self, alias, group, user):
+        with transaction.atomic(using=alias):
+            DiscussionPost.objects.using(alias).bulk_create(
+                [DiscussionPost(group=group, author=user, content='Stress post')]
+            )
+
+    def read_discussion(self, alias, group):
+        list(
+            DiscussionPost.objects.using(alias).filter(group=group)
+            .select_related('author').order_by('-created_at', '-id')[:50]
+        )
+
+    def run_workers(self, write_alias, read_alias, fixtures, options):
+        latencies, errors = [], []
+        lock = threading.Lock()
+        start = threading.Barrier(options['workers'] + 1)
+
+        def worker(n):
+            rng = random.Random(n)
+            progress, user = fixtures['progress'][n], fixtures['users'][n]
+            local_latencies, local_errors = [], 0
+            start.wait()
+            try:
+                for i in range(options['operations']):
+                    began = time.perf_counter()
+                    try:
+                        if rng.random() >= options['write_ratio']:
+                            self.read_discussion(read_alias, fixtures['group'])
+                        elif rng.random() < 0.7:
+                            self.page_turn(write_alias, progress, i + 2)
+                        else:
+                            self.new_post(write_alias, fixtures['group'], user)
+                    except OperationalError:
+                        local_errors += 1
+                        continue
+                    local_latencies.append(time.perf_counter() - began)
+            finally:
+                for alias in {write_alias, read_alias}:
+                    connections[alias].close()
+                with lock:
+                    latencies.extend(local_latencies)
+                    errors.append(local_errors)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(options['workers'])]
+        for thread in threads:
+            thread.start()
+        start.wait()
+        began = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - began
+
+        # Percentiles are taken as in the benchmark command
+        latencies_ms = sorted(latency * 1000 for latency in latencies)
+        return {
+            'completed': len(latencies),
+            'errors': sum(errors),
+            'elapsed': elapsed,
+            'throughput': len(latencies) / elapsed if elapsed else 0.0,
+            'p50_ms': _percentile(latencies_ms, 50),
+            'p95_ms': _percentile(latencies_ms, 95),
+        }
+
+    def report(self, profile, result):
+        self.stdout.write(
+            f"{profile:<12} {result['completed']:>6} ok  {result['errors']:>5} locked  "
+            f"{result['throughput']:>8.0f} ops/s  p50 {result['p50_ms']:.1f} ms  p95 {result['p95_ms']:.1f} ms"
+        )
@@ -0,0 +1,62 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+FTS_TABLE = 'bookclub_app_book_fts'
+
+
+def _fts5_supported(connection):
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def create_fts_table(apps, schema_editor):
+    connection = schema_editor.connection
+    if not _fts5_supported(connection):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            "title, author, genre, description, tokenize='unicode61 remove_diacritics 2')"
+        )
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, author, genre, description) "
+            "SELECT id, title, author, genre, description FROM bookclub_app_book"
+        )
+
+
+def drop_fts_table(apps, schema_editor):
+    connection = schema_editor.connection
+    if not _fts5_supported(connection):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookclub_app', '0005_reaction'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookSearchIndex',
+            fields=[
+                ('book', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='bookclub_app.book')),
+                ('title', models.TextField()),
+                ('author', models.TextField()),
+                ('genre', models.TextField()),
+                ('description', models.TextField()),
+                ('document', models.TextField(db_column='bookclub_app_book_fts')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'bookclub_app_book_fts',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
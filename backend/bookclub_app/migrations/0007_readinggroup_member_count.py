@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_member_counts(apps, schema_editor):
+    ReadingGroup = apps.get_model('bookclub_app', 'ReadingGroup')
+    GroupMembership = apps.get_model('bookclub_app', 'GroupMembership')
+    counts = (
+        GroupMembership.objects.filter(group=OuterRef('pk'))
+        .order_by().values('group').annotate(n=Count('pk')).values('n')
+    )
+    ReadingGroup.objects.update(member_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookclub_app', '0006_booksearchindex'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='readinggroup',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_member_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_reaction_counts(apps, schema_editor):
+    Reaction = apps.get_model('bookclub_app', 'Reaction')
+    ReactionCount = apps.get_model('bookclub_app', 'ReactionCount')
+    totals = Reaction.objects.order_by().values('post_id', 'emoji').annotate(n=Count('pk'))
+    ReactionCount.objects.bulk_create(
+        (ReactionCount(post_id=row['post_id'], emoji=row['emoji'], count=row['n']) for row in totals.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookclub_app', '0008_notifications'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReactionCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('emoji', models.CharField(max_length=10)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reaction_counts', to='bookclub_app.discussionpost')),
+            ],
+            options={
+                'unique_together': {('post', 'emoji')},
+            },
+        ),
+        migrations.RunPython(backfill_reaction_counts, migrations.RunPython.noop),
+    ]
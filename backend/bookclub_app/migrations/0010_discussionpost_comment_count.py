@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_counts(apps, schema_editor):
+    DiscussionPost = apps.get_model('bookclub_app', 'DiscussionPost')
+    Comment = apps.get_model('bookclub_app', 'Comment')
+    counts = (
+        Comment.objects.filter(post=OuterRef('pk'))
+        .order_by().values('post').annotate(n=Count('pk')).values('n')
+    )
+    DiscussionPost.objects.update(comment_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookclub_app', '0009_reactioncount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='discussionpost',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_comment_counts, migrations.RunPython.noop),
+    ]
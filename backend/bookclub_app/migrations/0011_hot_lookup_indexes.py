@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookclub_app', '0010_discussionpost_comment_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chapterschedule',
+            index=models.Index(fields=['target_completion_date', 'completed'], name='schedule_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'created_at', 'id'], name='comment_thread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discussionpost',
+            index=models.Index(fields=['group', '-created_at', '-id'], name='post_group_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='groupmembership',
+            index=models.Index(fields=['group', 'user'], name='membership_group_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readinggroup',
+            index=models.Index(fields=['book', 'start_date', 'id'], name='group_book_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readingprogress',
+            index=models.Index(fields=['user', 'group'], name='progress_user_group_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readingprogress',
+            index=models.Index(fields=['group', 'book'], name='progress_group_book_idx'),
+        ),
+    ]
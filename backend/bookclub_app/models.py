@@ -12,9 +12,42 @@ class Book(models.Model):
     total_chapters = models.PositiveIntegerField()
     cover_image = models.CharField(max_length=500, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            # The catalog is keyset-paged by title, so every page is a range
+            # read of this index instead of a sort of the whole table
+            models.Index(fields=['title', 'id'], name='book_title_idx'),
+        ]
+        constraints = [
+            # The catalog import matches and upserts books on this pair
+            models.UniqueConstraint(fields=['title', 'author'], name='book_title_author_uniq'),
+        ]
+
     def __str__(self):
         return self.title
 
+class BookSearchIndex(models.Model):
+    """Read-only view of the SQLite FTS5 table that indexes books for search.
+
+    The virtual table is created by migration 0006 and kept in sync by
+    ``bookclub_app.search``; its rowid is the book id. ``document`` maps the
+    FTS5 hidden column named after the table, which is what MATCH runs against.
+    """
+    book = models.OneToOneField(
+        Book, on_delete=models.DO_NOTHING, primary_key=True, db_column='rowid',
+        db_constraint=False, related_name='search_index'
+    )
+    title = models.TextField()
+    author = models.TextField()
+    genre = models.TextField()
+    description = models.TextField()
+    document = models.TextField(db_column='bookclub_app_book_fts')
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'bookclub_app_book_fts'
+
 class Chapter(models.Model):
     book = models.ForeignKey(Book, on_delete=models.CASCADE, related_name='chapters')
     chapter_number = models.PositiveIntegerField()
@@ -24,20 +57,27 @@ class Chapter(models.Model):
         ordering = ['chapter_number']
 
 class ReadingGroup(models.Model):
+    MAX_MEMBERS = 10
+
     name = models.CharField(max_length=255)
     book = models.ForeignKey(Book, on_delete=models.CASCADE)
     creator = models.ForeignKey(User, on_delete=models.CASCADE)
     start_date = models.DateField()
     end_date = models.DateField()
     created_at = models.DateTimeField(auto_now_add=True)
+    # Denormalized count of memberships, updated with F() expressions when
+    # members join or leave. `manage.py reconcile_member_counts` repairs drift.
+    member_count = models.PositiveIntegerField(default=0, editable=False)
 
-    @property
-    def member_count(self):
-        return self.memberships.count()
+    class Meta:
+        indexes = [
+            # A book's open groups, paged by start date
+            models.Index(fields=['book', 'start_date', 'id'], name='group_book_start_idx'),
+        ]
 
     @property
     def is_full(self):
-        return self.member_count >= 10
+        return self.member_count >= self.MAX_MEMBERS
 
     def __str__(self):
         return f"{self.name} ({self.book.title})"
@@ -49,6 +89,10 @@ class GroupMembership(models.Model):
 
     class Meta:
         unique_together = ('user', 'group')
+        indexes = [
+            # Members of a group; covers the user ids that notifications fan out to
+            models.Index(fields=['group', 'user'], name='membership_group_user_idx'),
+        ]
 
 class DiscussionPost(models.Model):
     group = models.ForeignKey(ReadingGroup, on_delete=models.CASCADE, related_name='posts')
@@ -56,6 +100,16 @@ class DiscussionPost(models.Model):
     chapter = models.ForeignKey(Chapter, on_delete=models.SET_NULL, null=True, blank=True)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    # Denormalized count of comments, updated with F() expressions by signals
+    # when comments are added or deleted. `manage.py reconcile_comment_counts`
+    # repairs drift.
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta:
+        indexes = [
+            # A group's discussion, newest first
+            models.Index(fields=['group', '-created_at', '-id'], name='post_group_recent_idx'),
+        ]
 
 class Comment(models.Model):
     post = models.ForeignKey(DiscussionPost, on_delete=models.CASCADE, related_name='comments')
@@ -63,6 +117,12 @@ class Comment(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # A post's thread in order, and its latest comments for the preview
+            models.Index(fields=['post', 'created_at', 'id'], name='comment_thread_idx'),
+        ]
+
 class Reaction(models.Model):
     """Emoji reaction on a discussion post by a user."""
     post = models.ForeignKey(DiscussionPost, on_delete=models.CASCADE, related_name='reactions')
@@ -75,6 +135,22 @@ class Reaction(models.Model):
 
     def __str__(self):
         return f"{self.user.username} reacted {self.emoji} on post {self.post.id}"
+
+class ReactionCount(models.Model):
+    """Denormalized number of ``emoji`` reactions on a post.
+
+    Updated with F() expressions by the Reaction save/delete signals (which
+    also fire for cascaded deletes), so readers get totals without loading
+    every Reaction row. ``bulk_create`` and raw SQL bypass the signals;
+    `manage.py reconcile_reaction_counts` repairs the drift they leave.
+    """
+    post = models.ForeignKey(DiscussionPost, on_delete=models.CASCADE, related_name='reaction_counts')
+    emoji = models.CharField(max_length=10)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('post', 'emoji')
+
 class ReadingProgress(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     book = models.ForeignKey(Book, on_delete=models.CASCADE)
@@ -93,6 +169,11 @@ class ReadingProgress(models.Model):
 
     class Meta:
         unique_together = ('user', 'book', 'group')
+        indexes = [
+            # (user, book, group) above cannot serve lookups by user and group alone
+            models.Index(fields=['user', 'group'], name='progress_user_group_idx'),
+            models.Index(fields=['group', 'book'], name='progress_group_book_idx'),
+        ]
 
 class ChapterSchedule(models.Model):
     """Personal chapter completion schedule for each user in a group"""
@@ -108,6 +189,60 @@ class ChapterSchedule(models.Model):
     class Meta:
         unique_together = ('user', 'group', 'chapter')
         ordering = ['chapter__chapter_number']
+        indexes = [
+            # Deadline reminders: a date range, then the unfinished ones. (user,
+            # group) lookups are served by the unique index above.
+            models.Index(fields=['target_completion_date', 'completed'], name='schedule_deadline_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.chapter.title} - {self.target_completion_date}"
+
+class Notification(models.Model):
+    """One entry in a user's inbox, written when the event happens (fan-out on write)."""
+    NEW_POST = 'new_post'
+    NEW_COMMENT = 'new_comment'
+    MEMBER_JOINED = 'member_joined'
+    DEADLINE = 'deadline'
+    KIND_CHOICES = [
+        (NEW_POST, 'New post'),
+        (NEW_COMMENT, 'New comment'),
+        (MEMBER_JOINED, 'Member joined'),
+        (DEADLINE, 'Upcoming deadline'),
+    ]
+
+    recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    actor = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    group = models.ForeignKey(ReadingGroup, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    message = models.CharField(max_length=255)
+    # Identifies notifications that must be sent only once (deadline reminders).
+    dedupe_key = models.CharField(max_length=100, blank=True, default='')
+    read_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['recipient', '-created_at', '-id'], name='notification_inbox_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['recipient', 'dedupe_key'], condition=~models.Q(dedupe_key=''),
+                name='notification_unique_dedupe_key',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient.username}: {self.message}"
+
+
+class NotificationInbox(models.Model):
+    """Per-user unread counter, kept in step with Notification rows using F() updates.
+
+    `manage.py reconcile_unread_counts` repairs drift.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='notification_inbox')
+    unread_count = models.PositiveIntegerField(default=0)
 
     def __str__(self):
-        return f"{self.user.username} - {self.chapter.title} - {self.target_completion_date}"
\ No newline at end of file
+        return f"{self.user.username}: {self.unread_count} unread"
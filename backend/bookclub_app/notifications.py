@@ -0,0 +1,173 @@
+# bookclub_app/notifications.py
+"""Per-user notification inboxes, filled fan-out on write.
+
+When something happens (a post, a comment, a member joining, a deadline
+coming up) one ``Notification`` row is written for every user who should see
+it, and their ``NotificationInbox.unread_count`` is bumped in the same
+transaction. Reading the inbox is then a single indexed range scan on
+``(recipient, created_at)`` and the unread badge a primary-key lookup,
+however many groups the user belongs to.
+"""
+import datetime
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from .models import ChapterSchedule, GroupMembership, Notification, NotificationInbox
+
+
+def _excerpt(text, length=60):
+    return Truncator(" ".join(text.split())).chars(length)
+
+
+def deliver(notifications):
+    """Store ``notifications`` and add them to their recipients' unread counters."""
+    notifications = list(notifications)
+    if not notifications:
+        return []
+
+    per_user = Counter(n.recipient_id for n in notifications)
+    by_increment = defaultdict(list)
+    for user_id, count in per_user.items():
+        by_increment[count].append(user_id)
+
+    with transaction.atomic():
+        created = Notification.objects.bulk_create(notifications)
+        NotificationInbox.objects.bulk_create(
+            [NotificationInbox(user_id=user_id) for user_id in per_user], ignore_conflicts=True
+        )
+        for increment, user_ids in by_increment.items():
+            NotificationInbox.objects.filter(user_id__in=user_ids).update(
+                unread_count=F('unread_count') + increment
+            )
+    return created
+
+
+def _fan_out(recipient_ids, **fields):
+    return deliver(Notification(recipient_id=user_id, **fields) for user_id in recipient_ids)
+
+
+def _members_except(group_id, user_id):
+    return (
+        GroupMembership.objects.filter(group_id=group_id)
+        .exclude(user_id=user_id)
+        .values_list('user_id', flat=True)
+    )
+
+
+# ==== EVENTS ====
+
+def notify_new_post(post):
+    """Tell the other members of the group about a new discussion post."""
+    _fan_out(
+        _members_except(post.group_id, post.author_id),
+        kind=Notification.NEW_POST,
+        actor_id=post.author_id,
+        group_id=post.group_id,
+        message=f'{post.author.username} posted in "{post.group.name}": "{_excerpt(post.content)}"',
+    )
+
+
+def notify_new_comment(comment):
+    """Tell the post's author and earlier commenters, if still members, about a reply."""
+    post = comment.post
+    recipients = (
+        _members_except(post.group_id, comment.author_id)
+        .filter(Q(user_id=post.author_id) | Q(user__comment__post_id=post.id))
+        .distinct()
+    )
+    _fan_out(
+        recipients,
+        kind=Notification.NEW_COMMENT,
+        actor_id=comment.author_id,
+        group_id=post.group_id,
+        message=f'{comment.author.username} replied in "{post.group.name}": "{_excerpt(comment.content)}"',
+    )
+
+
+def notify_member_joined(membership):
+    """Tell the existing members of the group who joined."""
+    _fan_out(
+        _members_except(membership.group_id, membership.user_id),
+        kind=Notification.MEMBER_JOINED,
+        actor_id=membership.user_id,
+        group_id=membership.group_id,
+        message=f'{membership.user.username} joined "{membership.group.name}"',
+    )
+
+
+def queue_deadline_reminders(today=None, days_ahead=None):
+    """Remind members of unfinished chapters due within ``days_ahead`` days.
+
+    Each schedule gets one reminder per target date, so re-running is safe and
+    moving the date re-arms the reminder. Returns the notifications created.
+    """
+    today = today or timezone.localdate()
+    if days_ahead is None:
+        days_ahead = getattr(settings, 'NOTIFICATION_DEADLINE_DAYS', 3)
+
+    schedules = (
+        ChapterSchedule.objects.filter(
+            completed=False,
+            target_completion_date__range=(today, today + datetime.timedelta(days=days_ahead)),
+            group__memberships__user=F('user'),
+        )
+        .select_related('chapter', 'group')
+        .order_by()
+    )
+    pending = {}
+    for schedule in schedules:
+        key = f'deadline:{schedule.pk}:{schedule.target_completion_date.isoformat()}'
+        pending[(schedule.user_id, key)] = schedule
+    if not pending:
+        return []
+
+    already_sent = set(
+        Notification.objects.filter(
+            # recipient_id lets this use an index rather than scan every notification
+            recipient_id__in={user_id for user_id, _ in pending},
+            kind=Notification.DEADLINE, dedupe_key__in={key for _, key in pending},
+        ).values_list('recipient_id', 'dedupe_key')
+    )
+    notifications = []
+    for (user_id, key), schedule in pending.items():
+        if (user_id, key) in already_sent:
+            continue
+        days_left = (schedule.target_completion_date - today).days
+        when = 'today' if days_left == 0 else f'in {days_left} day(s)'
+        notifications.append(Notification(
+            recipient_id=user_id,
+            kind=Notification.DEADLINE,
+            group_id=schedule.group_id,
+            dedupe_key=key,
+            message=f'"{schedule.chapter.title}" in "{schedule.group.name}" is due {when}',
+        ))
+    return deliver(notifications)
+
+
+# ==== READING ====
+
+def unread_count(user):
+    count = NotificationInbox.objects.filter(user=user).values_list('unread_count', flat=True).first()
+    return count or 0
+
+
+def mark_read(user, ids=None):
+    """Mark the user's notifications (all, or just ``ids``) read. Returns how many changed."""
+    unread = Notification.objects.filter(recipient=user, read_at__isnull=True)
+    if ids is not None:
+        unread = unread.filter(id__in=ids)
+    with transaction.atomic():
+        changed = unread.update(read_at=timezone.now())
+        if ids is None:
+            NotificationInbox.objects.filter(user=user).update(unread_count=0)
+        elif changed:
+            NotificationInbox.objects.filter(user=user).update(
+                unread_count=Greatest(F('unread_count') - changed, 0)
+            )
+    return changed
@@ -0,0 +1,222 @@
+# bookclub_app/pagination.py
+"""Keyset (cursor) pagination for the list endpoints.
+
+Pages are cut with ``WHERE (a, b) > (last_a, last_b)`` style filters on a
+stable ordering instead of OFFSET, so fetching page 1000 costs the same as
+fetching page 1. The response body stays a plain JSON list; the opaque
+cursors travel in an RFC 8288 ``Link`` header (``rel="next"``/``rel="prev"``).
+"""
+import base64
+import datetime
+import decimal
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .instrumentation import timed
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+class KeysetPagination(BasePagination):
+    """Paginate a queryset on ``ordering``, e.g. ``('-created_at', '-id')``.
+
+    The last ordering field must be unique (normally ``id``) so that every row
+    has a distinct position. Ordering fields must be readable as attributes of
+    the returned objects, which includes annotations, or as keys of the
+    returned ``values()`` rows.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self, ordering, page_size=None, max_page_size=None):
+        self.ordering = tuple(ordering)
+        self.page_size = page_size or getattr(settings, 'API_PAGE_SIZE', 50)
+        self.max_page_size = max_page_size or getattr(settings, 'API_MAX_PAGE_SIZE', 200)
+
+    # ---- cursor encoding ----
+
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({'k': [_encode_value(v) for v in values], 'r': int(reverse)})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values, reverse = payload['k'], bool(payload['r'])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    # ---- query building ----
+
+    @staticmethod
+    def _split(field):
+        return (field[1:], True) if field.startswith('-') else (field, False)
+
+    def _ordering(self, reverse):
+        ordering = []
+        for field in self.ordering:
+            name, descending = self._split(field)
+            ordering.append(f'-{name}' if descending != reverse else name)
+        return ordering
+
+    def _after(self, values, reverse):
+        """Rows strictly after ``values`` in the (possibly reversed) ordering."""
+        condition = Q()
+        equal = {}
+        for field, value in zip(self.ordering, values):
+            name, descending = self._split(field)
+            lookup = 'lt' if descending != reverse else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        # The OR alone cannot seek an index; a plain bound on the leading
+        # field lets the database start the range at the cursor
+        name, descending = self._split(self.ordering[0])
+        bound = 'lte' if descending != reverse else 'gte'
+        return Q(**{f'{name}__{bound}': values[0]}) & condition
+
+    def _parse_position(self, queryset, values):
+        """Cursor values as the Python types of their ordering fields."""
+        parsed = []
+        for field, value in zip(self.ordering, values):
+            name = self._split(field)[0]
+            annotation = queryset.query.annotations.get(name)
+            model_field = annotation.output_field if annotation is not None else queryset.model._meta.get_field(name)
+            try:
+                value = model_field.to_python(value)
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+            if value is None:
+                raise NotFound(self.invalid_cursor_message)
+            parsed.append(value)
+        return parsed
+
+    def _position(self, obj):
+        if isinstance(obj, dict):
+            return [obj[name] for name in self.ordering_names()]
+        return [getattr(obj, name) for name in self.ordering_names()]
+
+    def ordering_names(self):
+        return tuple(self._split(field)[0] for field in self.ordering)
+
+    def get_page_size(self, request):
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw is None:
+            return self.page_size
+        try:
+            size = int(raw)
+        except ValueError:
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    # ---- BasePagination API ----
+
+    def _page_query(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor[1])
+
+        queryset = queryset.order_by(*self._ordering(reverse))
+        if cursor:
+            queryset = queryset.filter(self._after(self._parse_position(queryset, cursor[0]), reverse))
+        return queryset[:page_size + 1], page_size, cursor, reverse
+
+    def _cut_page(self, results, page_size, cursor, reverse):
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        if not results:
+            self.has_next = self.has_previous = False
+            return results
+
+        self.has_next = has_more if not reverse else True
+        self.has_previous = has_more if reverse else cursor is not None
+        self.next_position = self._position(results[-1])
+        self.previous_position = self._position(results[0])
+        return results
+
+    def paginate_queryset(self, queryset, request, view=None):
+        query, *page = self._page_query(queryset, request)
+        return self._cut_page(list(query), *page)
+
+    async def apaginate_queryset(self, queryset, request):
+        """``paginate_queryset`` for async views (runs prefetches too)."""
+        query, *page = self._page_query(queryset, request)
+        return self._cut_page([obj async for obj in query], *page)
+
+    def _link(self, position, reverse):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position, reverse))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self._link(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self._link(self.previous_position, reverse=True)
+
+    def get_link_header(self):
+        links = []
+        next_link, previous_link = self.get_next_link(), self.get_previous_link()
+        if next_link:
+            links.append(f'<{next_link}>; rel="next"')
+        if previous_link:
+            links.append(f'<{previous_link}>; rel="prev"')
+        return ', '.join(links)
+
+    def get_paginated_response(self, data):
+        headers = {}
+        link_header = self.get_link_header()
+        if link_header:
+            headers['Link'] = link_header
+        return Response(data, headers=headers)
+
+
+def paginate(request, queryset, ordering, serializer_class, **serializer_kwargs):
+    """Serialize one keyset page of ``queryset`` into a paginated response."""
+    paginator = KeysetPagination(ordering)
+    page = paginator.paginate_queryset(queryset, request)
+    with timed('serialize'):
+        data = serializer_class(page, many=True, **serializer_kwargs).data
+    return paginator.get_paginated_response(data)
+
+
+def paginate_rows(request, queryset, ordering, row_serializer, prepare=None):
+    """``paginate`` with a ``RowSerializer``: the page is read as ``values()`` rows.
+
+    ``prepare``, if given, is called with the page's rows before they are
+    serialized and may change them in place.
+    """
+    paginator = KeysetPagination(ordering)
+    page = paginator.paginate_queryset(row_serializer.queryset(queryset, *paginator.ordering_names()), request)
+    if prepare is not None:
+        prepare(page)
+    with timed('serialize'):
+        data = row_serializer.many(page)
+    return paginator.get_paginated_response(data)
@@ -0,0 +1,99 @@
+# bookclub_app/permissions.py
+"""Group membership checks shared by every group-scoped view.
+
+``IsGroupMember`` loads the group named by the URL's ``group_id``, its book,
+its creator and whether the caller is a member in a single query, and keeps
+the result on the request. The view then picks the same object up with
+``load_group``, so the permission check and the view together cost one round
+trip instead of a group fetch plus a membership ``exists()``.
+"""
+from django.db.models import Exists, OuterRef
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+
+from .models import DiscussionPost, GroupMembership, ReadingGroup
+
+NOT_A_MEMBER = "Not a member of this group"
+
+
+def _membership_of(user, group_ref):
+    return Exists(GroupMembership.objects.filter(group=group_ref, user=user))
+
+
+def _request_cache(request, name):
+    cache = getattr(request, '_loaded_objects', None)
+    if cache is None:
+        cache = request._loaded_objects = {}
+    return cache.setdefault(name, {})
+
+
+def _groups_for(user):
+    return (
+        ReadingGroup.objects.select_related('book', 'creator')
+        .annotate(is_member=_membership_of(user, OuterRef('pk')))
+    )
+
+
+def load_group(request, group_id):
+    """The group (with ``book``, ``creator`` and ``is_member``) for this request.
+
+    Raises ``NotFound`` with the usual ``{"error": ...}`` body if it does not exist.
+    """
+    groups = _request_cache(request, 'groups')
+    group_id = int(group_id)
+    if group_id not in groups:
+        try:
+            groups[group_id] = _groups_for(request.user).get(id=group_id)
+        except ReadingGroup.DoesNotExist:
+            raise NotFound({"error": "Group not found"})
+    return groups[group_id]
+
+
+async def aload_member_group(user, group_id):
+    """Async ``load_group`` plus the ``IsGroupMember`` check, for async views."""
+    try:
+        group = await _groups_for(user).aget(id=group_id)
+    except ReadingGroup.DoesNotExist:
+        raise NotFound({"error": "Group not found"})
+    if not group.is_member:
+        raise PermissionDenied({"error": NOT_A_MEMBER})
+    return group
+
+
+def load_post(request, post_id):
+    """The discussion post (with ``group`` and ``is_member``) for this request."""
+    posts = _request_cache(request, 'posts')
+    post_id = int(post_id)
+    if post_id not in posts:
+        try:
+            posts[post_id] = (
+                DiscussionPost.objects.select_related('group')
+                .annotate(is_member=_membership_of(request.user, OuterRef('group')))
+                .get(id=post_id)
+            )
+        except DiscussionPost.DoesNotExist:
+            raise NotFound({"error": "Post not found"})
+    return posts[post_id]
+
+
+class IsGroupMember(IsAuthenticated):
+    """Authenticated member of the group identified by ``group_id`` in the URL."""
+    url_kwarg = 'group_id'
+
+    def load(self, request, object_id):
+        return load_group(request, object_id)
+
+    def has_permission(self, request, view):
+        if not super().has_permission(request, view):
+            return False
+        if not self.load(request, view.kwargs[self.url_kwarg]).is_member:
+            raise PermissionDenied({"error": NOT_A_MEMBER})
+        return True
+
+
+class IsPostGroupMember(IsGroupMember):
+    """Authenticated member of the group the post identified by ``post_id`` belongs to."""
+    url_kwarg = 'post_id'
+
+    def load(self, request, object_id):
+        return load_post(request, object_id)
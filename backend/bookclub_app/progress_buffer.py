@@ -0,0 +1,203 @@
+# bookclub_app/progress_buffer.py
+"""Write-behind buffer for page-turn progress updates.
+
+With ``PROGRESS_WRITE_BEHIND`` enabled, a ``PUT /groups/<id>/progress/`` that
+only moves ``current_page`` is recorded here instead of saving the row. The
+latest page per (user, group) wins, and pending pages are written with one
+``bulk_update`` when the buffer reaches ``PROGRESS_FLUSH_THRESHOLD`` entries,
+every ``PROGRESS_FLUSH_INTERVAL`` seconds, and at interpreter exit.
+
+Reads of a user's own progress go through ``apply_pending`` (or
+``apply_pending_rows`` for ``values()`` rows) so they see their buffered page
+straight away (read-your-writes). Other readers, such as the
+group stats, catch up at the next flush.
+
+A buffered page only lands on a row that has not been saved since it was
+recorded (``last_read_at`` is older), so a flush that races a direct save
+of the same row cannot roll it back to the buffered page.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+
+from .caching import bump_version
+from .models import ReadingProgress
+
+logger = logging.getLogger(__name__)
+
+PendingPage = namedtuple('PendingPage', ['progress_id', 'current_page', 'last_read_at'])
+
+
+def write_behind_enabled():
+    return getattr(settings, 'PROGRESS_WRITE_BEHIND', False)
+
+
+class ProgressWriteBuffer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        # Entries being written by an in-flight flush; still visible to reads.
+        self._flushing = {}
+        self._last_flush = time.monotonic()
+        self._flusher = None
+        self._stop = threading.Event()
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, 'PROGRESS_FLUSH_INTERVAL', 5)
+
+    @property
+    def flush_threshold(self):
+        return getattr(settings, 'PROGRESS_FLUSH_THRESHOLD', 500)
+
+    def __len__(self):
+        return len(self._pending)
+
+    def record(self, progress, current_page):
+        """Buffer ``current_page`` for ``progress`` and return the pending entry."""
+        key = (progress.user_id, progress.group_id)
+        entry = PendingPage(progress.pk, current_page, timezone.now())
+        with self._lock:
+            self._pending[key] = entry
+            due = (
+                len(self._pending) >= self.flush_threshold
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        self._ensure_flusher()
+        if due:
+            try:
+                self.flush()
+            except Exception:
+                # The batch was requeued; the background flusher retries it.
+                logger.exception("Flushing buffered reading progress failed")
+        return entry
+
+    def pending_for(self, user_id, group_id):
+        key = (user_id, group_id)
+        with self._lock:
+            return self._pending.get(key) or self._flushing.get(key)
+
+    def _newer_entry(self, user_id, group_id, progress_id, last_read_at):
+        entry = self.pending_for(user_id, group_id)
+        if entry is not None and entry.progress_id == progress_id and (
+            last_read_at is None or entry.last_read_at > last_read_at
+        ):
+            return entry
+        return None
+
+    def apply_pending(self, progress):
+        """Overlay any buffered page onto ``progress`` (in memory only)."""
+        entry = self._newer_entry(progress.user_id, progress.group_id, progress.pk, progress.last_read_at)
+        if entry is not None:
+            progress.current_page = entry.current_page
+            progress.last_read_at = entry.last_read_at
+        return progress
+
+    def apply_pending_rows(self, rows):
+        """``apply_pending`` for ``ReadingProgress`` ``values()`` rows, which
+        need the ``id``, ``user``, ``group`` and ``last_read_at`` columns."""
+        for row in rows:
+            entry = self._newer_entry(row['user'], row['group'], row['id'], row['last_read_at'])
+            if entry is not None:
+                row['current_page'] = entry.current_page
+                row['last_read_at'] = entry.last_read_at
+        return rows
+
+    def discard(self, user_id, group_id, entry):
+        """Forget ``entry`` unless a newer page was buffered since, e.g. once
+        the row has been saved directly with it."""
+        key = (user_id, group_id)
+        with self._lock:
+            if self._pending.get(key) is entry:
+                del self._pending[key]
+
+    def flush(self):
+        """Write every pending page in one transaction. Returns rows written."""
+        with self._lock:
+            if not self._pending:
+                self._last_flush = time.monotonic()
+                return 0
+            batch, self._pending = self._pending, {}
+            self._flushing.update(batch)
+            self._last_flush = time.monotonic()
+
+        entries = list(batch.values())
+        try:
+            with transaction.atomic():
+                for start in range(0, len(entries), 500):
+                    self._write(entries[start:start + 500])
+        except Exception:
+            # Requeue, but never clobber a newer page recorded meanwhile.
+            with self._lock:
+                for key, entry in batch.items():
+                    self._pending.setdefault(key, entry)
+            raise
+        finally:
+            with self._lock:
+                for key, entry in batch.items():
+                    if self._flushing.get(key) is entry:
+                        del self._flushing[key]
+
+        # update() sends no post_save, so invalidate cached stats here.
+        for group_id in {group_id for _, group_id in batch}:
+            bump_version('group-progress', group_id)
+        return len(entries)
+
+    @staticmethod
+    def _write(entries):
+        # One UPDATE with a CASE per column, like bulk_update, except that a
+        # row saved after the page was buffered keeps its newer values
+        newer = [
+            (Q(pk=entry.progress_id, last_read_at__lt=entry.last_read_at), entry) for entry in entries
+        ]
+        ReadingProgress.objects.filter(pk__in=[entry.progress_id for entry in entries]).update(
+            current_page=Case(
+                *(When(condition, then=Value(entry.current_page)) for condition, entry in newer),
+                default=F('current_page'),
+            ),
+            last_read_at=Case(
+                *(When(condition, then=Value(entry.last_read_at)) for condition, entry in newer),
+                default=F('last_read_at'),
+            ),
+        )
+
+    # ---- background flushing ----
+
+    def _ensure_flusher(self):
+        if self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run_flusher, name='progress-flusher', daemon=True
+                )
+                self._flusher.start()
+
+    def _run_flusher(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                close_old_connections()
+                self.flush()
+            except Exception:
+                logger.exception("Flushing buffered reading progress failed")
+
+    def shutdown(self):
+        """Stop the background flusher and write out whatever is pending."""
+        self._stop.set()
+        self.flush()
+
+
+progress_buffer = ProgressWriteBuffer()
+
+
+@atexit.register
+def _flush_on_exit():
+    if len(progress_buffer):
+        progress_buffer.shutdown()
@@ -0,0 +1,73 @@
+# bookclub_app/reactions.py
+"""Emoji reactions and their per-(post, emoji) counters.
+
+Readers see reactions as totals, ``[{"emoji", "count", "reacted_by_me"}]``,
+built from ``ReactionCount`` rows and the reader's own reactions, never from
+every ``Reaction`` on the post. The counters follow every Reaction insert
+and delete through signals (see ``signals.py``), including cascades when a
+user is deleted. Deletes through a ``Reaction`` queryset are the exception:
+the caller adjusts the counter by the number of rows removed, as ``toggle``
+does. ``bulk_create`` and raw SQL bypass them, and
+``manage.py reconcile_reaction_counts`` repairs the drift.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import Reaction, ReactionCount
+
+
+def adjust_count(post_id, emoji, delta):
+    """Add ``delta`` (+1 or -1) to the post's ``emoji`` counter."""
+    counters = ReactionCount.objects.filter(post_id=post_id, emoji=emoji)
+    if delta < 0:
+        counters.filter(count__gte=-delta).update(count=F("count") + delta)
+        return
+    if counters.update(count=F("count") + delta):
+        return
+    try:
+        with transaction.atomic():
+            ReactionCount.objects.create(post_id=post_id, emoji=emoji, count=delta)
+    except IntegrityError:
+        # Another request created the counter first
+        counters.update(count=F("count") + delta)
+
+
+def toggle(post, user, emoji):
+    """Remove ``user``'s ``emoji`` reaction on ``post`` if present, else add it.
+
+    Returns ``"added"`` or ``"removed"``.
+    """
+    with transaction.atomic():
+        existing = Reaction.objects.filter(post=post, user=user, emoji=emoji).first()
+        if existing is not None:
+            # A racing remove of the same reaction (a double click) may have
+            # taken the row since the lookup; only the one that deleted it counts
+            deleted, _ = Reaction.objects.filter(pk=existing.pk).delete()
+            if deleted:
+                adjust_count(existing.post_id, emoji, -1)
+            return "removed"
+        try:
+            with transaction.atomic():
+                Reaction.objects.create(post=post, user=user, emoji=emoji)
+        except IntegrityError:
+            pass  # a double click raced us and already added it
+        return "added"
+
+
+def summarize(counters, my_emojis):
+    """Reader-facing totals from ``ReactionCount`` rows, in first-use order."""
+    return [
+        {"emoji": counter.emoji, "count": counter.count, "reacted_by_me": counter.emoji in my_emojis}
+        for counter in counters
+        if counter.count > 0
+    ]
+
+
+def post_counters(post_id):
+    return ReactionCount.objects.filter(post_id=post_id, count__gt=0).order_by("id")
+
+
+def post_summary(post_id, user):
+    """``summarize`` for one post as seen by ``user``."""
+    mine = set(Reaction.objects.filter(post_id=post_id, user=user).values_list("emoji", flat=True))
+    return summarize(post_counters(post_id), mine)
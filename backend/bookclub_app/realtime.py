@@ -0,0 +1,131 @@
+# bookclub_app/realtime.py
+"""Push discussion changes to connected readers as Server-Sent Events.
+
+Views publish small deltas (a new post, a new comment, a reaction toggle)
+to the ``group:<id>`` channel once their transaction commits, and
+``GET /api/groups/<id>/events/`` streams them to every open browser tab of
+that group. Streaming needs an ASGI server (uvicorn, daphne, ...).
+
+The broker is pluggable through ``settings.REALTIME_BROKER``. The default
+``LocalBroker`` fans out in memory, which is all a single server process
+needs. Running several processes requires a broker that shares events
+between them.
+"""
+import asyncio
+import json
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from rest_framework.utils.encoders import JSONEncoder
+
+HEARTBEAT_SECONDS = 15
+RESYNC = 'resync'
+
+
+def group_channel(group_id):
+    return f'group:{group_id}'
+
+
+class Subscription:
+    """One listener's queue. ``deliver`` may be called from any thread."""
+
+    def __init__(self, broker, channel, max_queued):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_queued)
+
+    def deliver(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The listener's event loop is gone; it unsubscribes on its way out.
+            pass
+
+    def _put(self, event):
+        if self.queue.full():
+            # A slow reader missed events: drop the backlog and have it refetch.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = (RESYNC, '{}')
+        self.queue.put_nowait(event)
+
+    async def get(self):
+        return await self.queue.get()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker:
+    """In-process publish/subscribe; reaches listeners of this process only."""
+
+    def __init__(self, max_queued=100):
+        self.max_queued = max_queued
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def subscribe(self, channel):
+        """Register a listener. Must be called from the listener's event loop."""
+        subscription = Subscription(self, channel, self.max_queued)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            listeners = self._subscriptions.get(subscription.channel)
+            if listeners is not None:
+                listeners.discard(subscription)
+                if not listeners:
+                    del self._subscriptions[subscription.channel]
+
+    def publish(self, channel, event):
+        with self._lock:
+            listeners = list(self._subscriptions.get(channel, ()))
+        for subscription in listeners:
+            subscription.deliver(event)
+
+    def listener_count(self, channel):
+        with self._lock:
+            return len(self._subscriptions.get(channel, ()))
+
+
+_brokers = {}
+
+
+def get_broker():
+    path = getattr(settings, 'REALTIME_BROKER', 'bookclub_app.realtime.LocalBroker')
+    if path not in _brokers:
+        _brokers[path] = import_string(path)()
+    return _brokers[path]
+
+
+def publish_group_event(group_id, event_type, data):
+    """Broadcast ``data`` to the group's listeners once the transaction commits."""
+    event = (event_type, json.dumps(data, cls=JSONEncoder))
+    transaction.on_commit(lambda: get_broker().publish(group_channel(group_id), event))
+
+
+def encode_event(event_type, payload):
+    return f'event: {event_type}\ndata: {payload}\n\n'
+
+
+async def event_stream(group_id, heartbeat=HEARTBEAT_SECONDS):
+    """Yield SSE frames for the group until the client disconnects."""
+    with get_broker().subscribe(group_channel(group_id)) as subscription:
+        yield 'retry: 3000\n\n'
+        while True:
+            try:
+                event_type, payload = await asyncio.wait_for(subscription.get(), heartbeat)
+            except asyncio.TimeoutError:
+                # Comment frame: keeps proxies from closing an idle stream.
+                yield ': keep-alive\n\n'
+                continue
+            yield encode_event(event_type, payload)
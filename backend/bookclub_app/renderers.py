@@ -0,0 +1,46 @@
+# bookclub_app/renderers.py
+"""JSON rendering with orjson when it is installed.
+
+``FastJSONRenderer`` writes the same JSON as DRF's ``JSONRenderer`` in its
+default compact, UTF-8, strict configuration, but encodes it in C straight
+to bytes. Datetimes and everything orjson does not know natively (lazy
+translations, ``Decimal``, querysets, ...) go through DRF's own
+``JSONEncoder.default``, so they are formatted exactly as before.
+
+It falls back to the stdlib renderer when orjson is missing, when the
+client asks for indented output (``Accept: application/json; indent=4``),
+when the ``UNICODE_JSON``/``COMPACT_JSON``/``STRICT_JSON`` settings are
+changed from their defaults, and for data orjson refuses (integers wider
+than 64 bits).
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    backend = 'orjson' if orjson is not None else 'json'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None or data is None
+            or self.get_indent(accepted_media_type, renderer_context or {})
+            or not (api_settings.UNICODE_JSON and api_settings.COMPACT_JSON and api_settings.STRICT_JSON)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:  # includes orjson.JSONEncodeError
+            return super().render(data, accepted_media_type, renderer_context)
+        # As JSONRenderer: keep the output safe to embed in JavaScript
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
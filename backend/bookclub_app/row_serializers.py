@@ -0,0 +1,117 @@
+# bookclub_app/row_serializers.py
+"""Read-only serializers that build list responses from ``values()`` rows.
+
+A DRF ``ModelSerializer`` page costs a model instance per row (and per
+``select_related`` object), a bound field per row and a dotted ``source``
+traversal per field. ``RowSerializer`` reads the same page as flat
+``values()`` rows, with the joins done in SQL, and turns each row into a
+dict by walking a field plan compiled once per process.
+
+The plan is derived from the DRF serializer it stands in for, so field
+names, order and formatting cannot drift from it: ``book_title`` with
+``source='book.title'`` reads the ``book__title`` column, primary key
+relations read the foreign key column, nested serializers are read from
+their prefixed columns, and dates and datetimes go through the DRF field's
+own ``to_representation``. Fields the database cannot provide (properties,
+``SerializerMethodField``) must be given in ``computed``.
+
+A relation that is null makes every field read through it ``None``, as DRF
+does for fields with ``allow_null``.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.functional import cached_property
+from rest_framework import serializers
+
+from .models import ReadingGroup
+from .serializers import BookSerializer, ReadingGroupSerializer, ReadingProgressSerializer
+
+# Fields whose to_representation returns values() output unchanged
+_PASSTHROUGH = (
+    serializers.CharField, serializers.IntegerField, serializers.BooleanField,
+    serializers.FloatField, serializers.ReadOnlyField, serializers.PrimaryKeyRelatedField,
+)
+
+
+class RowSerializer:
+    """Serialize ``values()`` rows exactly as ``serializer_class`` serializes instances.
+
+    ``computed`` maps field names to ``(columns, function)``: the function
+    gets the row and must return the field's value, the columns are added
+    to the ``values()`` call.
+    """
+
+    def __init__(self, serializer_class, computed=None):
+        self.serializer_class = serializer_class
+        self.computed = computed or {}
+
+    @cached_property
+    def _compiled(self):
+        # Bound fields need the app registry, so compile on first use
+        columns = []
+        plan = self._compile(self.serializer_class(), '', columns)
+        return plan, tuple(dict.fromkeys(columns))
+
+    def _compile(self, serializer, prefix, columns):
+        plan = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if not prefix and name in self.computed:
+                needed, function = self.computed[name]
+                columns.extend(needed)
+                plan.append((name, None, function, None))
+                continue
+            if field.source == '*' or isinstance(field, (serializers.SerializerMethodField, serializers.ListSerializer)):
+                raise ImproperlyConfigured(
+                    f"{type(serializer).__name__}.{name} cannot be read from a row; pass it in computed."
+                )
+            column = prefix + '__'.join(field.source_attrs)
+            columns.append(column)
+            if isinstance(field, serializers.Serializer):
+                plan.append((name, column, None, self._compile(field, column + '__', columns)))
+            elif type(field) in _PASSTHROUGH:
+                plan.append((name, column, None, None))
+            else:
+                plan.append((name, column, field.to_representation, None))
+        return plan
+
+    @property
+    def columns(self):
+        return self._compiled[1]
+
+    def queryset(self, queryset, *extra):
+        """``queryset`` as rows carrying every column the plan reads, plus ``extra``."""
+        return queryset.values(*dict.fromkeys(self.columns + extra))
+
+    def to_representation(self, row):
+        return self._represent(self._compiled[0], row)
+
+    def _represent(self, plan, row):
+        data = {}
+        for name, column, convert, nested in plan:
+            if column is None:
+                data[name] = convert(row)
+                continue
+            value = row[column]
+            if value is None:
+                data[name] = None
+            elif nested is not None:
+                data[name] = self._represent(nested, row)
+            elif convert is None:
+                data[name] = value
+            else:
+                data[name] = convert(value)
+        return data
+
+    def many(self, rows):
+        plan = self._compiled[0]
+        return [self._represent(plan, row) for row in rows]
+
+
+book_rows = RowSerializer(BookSerializer)
+
+group_rows = RowSerializer(ReadingGroupSerializer, computed={
+    'is_full': (('member_count',), lambda row: row['member_count'] >= ReadingGroup.MAX_MEMBERS),
+})
+
+progress_rows = RowSerializer(ReadingProgressSerializer)
@@ -0,0 +1,159 @@
+# bookclub_app/search.py
+"""Full-text book search.
+
+On SQLite builds with FTS5 the ``bookclub_app_book_fts`` virtual table indexes
+title, author, genre and description, and results are ranked with bm25. Other
+backends fall back to ``icontains`` filtering with a simple field-priority rank.
+Either way the returned queryset is annotated with ``search_rank`` (lower is
+better) so callers can order and paginate on it.
+"""
+import re
+
+from django.db import connections
+from django.db.models import Case, F, FloatField, IntegerField, Lookup, Q, Value, When
+
+from .models import Book, BookSearchIndex
+
+FTS_TABLE = BookSearchIndex._meta.db_table
+INDEXED_FIELDS = ('title', 'author', 'genre', 'description')
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+_fts_support = {}
+
+
+class Match(Lookup):
+    """``field__match=expr`` -> ``field MATCH expr`` (FTS5 query syntax)."""
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', lhs_params + rhs_params
+
+
+BookSearchIndex._meta.get_field('document').register_lookup(Match)
+
+
+def fts_available(using='default'):
+    """Return True if the given database can host the FTS5 book index."""
+    if using not in _fts_support:
+        connection = connections[using]
+        supported = False
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+                supported = bool(cursor.fetchone()[0])
+        _fts_support[using] = supported
+    return _fts_support[using]
+
+
+def build_match_expression(query):
+    """Turn free text into an FTS5 expression: every word, prefix-matched."""
+    tokens = _TOKEN_RE.findall(query)
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def _no_results(queryset):
+    return queryset.annotate(search_rank=Value(0, output_field=FloatField())).none()
+
+
+def search_books(query, queryset=None):
+    """Filter ``queryset`` (default: all books) to those matching ``query``.
+
+    The result is annotated with ``search_rank`` and ordered best match first.
+    """
+    if queryset is None:
+        queryset = Book.objects.all()
+
+    if fts_available(queryset.db):
+        expression = build_match_expression(query)
+        if not expression:
+            return _no_results(queryset)
+        return (
+            queryset.filter(search_index__document__match=expression)
+            .annotate(search_rank=F('search_index__rank'))
+            .order_by('search_rank', 'id')
+        )
+
+    terms = _TOKEN_RE.findall(query)
+    if not terms:
+        return _no_results(queryset)
+    for term in terms:
+        term_filter = Q()
+        for field in INDEXED_FIELDS:
+            term_filter |= Q(**{f'{field}__icontains': term})
+        queryset = queryset.filter(term_filter)
+    return queryset.annotate(
+        search_rank=Case(
+            When(title__istartswith=query, then=Value(0)),
+            When(title__icontains=query, then=Value(1)),
+            When(author__icontains=query, then=Value(2)),
+            default=Value(3),
+            output_field=IntegerField(),
+        )
+    ).order_by('search_rank', 'id')
+
+
+# ==== INDEX MAINTENANCE ====
+
+def _index_rows(books):
+    return [
+        (book.pk,) + tuple(getattr(book, field) or '' for field in INDEXED_FIELDS)
+        for book in books
+    ]
+
+
+def index_books(books, using='default'):
+    """Insert or refresh the index entries for ``books``."""
+    if not fts_available(using):
+        return 0
+    rows = _index_rows(books)
+    if not rows:
+        return 0
+    with connections[using].cursor() as cursor:
+        cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [(row[0],) for row in rows])
+        cursor.executemany(
+            f'INSERT INTO {FTS_TABLE} (rowid, title, author, genre, description) '
+            'VALUES (%s, %s, %s, %s, %s)',
+            rows,
+        )
+    return len(rows)
+
+
+def remove_books(book_ids, using='default'):
+    """Drop the index entries for the given book ids."""
+    if not fts_available(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [(pk,) for pk in book_ids])
+
+
+def rebuild_index(using='default', chunk_size=1000, incremental=False):
+    """(Re)build the book index in chunks. Returns the number of books indexed.
+
+    A full rebuild empties the table first. An incremental run only indexes
+    books that are missing from the index and drops entries for deleted books,
+    which picks up rows written without signals (``bulk_create``, raw SQL).
+    """
+    if not fts_available(using):
+        return 0
+
+    books = Book.objects.using(using).only('id', *INDEXED_FIELDS).order_by('id')
+    with connections[using].cursor() as cursor:
+        if incremental:
+            cursor.execute(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid NOT IN (SELECT id FROM {Book._meta.db_table})'
+            )
+            books = books.exclude(id__in=BookSearchIndex.objects.using(using).values('pk'))
+        else:
+            cursor.execute(f'DELETE FROM {FTS_TABLE}')
+
+    total = 0
+    batch = []
+    for book in books.iterator(chunk_size=chunk_size):
+        batch.append(book)
+        if len(batch) >= chunk_size:
+            total += index_books(batch, using=using)
+            batch = []
+    total += index_books(batch, using=using)
+    return total
@@ -1,7 +1,9 @@
 # bookclub_app/serializers.py
+from django.conf import settings
 from django.contrib.auth.models import User
 from rest_framework import serializers
-from .models import Book, DiscussionPost, ReadingGroup, Comment, ReadingProgress, Chapter, ChapterSchedule, Reaction
+from . import reactions
+from .models import Book, DiscussionPost, ReadingGroup, Comment, ReadingProgress, Chapter, ChapterSchedule, Reaction, Notification
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -13,6 +15,12 @@ class BookSerializer(serializers.ModelSerializer):
         model = Book
         fields = ['id', 'title', 'author', 'genre', 'description', 'total_pages', 'total_chapters', 'cover_image']
 
+class BookSummarySerializer(serializers.ModelSerializer):
+    """Book fields needed for cards and progress bars (no description)."""
+    class Meta:
+        model = Book
+        fields = ['id', 'title', 'author', 'cover_image', 'total_pages', 'total_chapters']
+
 class ReadingGroupSerializer(serializers.ModelSerializer):
     book_title = serializers.CharField(source='book.title', read_only=True)
     member_count = serializers.IntegerField(read_only=True)
@@ -52,15 +60,16 @@ class ReactionSerializer(serializers.ModelSerializer):
 
 class DiscussionPostSerializer(serializers.ModelSerializer):
     author_name = serializers.CharField(source='author.username', read_only=True)
-    comments = CommentSerializer(many=True, read_only=True)
+    comment_count = serializers.IntegerField(read_only=True)
+    comments = serializers.SerializerMethodField()
     chapter_title = serializers.CharField(source='chapter.title', read_only=True)
-    reactions = ReactionSerializer(many=True, read_only=True)
+    reactions = serializers.SerializerMethodField()
 
     class Meta:
         model = DiscussionPost
         fields = [
             'id', 'group', 'author', 'author_name', 'chapter', 'chapter_title',
-            'content', 'created_at', 'comments', 'reactions'
+            'content', 'created_at', 'comment_count', 'comments', 'reactions'
         ]
         read_only_fields = ['author', 'group']
         # Make chapter optional
@@ -68,6 +77,26 @@ class DiscussionPostSerializer(serializers.ModelSerializer):
             'chapter': {'required': False, 'allow_null': True}
         }
 
+    def get_comments(self, post):
+        """The latest COMMENT_PREVIEW_SIZE comments, oldest first.
+
+        The whole thread is paginated at ``posts/<id>/comments/``.
+        """
+        latest = getattr(post, 'latest_comments', None)  # prefetched by discussion_posts()
+        if latest is None:
+            if not post.comment_count:
+                return []
+            latest = post.comments.select_related('author').order_by('-created_at', '-id')[
+                :settings.COMMENT_PREVIEW_SIZE
+            ]
+        return CommentSerializer(reversed(list(latest)), many=True).data
+
+    def get_reactions(self, post):
+        # discussion_posts() prefetches the counters and the reader's own
+        # reactions (as my_reactions); a post that was just created has none
+        mine = {reaction.emoji for reaction in getattr(post, 'my_reactions', ())}
+        return reactions.summarize(post.reaction_counts.all(), mine)
+
 class ReadingProgressSerializer(serializers.ModelSerializer):
     book_title = serializers.CharField(source='book.title', read_only=True)
     chapter_title = serializers.CharField(source='current_chapter.title', read_only=True, allow_null=True)
@@ -101,4 +130,16 @@ class ChapterScheduleSerializer(serializers.ModelSerializer):
             'id', 'user', 'group', 'chapter', 'chapter_number', 'chapter_title',
             'target_completion_date', 'completed', 'completed_at', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['user', 'completed_at', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['user', 'completed_at', 'created_at', 'updated_at']
+
+class NotificationSerializer(serializers.ModelSerializer):
+    actor_name = serializers.CharField(source='actor.username', read_only=True, default=None)
+    is_read = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Notification
+        fields = ['id', 'kind', 'message', 'group', 'actor', 'actor_name', 'is_read', 'created_at']
+        read_only_fields = fields
+
+    def get_is_read(self, obj):
+        return obj.read_at is not None
@@ -0,0 +1,173 @@
+# bookclub_app/signals.py
+from django.contrib.auth.models import User
+from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import notifications, reactions, search
+from .backends import forget_user, remember_user
+from .caching import bump_version
+from .models import (
+    Book, Chapter, Comment, DiscussionPost, GroupMembership, Reaction, ReadingGroup, ReadingProgress,
+)
+from .usernames import username_index
+
+
+# ==== AUTHENTICATION CACHE ====
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_user(sender, instance, **kwargs):
+    """Password, is_active and staff changes must reach the next request."""
+    forget_user(instance.pk)
+
+
+@receiver(user_logged_in)
+def cache_signed_in_user(sender, request, user, **kwargs):
+    # Runs after Django's update_last_login, which saved (and forgot) the user
+    remember_user(user)
+
+
+# ==== USERNAME INDEX ====
+
+@receiver(post_save, sender=User)
+def index_username(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw or (update_fields is not None and 'username' not in update_fields):
+        return  # e.g. the last_login update on every sign-in
+    user_id, username = instance.pk, instance.username
+    transaction.on_commit(lambda: username_index.user_saved(user_id, username))
+
+
+@receiver(post_delete, sender=User)
+def unindex_username(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: username_index.user_deleted(user_id))
+
+
+# ==== SEARCH INDEX ====
+
+@receiver(post_save, sender=Book)
+def index_saved_book(sender, instance, using, raw=False, **kwargs):
+    """Keep the full-text index in step with every saved book."""
+    if raw:
+        return
+    search.index_books([instance], using=using)
+
+
+@receiver(post_delete, sender=Book)
+def unindex_deleted_book(sender, instance, using, **kwargs):
+    search.remove_books([instance.pk], using=using)
+
+
+# ==== GROUP PROGRESS STATS ====
+
+@receiver(post_save, sender=ReadingProgress)
+@receiver(post_delete, sender=ReadingProgress)
+@receiver(post_save, sender=GroupMembership)
+@receiver(post_delete, sender=GroupMembership)
+def invalidate_group_progress(sender, instance, using, **kwargs):
+    """Progress or membership changed: cached stats for the group are stale.
+
+    The bump waits for the commit. Bumped earlier, a concurrent stats request
+    could read the new version, compute from the old rows and cache them
+    under the new key.
+    """
+    if instance.group_id is not None:
+        group_id = instance.group_id
+        transaction.on_commit(lambda: bump_version("group-progress", group_id), using=using)
+
+
+@receiver(post_save, sender=ReadingGroup)
+def invalidate_group_schedule(sender, instance, using, created=False, **kwargs):
+    if not created:
+        group_id = instance.pk
+        transaction.on_commit(lambda: bump_version("group-progress", group_id), using=using)
+
+
+# ==== CATALOG VERSIONS (HTTP validators) ====
+# Bumped on commit: a request that saw the new version before the commit
+# would send the old data under the new ETag and clients would keep it.
+
+def _bump_on_commit(using, *versions):
+    transaction.on_commit(lambda: [bump_version(*version) for version in versions], using=using)
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def bump_book_versions(sender, instance, using, **kwargs):
+    _bump_on_commit(using, ("catalog",), ("book", instance.pk))
+
+
+@receiver(post_save, sender=Chapter)
+@receiver(post_delete, sender=Chapter)
+def bump_chapter_book_version(sender, instance, using, **kwargs):
+    _bump_on_commit(using, ("book", instance.book_id))
+
+
+@receiver(post_save, sender=ReadingGroup)
+@receiver(post_delete, sender=ReadingGroup)
+def bump_book_groups_version(sender, instance, using, **kwargs):
+    _bump_on_commit(using, ("book-groups", instance.book_id))
+
+
+@receiver(post_save, sender=GroupMembership)
+@receiver(post_delete, sender=GroupMembership)
+def bump_membership_book_groups_version(sender, instance, using, **kwargs):
+    """A join or leave changes the group's member_count shown on its book page."""
+    book_id = ReadingGroup.objects.filter(pk=instance.group_id).values_list("book_id", flat=True).first()
+    if book_id is not None:
+        _bump_on_commit(using, ("book-groups", book_id))
+
+
+# ==== REACTION COUNTS ====
+
+@receiver(post_save, sender=Reaction)
+def count_added_reaction(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        reactions.adjust_count(instance.post_id, instance.emoji, 1)
+
+
+@receiver(post_delete, sender=Reaction)
+def count_removed_reaction(sender, instance, origin=None, **kwargs):
+    # post_delete is sent even when the row was already gone; Reaction
+    # querysets are counted by their caller from the rows actually deleted
+    if isinstance(origin, QuerySet) and origin.model is Reaction:
+        return
+    reactions.adjust_count(instance.post_id, instance.emoji, -1)
+
+
+# ==== COMMENT COUNTS ====
+
+@receiver(post_save, sender=Comment)
+def count_added_comment(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        DiscussionPost.objects.filter(pk=instance.post_id).update(comment_count=F("comment_count") + 1)
+
+
+@receiver(post_delete, sender=Comment)
+def count_removed_comment(sender, instance, **kwargs):
+    DiscussionPost.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F("comment_count") - 1
+    )
+
+
+# ==== NOTIFICATIONS (fan-out on write) ====
+
+@receiver(post_save, sender=DiscussionPost)
+def notify_new_post(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        notifications.notify_new_post(instance)
+
+
+@receiver(post_save, sender=Comment)
+def notify_new_comment(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        notifications.notify_new_comment(instance)
+
+
+@receiver(post_save, sender=GroupMembership)
+def notify_member_joined(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        notifications.notify_member_joined(instance)
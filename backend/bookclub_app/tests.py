@@ -1,9 +1,49 @@
 # Create your tests here.
 # bookclub_app/tests.py
-from django.test import TestCase
+import asyncio
+import datetime
+import decimal
+import gzip
+import json
+import os
+import random
+import tempfile
+import threading
+from io import StringIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, connections, transaction
+from django.db.models.signals import pre_delete
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
-from rest_framework.test import APITestCase
-from .models import Book, ReadingGroup
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+from bookclub.db import ReadReplicaRouter, sqlite_database
+
+from . import benchmarking, reactions, search, views
+from .caching import bump_version, get_version
+from .checks import check_shared_cache
+from .importing import CatalogImport
+from .models import (
+    Book, Chapter, ChapterSchedule, Comment, DiscussionPost, GroupMembership, Notification,
+    NotificationInbox, Reaction, ReactionCount, ReadingGroup, ReadingProgress,
+)
+from .instrumentation import RequestMetrics, _current as current_request_metrics, registry as metrics_registry
+from .notifications import queue_deadline_reminders
+from .pagination import KeysetPagination
+from .progress_buffer import progress_buffer
+from .renderers import FastJSONRenderer
+from .realtime import LocalBroker, event_stream, get_broker, group_channel
+from .row_serializers import RowSerializer
+from .serializers import BookSerializer, DiscussionPostSerializer, ReadingGroupSerializer, ReadingProgressSerializer
+from .throttling import UsernameCheckThrottle
+from .usernames import BloomFilter, username_index
 
 class AuthTests(APITestCase):
     def test_register(self):
@@ -33,4 +73,1701 @@ class BookTests(APITestCase):
     def test_book_list(self):
         response = self.client.get('/api/books/')
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
\ No newline at end of file
+        self.assertEqual(len(response.data), 1)
+
+class BookSearchTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        self.hobbit = Book.objects.create(
+            title="The Hobbit", author="J.R.R. Tolkien", genre="Fantasy",
+            description="A hobbit goes on an adventure.", total_pages=300, total_chapters=19
+        )
+        self.dune = Book.objects.create(
+            title="Dune", author="Frank Herbert", genre="Science Fiction",
+            description="Spice, sandworms and a desert planet.", total_pages=600, total_chapters=48
+        )
+
+    def search(self, term, **params):
+        response = self.client.get('/api/books/', {'search': term, **params})
+        self.assertEqual(response.status_code, 200)
+        return [book['title'] for book in response.data]
+
+    def test_matches_title_author_and_description(self):
+        self.assertEqual(self.search('hobbit'), ["The Hobbit"])
+        self.assertEqual(self.search('herbert'), ["Dune"])
+        self.assertEqual(self.search('sandworms'), ["Dune"])
+
+    def test_prefix_match_for_search_as_you_type(self):
+        self.assertEqual(self.search('tolk'), ["The Hobbit"])
+
+    def test_all_words_must_match(self):
+        self.assertEqual(self.search('desert hobbit'), [])
+
+    def test_genre_filter_combines_with_search(self):
+        self.assertEqual(self.search('a', genre='fantasy'), ["The Hobbit"])
+
+    def test_ranks_title_hits_first(self):
+        Book.objects.create(
+            title="Notes", author="Anon", genre="Essay",
+            description="On the hobbit and other tales", total_pages=10, total_chapters=1
+        )
+        self.assertEqual(self.search('hobbit')[0], "The Hobbit")
+
+    def test_index_follows_updates_and_deletes(self):
+        self.dune.title = "Children of Dune"
+        self.dune.save()
+        self.assertEqual(self.search('children'), ["Children of Dune"])
+
+        self.dune.delete()
+        self.assertEqual(self.search('dune'), [])
+
+    def test_rebuild_command_indexes_bulk_created_books(self):
+        Book.objects.bulk_create([Book(
+            title="Emma", author="Jane Austen", genre="Classic",
+            description="Matchmaking in Highbury.", total_pages=400, total_chapters=55
+        )])
+        self.assertEqual(self.search('austen'), [])
+
+        call_command('rebuild_search_index', '--incremental', stdout=StringIO())
+        self.assertEqual(self.search('austen'), ["Emma"])
+
+    def test_punctuation_only_query_returns_nothing(self):
+        self.assertEqual(self.search('"*'), [])
+
+
+class KeysetPaginationTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=10
+        )
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=self.book, creator=self.user,
+            start_date="2025-01-01", end_date="2025-02-01"
+        )
+        GroupMembership.objects.create(user=self.user, group=self.group)
+
+    def follow(self, response, rel):
+        for part in response.get('Link', '').split(','):
+            if f'rel="{rel}"' in part:
+                url = part.split(';')[0].strip()[1:-1]
+                return self.client.get(url)
+        return None
+
+    def test_walks_book_list_forwards_and_backwards(self):
+        for i in range(6):
+            Book.objects.create(
+                title=f"Title {i}", author="A", genre="G", description="...",
+                total_pages=10, total_chapters=1
+            )
+        first = self.client.get('/api/books/', {'page_size': 3})
+        second = self.follow(first, 'next')
+        third = self.follow(second, 'next')
+        titles = [b['title'] for page in (first, second, third) for b in page.data]
+        self.assertEqual(titles, ["Book"] + [f"Title {i}" for i in range(6)])
+        self.assertIsNone(self.follow(third, 'next'))
+
+        back = self.follow(third, 'prev')
+        self.assertEqual(back.data, second.data)
+        self.assertIsNone(self.follow(first, 'prev'))
+
+    def test_discussion_is_newest_first_without_duplicates(self):
+        posts = [
+            DiscussionPost.objects.create(group=self.group, author=self.user, content=str(i))
+            for i in range(5)
+        ]
+        # Identical timestamps must still paginate cleanly on the id tiebreak.
+        DiscussionPost.objects.update(created_at=posts[0].created_at)
+
+        url = f'/api/groups/{self.group.id}/discussion/'
+        response = self.client.get(url, {'page_size': 2})
+        seen = []
+        while response is not None:
+            seen.extend(post['id'] for post in response.data)
+            response = self.follow(response, 'next')
+        self.assertEqual(seen, [post.id for post in reversed(posts)])
+
+    def test_invalid_cursor_is_404(self):
+        response = self.client.get('/api/books/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_catalog_pages_seek_the_title_index(self):
+        for i in range(4):
+            Book.objects.create(title=f"Title {i}", author="A", genre="G", description="...",
+                                total_pages=10, total_chapters=1)
+        first = self.client.get('/api/books/', {'page_size': 2})
+        with CaptureQueriesContext(connection) as queries:
+            self.follow(first, 'next')
+        page_query = next(q['sql'] for q in queries.captured_queries if 'bookclub_app_book' in q['sql'])
+        with connection.cursor() as cursor:
+            plan = [row[-1] for row in cursor.execute(f"EXPLAIN QUERY PLAN {page_query}").fetchall()]
+        # A range read that starts at the cursor, not a scan or sort of the table
+        self.assertEqual(plan, ['SEARCH bookclub_app_book USING INDEX book_title_idx (title>?)'])
+
+    def test_cursor_with_wrongly_typed_values_is_404(self):
+        paginator = KeysetPagination(('title', 'id'))
+        for values in (["Book", "abc"], ["Book", None], ["Book", [1]], ["Book", {"id": 1}]):
+            with self.subTest(values=values):
+                cursor = paginator.encode_cursor(values, reverse=False)
+                self.assertEqual(self.client.get('/api/books/', {'cursor': cursor}).status_code, 404)
+        group_cursor = KeysetPagination(('created_at', 'id')).encode_cursor(["yesterday", 1], reverse=False)
+        self.assertEqual(self.client.get('/api/groups/', {'cursor': group_cursor}).status_code, 404)
+        search_cursor = KeysetPagination(('search_rank', 'id')).encode_cursor(["best", 1], reverse=False)
+        self.assertEqual(self.client.get('/api/books/', {'search': 'book', 'cursor': search_cursor}).status_code, 404)
+
+
+class DiscussionQueryCountTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=10
+        )
+        self.chapter = Chapter.objects.create(book=book, chapter_number=1, title="One")
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=book, creator=self.user,
+            start_date="2025-01-01", end_date="2025-02-01"
+        )
+        GroupMembership.objects.create(user=self.user, group=self.group)
+
+    def add_posts(self, count):
+        for i in range(count):
+            author = User.objects.create_user(f'author{DiscussionPost.objects.count()}')
+            post = DiscussionPost.objects.create(
+                group=self.group, author=author, chapter=self.chapter, content="Post"
+            )
+            Comment.objects.create(post=post, author=author, content="Reply")
+            Comment.objects.create(post=post, author=self.user, content="Reply")
+            Reaction.objects.create(post=post, user=author, emoji="👍")
+            Reaction.objects.create(post=post, user=self.user, emoji="🔥")
+
+    def count_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/groups/{self.group.id}/discussion/')
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_query_count_is_constant_as_data_grows(self):
+        self.add_posts(1)
+        small, _ = self.count_queries()
+
+        self.add_posts(20)
+        large, response = self.count_queries()
+
+        self.assertEqual(small, large)
+        self.assertEqual(len(response.data), 21)
+        self.assertEqual(response.data[0]['chapter_title'], "One")
+        self.assertEqual(len(response.data[0]['comments']), 2)
+        self.assertEqual(response.data[0]['reactions'], [
+            {'emoji': '👍', 'count': 1, 'reacted_by_me': False},
+            {'emoji': '🔥', 'count': 1, 'reacted_by_me': True},
+        ])
+
+
+class MemberCountTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=10
+        )
+
+    def create_group(self, name="Group"):
+        response = self.client.post('/api/groups/', {
+            'name': name, 'book': self.book.id,
+            'start_date': '2025-01-01', 'end_date': '2025-02-01'
+        })
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['member_count'], 1)
+        return ReadingGroup.objects.get(id=response.data['id'])
+
+    def test_join_and_leave_keep_count_in_step(self):
+        group = self.create_group()
+        other = User.objects.create_user('other', password='pass')
+        self.client.force_authenticate(other)
+
+        self.assertEqual(self.client.post(f'/api/groups/{group.id}/join/').status_code, 200)
+        self.assertEqual(self.client.post(f'/api/groups/{group.id}/join/').status_code, 400)
+        group.refresh_from_db()
+        self.assertEqual(group.member_count, 2)
+
+        self.assertEqual(self.client.post(f'/api/groups/{group.id}/leave/').status_code, 200)
+        group.refresh_from_db()
+        self.assertEqual(group.member_count, 1)
+
+    def test_join_refuses_full_group(self):
+        group = self.create_group()
+        for i in range(ReadingGroup.MAX_MEMBERS - 1):
+            self.client.force_authenticate(User.objects.create_user(f'member{i}'))
+            self.assertEqual(self.client.post(f'/api/groups/{group.id}/join/').status_code, 200)
+
+        self.client.force_authenticate(User.objects.create_user('latecomer'))
+        response = self.client.post(f'/api/groups/{group.id}/join/')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['error'], "Group is full")
+        group.refresh_from_db()
+        self.assertEqual(group.member_count, ReadingGroup.MAX_MEMBERS)
+
+    def test_group_list_query_count_does_not_grow_with_groups(self):
+        self.create_group("First")
+        with CaptureQueriesContext(connection) as one:
+            self.client.get('/api/groups/')
+        for i in range(5):
+            self.create_group(f"Group {i}")
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get('/api/groups/')
+        self.assertEqual(len(response.data), 6)
+        self.assertEqual(len(one.captured_queries), len(many.captured_queries))
+
+    def test_reconcile_command_repairs_drift(self):
+        group = self.create_group()
+        GroupMembership.objects.create(user=User.objects.create_user('sneaky'), group=group)
+        ReadingGroup.objects.filter(id=group.id).update(member_count=7)
+
+        call_command('reconcile_member_counts', stdout=StringIO())
+        group.refresh_from_db()
+        self.assertEqual(group.member_count, 2)
+
+
+class BookDetailGroupsTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=10
+        )
+
+    def make_group(self, name, start, members):
+        return ReadingGroup.objects.create(
+            name=name, book=self.book, creator=self.user,
+            start_date=start, end_date="2099-12-31", member_count=members
+        )
+
+    def test_lists_open_groups_in_start_date_order(self):
+        self.make_group("Later", "2030-01-01", 3)
+        self.make_group("Full", "2020-01-01", ReadingGroup.MAX_MEMBERS)
+        self.make_group("Empty", "2020-01-01", 0)
+        self.make_group("Sooner", "2020-06-01", 1)
+
+        response = self.client.get(f'/api/books/{self.book.id}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([g['name'] for g in response.data['available_groups']], ["Sooner", "Later"])
+
+    def test_upcoming_filter_skips_started_groups(self):
+        self.make_group("Started", "2020-01-01", 2)
+        self.make_group("Upcoming", "2099-01-01", 2)
+
+        response = self.client.get(f'/api/books/{self.book.id}/', {'upcoming': 'true'})
+        self.assertEqual([g['name'] for g in response.data['available_groups']], ["Upcoming"])
+
+    def test_groups_are_paginated(self):
+        for i in range(3):
+            self.make_group(f"Group {i}", f"2030-01-0{i + 1}", 1)
+
+        response = self.client.get(f'/api/books/{self.book.id}/', {'page_size': 2})
+        self.assertEqual(len(response.data['available_groups']), 2)
+        self.assertIn('rel="next"', response['Link'])
+
+
+class GroupProgressStatsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=10
+        )
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=self.book, creator=self.user,
+            start_date="2000-01-01", end_date="2000-02-01"
+        )
+        self.url = f'/api/groups/{self.group.id}/progress-stats/'
+        GroupMembership.objects.create(user=self.user, group=self.group)
+        self.progress = ReadingProgress.objects.create(
+            user=self.user, book=self.book, group=self.group, current_page=100
+        )
+
+    def add_member(self, username, current_page=None):
+        member = User.objects.create_user(username)
+        with self.captureOnCommitCallbacks(execute=True):
+            GroupMembership.objects.create(user=member, group=self.group)
+            if current_page is not None:
+                ReadingProgress.objects.create(
+                    user=member, book=self.book, group=self.group, current_page=current_page
+                )
+
+    def test_buckets_members(self):
+        self.add_member('behind', current_page=10)
+        self.add_member('idle')
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_members'], 3)
+        self.assertEqual(response.data['expected_progress'], 100)
+        self.assertEqual([m['username'] for m in response.data['completed']['members']], ['user'])
+        self.assertEqual(response.data['behind']['members'][0]['progress_percent'], 10.0)
+        self.assertEqual(response.data['not_started']['members'][0]['username'], 'idle')
+
+    def test_query_count_does_not_grow_with_members(self):
+        self.add_member('first', current_page=5)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(self.url)
+
+        for i in range(10):
+            self.add_member(f'member{i}', current_page=i + 1)
+        with CaptureQueriesContext(connection) as many:
+            self.client.get(self.url)
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries))
+
+    def test_cached_until_progress_changes(self):
+        first = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as cached:
+            self.assertEqual(self.client.get(self.url).data, first.data)
+        self.assertFalse(any('bookclub_app_readingprogress' in q['sql'] for q in cached.captured_queries))
+
+        self.progress.current_page = 50
+        with self.captureOnCommitCallbacks(execute=True):
+            self.progress.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['behind']['members'][0]['current_page'], 50)
+
+    def test_stats_version_changes_only_on_commit(self):
+        before = get_version('group-progress', self.group.id)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.progress.current_page = 50
+            self.progress.save()
+            self.group.name = "Renamed"
+            self.group.save()
+        # Until the commit, readers keep the old version and the old stats
+        self.assertEqual(get_version('group-progress', self.group.id), before)
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_version('group-progress', self.group.id), before)
+
+
+@override_settings(PROGRESS_WRITE_BEHIND=True, PROGRESS_FLUSH_INTERVAL=3600, PROGRESS_FLUSH_THRESHOLD=3)
+class ProgressWriteBehindTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=10
+        )
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=self.book, creator=self.user,
+            start_date="2025-01-01", end_date="2025-02-01"
+        )
+        GroupMembership.objects.create(user=self.user, group=self.group)
+        self.progress = ReadingProgress.objects.create(
+            user=self.user, book=self.book, group=self.group, reading_speed_minutes=2
+        )
+        self.url = f'/api/groups/{self.group.id}/progress/'
+        progress_buffer.flush()
+        self.addCleanup(progress_buffer.flush)
+
+    def stored_page(self):
+        self.progress.refresh_from_db()
+        return self.progress.current_page
+
+    def test_page_turns_are_buffered_with_read_your_writes(self):
+        for page in (2, 3, 4):
+            response = self.client.put(self.url, {'current_page': page})
+            self.assertEqual(response.data['current_page'], page)
+        self.assertEqual(self.stored_page(), 1)
+        self.assertEqual(self.client.get(self.url).data['current_page'], 4)
+
+        self.assertEqual(progress_buffer.flush(), 1)
+        self.assertEqual(self.stored_page(), 4)
+
+    def test_progress_list_shows_buffered_page(self):
+        self.client.put(self.url, {'current_page': 7})
+        self.assertEqual(self.stored_page(), 1)
+        [row] = self.client.get('/api/reading-progress/').data
+        self.assertEqual((row['id'], row['current_page']), (self.progress.id, 7))
+        self.assertEqual(row['last_read_at'], self.client.get(self.url).data['last_read_at'])
+
+    def test_threshold_triggers_batched_flush(self):
+        for i in range(3):
+            user = User.objects.create_user(f'reader{i}')
+            GroupMembership.objects.create(user=user, group=self.group)
+            ReadingProgress.objects.create(user=user, book=self.book, group=self.group)
+            self.client.force_authenticate(user)
+            self.client.put(self.url, {'current_page': 10 + i})
+
+        self.assertEqual(len(progress_buffer), 0)
+        pages = ReadingProgress.objects.filter(user__username__startswith='reader')
+        self.assertEqual(sorted(pages.values_list('current_page', flat=True)), [10, 11, 12])
+
+    def test_other_updates_are_written_immediately_and_keep_buffered_page(self):
+        self.client.put(self.url, {'current_page': 7})
+        response = self.client.put(self.url, {'chapter_status': 'completed'})
+        self.assertEqual(response.status_code, 200)
+
+        self.progress.refresh_from_db()
+        self.assertEqual((self.progress.current_page, self.progress.chapter_status), (7, 'completed'))
+        self.assertEqual(len(progress_buffer), 0)
+
+    def test_rejects_non_integer_page(self):
+        response = self.client.put(self.url, {'current_page': 'ten'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_update_keeps_buffered_page(self):
+        self.client.put(self.url, {'current_page': 7})
+        response = self.client.put(self.url, {'chapter_status': 'unknown'})
+        self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(len(progress_buffer), 1)
+        progress_buffer.flush()
+        self.assertEqual(self.stored_page(), 7)
+
+    def test_flush_in_flight_does_not_overwrite_direct_save(self):
+        self.client.put(self.url, {'current_page': 7})
+
+        def save_during_flush(entries):
+            # The batch has left the pending map; a direct save lands first
+            response = self.client.put(self.url, {'current_page': 9, 'chapter_status': 'completed'})
+            self.assertEqual(response.data['current_page'], 9)
+            write(entries)
+
+        write = progress_buffer._write
+        progress_buffer._write = save_during_flush
+        self.addCleanup(delattr, progress_buffer, '_write')
+        progress_buffer.flush()
+
+        self.assertEqual(self.stored_page(), 9)
+        self.assertEqual(self.client.get(self.url).data['current_page'], 9)
+
+
+class DashboardTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=200, total_chapters=2
+        )
+        self.chapters = [
+            Chapter.objects.create(book=self.book, chapter_number=n, title=f"Chapter {n}")
+            for n in (1, 2)
+        ]
+
+    def join_new_group(self, name):
+        group = ReadingGroup.objects.create(
+            name=name, book=self.book, creator=self.user,
+            start_date="2025-01-01", end_date="2025-03-01", member_count=1
+        )
+        GroupMembership.objects.create(user=self.user, group=group)
+        return group
+
+    def test_returns_progress_and_next_deadline(self):
+        started = self.join_new_group("Started")
+        untouched = self.join_new_group("Untouched")
+        ReadingProgress.objects.create(user=self.user, book=self.book, group=started, current_page=50)
+        ChapterSchedule.objects.create(
+            user=self.user, group=started, chapter=self.chapters[0],
+            target_completion_date="2025-01-10", completed=True
+        )
+        ChapterSchedule.objects.create(
+            user=self.user, group=started, chapter=self.chapters[1], target_completion_date="2025-01-20"
+        )
+
+        response = self.client.get('/api/dashboard/')
+        self.assertEqual(response.status_code, 200)
+        first, second = response.data['groups']
+        self.assertEqual(first['name'], "Started")
+        self.assertEqual(first['progress']['percentage'], 25)
+        self.assertEqual(first['book_details']['total_pages'], 200)
+        self.assertEqual(first['next_deadline']['chapter_title'], "Chapter 2")
+        self.assertIsNone(second['progress'])
+        self.assertIsNone(second['next_deadline'])
+        self.assertFalse(ReadingProgress.objects.filter(group=untouched).exists())
+
+    def test_query_count_does_not_grow_with_groups(self):
+        group = self.join_new_group("One")
+        ReadingProgress.objects.create(user=self.user, book=self.book, group=group)
+        with CaptureQueriesContext(connection) as one:
+            self.client.get('/api/dashboard/')
+
+        for i in range(10):
+            group = self.join_new_group(f"Group {i}")
+            ReadingProgress.objects.create(user=self.user, book=self.book, group=group)
+            ChapterSchedule.objects.create(
+                user=self.user, group=group, chapter=self.chapters[0], target_completion_date="2025-02-01"
+            )
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get('/api/dashboard/')
+        self.assertEqual(len(response.data['groups']), 11)
+        self.assertEqual(len(one.captured_queries), len(many.captured_queries))
+
+
+class ChapterScheduleBulkTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=3
+        )
+        self.chapters = [
+            Chapter.objects.create(book=self.book, chapter_number=n, title=f"Chapter {n}")
+            for n in range(1, 31)
+        ]
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=self.book, creator=self.user,
+            start_date="2025-01-01", end_date="2025-02-01"
+        )
+        GroupMembership.objects.create(user=self.user, group=self.group)
+        self.url = f'/api/groups/{self.group.id}/chapter-schedules/'
+
+    def post(self, schedules):
+        return self.client.post(self.url, {'schedules': schedules}, format='json')
+
+    def test_creates_then_updates_and_reports_item_errors(self):
+        first = self.chapters[0]
+        ChapterSchedule.objects.create(
+            user=self.user, group=self.group, chapter=first,
+            target_completion_date="2025-01-05", completed=True
+        )
+
+        response = self.post([
+            {'chapter': first.id, 'target_completion_date': '2025-01-06'},
+            {'chapter': self.chapters[1].id, 'target_completion_date': '2025-01-07'},
+            {'chapter': 999999, 'target_completion_date': '2025-01-07'},
+            {'chapter': self.chapters[2].id, 'target_completion_date': '2030-01-01'},
+            {'chapter': self.chapters[3].id},
+        ])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['errors'], [
+            "Chapter 999999 not found",
+            "Chapter 3: Date must be between 2025-01-01 and 2025-02-01",
+            "Missing chapter or date in schedule",
+        ])
+        updated = response.data['schedules'][0]
+        self.assertEqual((updated['chapter_number'], updated['completed']), (1, True))
+        self.assertEqual(updated['target_completion_date'], '2025-01-06')
+        self.assertEqual(ChapterSchedule.objects.filter(user=self.user).count(), 2)
+
+    def test_all_invalid_is_400(self):
+        response = self.post([{'chapter': 999999, 'target_completion_date': '2025-01-07'}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['created'], 0)
+
+    def test_query_count_does_not_grow_with_chapters(self):
+        def schedules(chapters):
+            return [{'chapter': c.id, 'target_completion_date': '2025-01-10'} for c in chapters]
+
+        with CaptureQueriesContext(connection) as few:
+            self.post(schedules(self.chapters[:2]))
+        with CaptureQueriesContext(connection) as many:
+            response = self.post(schedules(self.chapters))
+        self.assertEqual(response.data['created'], 30)
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries))
+
+
+class GroupMembershipPermissionTests(APITestCase):
+    def setUp(self):
+        owner = User.objects.create_user('owner')
+        self.outsider = User.objects.create_user('outsider', password='pass')
+        self.client.login(username='outsider', password='pass')
+        book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=1
+        )
+        chapter = Chapter.objects.create(book=book, chapter_number=1, title="One")
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=book, creator=owner,
+            start_date="2025-01-01", end_date="2025-02-01"
+        )
+        GroupMembership.objects.create(user=owner, group=self.group)
+        self.post = DiscussionPost.objects.create(group=self.group, author=owner, content="Hi")
+        self.schedule = ChapterSchedule.objects.create(
+            user=self.outsider, group=self.group, chapter=chapter, target_completion_date="2025-01-10"
+        )
+
+    def test_non_members_get_403_with_error_body(self):
+        responses = [
+            self.client.get(f'/api/groups/{self.group.id}/'),
+            self.client.get(f'/api/groups/{self.group.id}/discussion/'),
+            self.client.post(f'/api/posts/{self.post.id}/comments/', {'content': 'Hi'}),
+            self.client.post(f'/api/posts/{self.post.id}/reactions/', {'emoji': '👍'}),
+            self.client.delete(f'/api/groups/{self.group.id}/chapter-schedules/{self.schedule.id}/'),
+        ]
+        for response in responses:
+            self.assertEqual(response.status_code, 403)
+            self.assertEqual(response.data, {'error': "Not a member of this group"})
+        self.assertTrue(ChapterSchedule.objects.filter(id=self.schedule.id).exists())
+
+    def test_missing_objects_get_404_with_error_body(self):
+        response = self.client.get('/api/groups/999999/')
+        self.assertEqual((response.status_code, response.data), (404, {'error': "Group not found"}))
+        response = self.client.post('/api/posts/999999/reactions/', {'emoji': '👍'})
+        self.assertEqual((response.status_code, response.data), (404, {'error': "Post not found"}))
+
+    def test_member_check_and_group_load_share_one_query(self):
+        GroupMembership.objects.create(user=self.outsider, group=self.group)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/groups/{self.group.id}/chapters/')
+        self.assertEqual(response.status_code, 200)
+        group_queries = [q for q in ctx.captured_queries if 'bookclub_app_readinggroup' in q['sql']]
+        self.assertEqual(len(group_queries), 1)
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=1
+        )
+        self.chapter = Chapter.objects.create(book=self.book, chapter_number=1, title="One")
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=self.book, creator=self.user,
+            start_date="2025-01-01", end_date="2025-02-01", member_count=1
+        )
+        GroupMembership.objects.create(user=self.user, group=self.group)
+
+    def revalidate(self, url):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('private', first['Cache-Control'])
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        return first, second, ctx.captured_queries
+
+    def test_book_list_304_skips_catalog_queries(self):
+        first, second, queries = self.revalidate('/api/books/')
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertFalse(any('bookclub_app_book' in q['sql'] for q in queries))
+
+        self.book.title = "Renamed"
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.book.save()
+        # Not committed yet: the old ETag still holds
+        self.assertEqual(self.client.get('/api/books/', HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+        for callback in callbacks:
+            callback()
+        response = self.client.get('/api/books/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_is_the_only_validator(self):
+        first = self.client.get('/api/books/')
+        self.assertNotIn('Last-Modified', first)
+        # A date cannot tell apart two versions issued within the same second
+        response = self.client.get('/api/books/', HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, 200)
+
+    def test_racing_bumps_all_produce_new_versions(self):
+        first = get_version('catalog')
+        versions = {bump_version('catalog') for _ in range(5)}
+        self.assertEqual(len(versions), 5)
+        self.assertNotIn(first, versions)
+        cache.delete('version:catalog:')
+        self.assertNotIn(bump_version('catalog'), versions | {first})
+
+    def test_production_profile_on_locmem_warns(self):
+        with override_settings(DB_PROFILE='production'):
+            self.assertEqual([w.id for w in check_shared_cache(None)], ['bookclub_app.W001'])
+            with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache'}}):
+                self.assertEqual(check_shared_cache(None), [])
+
+    def test_book_detail_changes_when_a_member_joins(self):
+        first, second, _ = self.revalidate(f'/api/books/{self.book.id}/')
+        self.assertEqual(second.status_code, 304)
+
+        self.client.force_authenticate(User.objects.create_user('joiner'))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/groups/{self.group.id}/join/')
+        response = self.client.get(f'/api/books/{self.book.id}/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['available_groups'][0]['member_count'], 2)
+
+    def test_group_chapters_checks_membership_before_304(self):
+        url = f'/api/groups/{self.group.id}/chapters/'
+        first, second, _ = self.revalidate(url)
+        self.assertEqual(second.status_code, 304)
+
+        self.client.force_authenticate(User.objects.create_user('outsider'))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 403)
+
+    def test_group_chapters_changes_with_chapters(self):
+        first = self.client.get(f'/api/groups/{self.group.id}/chapters/')
+        with self.captureOnCommitCallbacks(execute=True):
+            Chapter.objects.create(book=self.book, chapter_number=2, title="Two")
+        response = self.client.get(f'/api/groups/{self.group.id}/chapters/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['chapters']), 2)
+
+
+class LocalBrokerTests(TestCase):
+    def test_delivers_to_channel_listeners_only(self):
+        async def scenario():
+            broker = LocalBroker()
+            with broker.subscribe('group:1') as mine, broker.subscribe('group:2') as other:
+                broker.publish('group:1', ('post_created', '{}'))
+                received = await asyncio.wait_for(mine.get(), 1)
+                self.assertTrue(other.queue.empty())
+            self.assertEqual(broker.listener_count('group:1'), 0)
+            return received
+
+        self.assertEqual(asyncio.run(scenario()), ('post_created', '{}'))
+
+    def test_slow_listener_gets_resync(self):
+        async def scenario():
+            broker = LocalBroker(max_queued=2)
+            with broker.subscribe('group:1') as listener:
+                for i in range(3):
+                    broker.publish('group:1', ('post_created', str(i)))
+                await asyncio.sleep(0)
+                return [listener.queue.get_nowait() for _ in range(listener.queue.qsize())]
+
+        self.assertEqual(asyncio.run(scenario()), [('resync', '{}')])
+
+
+class DiscussionPushTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.login(username='user', password='pass')
+        book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=1
+        )
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=book, creator=self.user,
+            start_date="2025-01-01", end_date="2025-02-01"
+        )
+        GroupMembership.objects.create(user=self.user, group=self.group)
+
+    def test_writes_publish_deltas_after_commit(self):
+        published = []
+        broker = get_broker()
+        original, broker.publish = broker.publish, lambda channel, event: published.append((channel, event))
+        self.addCleanup(setattr, broker, 'publish', original)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post_id = self.client.post(
+                f'/api/groups/{self.group.id}/discussion/', {'content': 'Hello'}
+            ).data['id']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/posts/{post_id}/comments/', {'content': 'Hi'})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/posts/{post_id}/reactions/', {'emoji': '👍'})
+
+        self.assertEqual({channel for channel, _ in published}, {group_channel(self.group.id)})
+        types = [event_type for _, (event_type, _) in published]
+        self.assertEqual(types, ['post_created', 'comment_created', 'reaction_toggled'])
+        reaction = json.loads(published[2][1][1])
+        self.assertEqual((reaction['post_id'], reaction['action']), (post_id, 'added'))
+
+    def test_event_stream_frames(self):
+        async def scenario():
+            stream = event_stream(self.group.id, heartbeat=0.05)
+            frames = [await anext(stream)]
+            frames.append(await anext(stream))
+            get_broker().publish(group_channel(self.group.id), ('post_created', '{"post": {}}'))
+            frames.append(await anext(stream))
+            await stream.aclose()
+            return frames
+
+        self.assertEqual(asyncio.run(scenario()), [
+            'retry: 3000\n\n',
+            ': keep-alive\n\n',
+            'event: post_created\ndata: {"post": {}}\n\n',
+        ])
+
+    async def test_events_endpoint_requires_membership(self):
+        outsider = await User.objects.acreate(username='outsider')
+        await self.async_client.aforce_login(outsider)
+        response = await self.async_client.get(f'/api/groups/{self.group.id}/events/')
+        self.assertEqual(response.status_code, 403)
+
+    async def test_events_endpoint_streams_for_members(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(f'/api/groups/{self.group.id}/events/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        first = await anext(response.streaming_content)
+        self.assertEqual(first, b'retry: 3000\n\n')
+        await response.streaming_content.aclose()
+
+
+class NotificationTests(APITestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user('alice', password='pass')
+        self.bob = User.objects.create_user('bob', password='pass')
+        self.carol = User.objects.create_user('carol', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=1
+        )
+        self.chapter = Chapter.objects.create(book=self.book, chapter_number=1, title="Chapter 1")
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=self.book, creator=self.alice,
+            start_date="2025-01-01", end_date="2025-02-01", member_count=2
+        )
+        GroupMembership.objects.create(user=self.alice, group=self.group)
+        GroupMembership.objects.create(user=self.bob, group=self.group)
+        Notification.objects.all().delete()
+        NotificationInbox.objects.all().delete()
+
+    def unread(self, user):
+        self.client.force_authenticate(user)
+        return self.client.get('/api/notifications/unread-count/').data['unread_count']
+
+    def test_post_notifies_other_members(self):
+        self.client.force_authenticate(self.alice)
+        self.client.post(f'/api/groups/{self.group.id}/discussion/', {'content': 'Chapter one thoughts'})
+
+        self.assertEqual(self.unread(self.alice), 0)
+        self.assertEqual(self.unread(self.bob), 1)
+        response = self.client.get('/api/notifications/')
+        self.assertEqual([n['kind'] for n in response.data], ['new_post'])
+        self.assertEqual(response.data[0]['actor_name'], 'alice')
+        self.assertEqual(response.data[0]['group'], self.group.id)
+        self.assertFalse(response.data[0]['is_read'])
+
+    def test_comment_notifies_thread_participants(self):
+        post = DiscussionPost.objects.create(group=self.group, author=self.alice, content="Post")
+        GroupMembership.objects.create(user=self.carol, group=self.group)
+        Notification.objects.all().delete()
+        NotificationInbox.objects.all().delete()
+
+        self.client.force_authenticate(self.bob)
+        self.client.post(f'/api/posts/{post.id}/comments/', {'content': 'Reply'})
+        self.assertEqual(self.unread(self.alice), 1)
+        self.assertEqual(self.unread(self.bob), 0)
+        self.assertEqual(self.unread(self.carol), 0)
+
+        self.client.force_authenticate(self.alice)
+        self.client.post(f'/api/posts/{post.id}/comments/', {'content': 'Thanks'})
+        self.assertEqual(self.unread(self.bob), 1)
+
+    def test_join_notifies_existing_members(self):
+        self.client.force_authenticate(self.carol)
+        self.client.post(f'/api/groups/{self.group.id}/join/')
+        self.assertEqual(self.unread(self.alice), 1)
+        self.assertEqual(self.unread(self.bob), 1)
+        self.assertEqual(self.unread(self.carol), 0)
+        self.assertEqual(Notification.objects.get(recipient=self.bob).kind, Notification.MEMBER_JOINED)
+
+    def test_list_is_paginated_and_filterable(self):
+        for n in range(3):
+            DiscussionPost.objects.create(group=self.group, author=self.alice, content=f"Post {n}")
+        self.client.force_authenticate(self.bob)
+        first = Notification.objects.filter(recipient=self.bob).order_by('id').first()
+        self.client.post('/api/notifications/read/', {'ids': [first.id]}, format='json')
+
+        response = self.client.get('/api/notifications/?page_size=2')
+        self.assertEqual(len(response.data), 2)
+        self.assertIn('rel="next"', response['Link'])
+        unread = self.client.get('/api/notifications/?unread=true')
+        self.assertNotIn(first.id, [n['id'] for n in unread.data])
+        self.assertEqual(len(unread.data), 2)
+
+    def test_mark_read_updates_counter(self):
+        for n in range(3):
+            DiscussionPost.objects.create(group=self.group, author=self.alice, content=f"Post {n}")
+        self.client.force_authenticate(self.bob)
+        ids = list(Notification.objects.filter(recipient=self.bob).values_list('id', flat=True))
+
+        response = self.client.post('/api/notifications/read/', {'ids': ids[:1] * 2}, format='json')
+        self.assertEqual(response.data, {'marked_read': 1, 'unread_count': 2})
+        response = self.client.post('/api/notifications/read/', {'ids': ids[:1]}, format='json')
+        self.assertEqual(response.data['unread_count'], 2)
+        response = self.client.post('/api/notifications/read/', {}, format='json')
+        self.assertEqual(response.data, {'marked_read': 2, 'unread_count': 0})
+        response = self.client.post('/api/notifications/read/', {'ids': 'all'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_unread_count_is_one_query(self):
+        DiscussionPost.objects.create(group=self.group, author=self.alice, content="Post")
+        self.client.force_authenticate(self.bob)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/notifications/unread-count/')
+        self.assertEqual(response.data['unread_count'], 1)
+        self.assertEqual(len(queries), 1)
+
+    def test_deadline_reminders_are_sent_once_per_date(self):
+        schedule = ChapterSchedule.objects.create(
+            user=self.bob, group=self.group, chapter=self.chapter, target_completion_date="2025-01-10"
+        )
+        ChapterSchedule.objects.create(
+            user=self.carol, group=self.group, chapter=self.chapter, target_completion_date="2025-01-10"
+        )
+        today = datetime.date(2025, 1, 8)
+
+        self.assertEqual(len(queue_deadline_reminders(today, days_ahead=3)), 1)  # carol is not a member
+        self.assertEqual(queue_deadline_reminders(today, days_ahead=3), [])
+        self.assertEqual(self.unread(self.bob), 1)
+        self.assertIn('due in 2 day(s)', Notification.objects.get(recipient=self.bob).message)
+
+        schedule.target_completion_date = datetime.date(2025, 1, 9)
+        schedule.save()
+        self.assertEqual(len(queue_deadline_reminders(today, days_ahead=3)), 1)
+        schedule.completed = True
+        schedule.save()
+        self.assertEqual(queue_deadline_reminders(datetime.date(2025, 1, 9), days_ahead=0), [])
+
+    def test_reconcile_unread_counts(self):
+        DiscussionPost.objects.create(group=self.group, author=self.alice, content="Post")
+        NotificationInbox.objects.filter(user=self.bob).update(unread_count=7)
+        out = StringIO()
+        call_command('reconcile_unread_counts', stdout=out)
+        self.assertIn('bob', out.getvalue())
+        self.assertEqual(NotificationInbox.objects.get(user=self.bob).unread_count, 1)
+
+
+class AsyncReadPathTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.outsider = User.objects.create_user('outsider', password='pass')
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=1
+        )
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=self.book, creator=self.user,
+            start_date="2025-01-01", end_date="2025-02-01", member_count=1
+        )
+        GroupMembership.objects.create(user=self.user, group=self.group)
+        ReadingProgress.objects.create(user=self.user, book=self.book, group=self.group, current_page=40)
+        for n in range(3):
+            post = DiscussionPost.objects.create(group=self.group, author=self.user, content=f"Post {n}")
+            Comment.objects.create(post=post, author=self.user, content="Reply")
+        cache.clear()
+
+    def sync_response(self, view, path, **kwargs):
+        request = APIRequestFactory().get(path)
+        force_authenticate(request, self.user)
+        response = view(request, **kwargs)
+        response.render()
+        return response
+
+    def test_matches_the_sync_views(self):
+        self.client.force_authenticate(self.user)
+        group = self.group.id
+        cases = [
+            (views.book_list, '/api/books/', {}),
+            (views.group_detail, f'/api/groups/{group}/', {'group_id': group}),
+            (views.group_discussion, f'/api/groups/{group}/discussion/?page_size=2', {'group_id': group}),
+            (views.group_progress_stats, f'/api/groups/{group}/progress-stats/', {'group_id': group}),
+            (views.dashboard, '/api/dashboard/', {}),
+        ]
+        for view, path, kwargs in cases:
+            with self.subTest(path=path):
+                expected = self.sync_response(view, path, **kwargs)
+                cache.clear()
+                response = self.client.get(path)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response['Content-Type'], 'application/json')
+                self.assertEqual(response.json(), json.loads(expected.content))
+                self.assertEqual(response.get('Link'), expected.get('Link'))
+
+    def test_errors_match_the_sync_views(self):
+        self.client.force_authenticate(self.outsider)
+        response = self.client.get(f'/api/groups/{self.group.id}/discussion/')
+        self.assertEqual((response.status_code, response.json()), (403, {'error': 'Not a member of this group'}))
+        response = self.client.get('/api/groups/9999/')
+        self.assertEqual((response.status_code, response.json()), (404, {'error': 'Group not found'}))
+
+        self.client.force_authenticate(None)
+        response = self.client.get('/api/dashboard/')
+        self.assertEqual(response.status_code, 403)
+        self.assertIn('detail', response.json())
+
+    def test_writes_still_go_to_the_drf_view(self):
+        self.client.login(username='user', password='pass')
+        response = self.client.post(f'/api/groups/{self.group.id}/discussion/', {'content': 'New'})
+        self.assertEqual(response.status_code, 201)
+        response = self.client.post('/api/books/', {})
+        self.assertEqual(response.status_code, 405)
+
+    async def test_serves_session_users_on_the_event_loop(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(f'/api/groups/{self.group.id}/discussion/?page_size=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+        self.assertIn('rel="next"', response['Link'])
+
+        response = await self.async_client.get(f'/api/groups/{self.group.id}/progress-stats/')
+        self.assertEqual(response.json()['total_members'], 1)
+
+
+class ReadReplicaRouterTests(TransactionTestCase):
+    def test_reads_use_the_replica_outside_transactions(self):
+        router = ReadReplicaRouter()
+        self.assertEqual(router.db_for_read(Book), 'replica')
+        self.assertEqual(router.db_for_write(Book), 'default')
+        with transaction.atomic():
+            self.assertEqual(router.db_for_read(Book), 'default')
+        self.assertFalse(router.allow_migrate('replica', 'bookclub_app'))
+        self.assertTrue(router.allow_migrate('default', 'bookclub_app'))
+
+
+class SqliteProductionProfileTests(SimpleTestCase):
+    scratch_aliases = {'profile_rw', 'profile_ro', 'stress_production', 'stress_production_read'}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Scratch databases created on the fly, never the project database
+        cls.databases = frozenset(cls.databases) | cls.scratch_aliases
+
+    def test_profile_pragmas_and_stress_run(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = f'{directory}/profile.sqlite3'
+            for alias, read_only in (('profile_rw', False), ('profile_ro', True)):
+                connections.settings[alias] = connections.configure_settings(
+                    {'default': connections.settings['default'], alias: sqlite_database(path, read_only=read_only)}
+                )[alias]
+                self.addCleanup(connections.settings.pop, alias)
+                self.addCleanup(connections[alias].close)
+
+            with connections['profile_rw'].cursor() as cursor:
+                self.assertEqual(cursor.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+                self.assertEqual(cursor.execute('PRAGMA synchronous').fetchone()[0], 1)  # NORMAL
+                cursor.execute('CREATE TABLE t (a)')
+            self.assertEqual(connections['profile_rw'].transaction_mode, 'IMMEDIATE')
+            # Persistent connections are opt-in: they leak under ASGI
+            self.assertEqual(connections.settings['profile_rw']['CONN_MAX_AGE'], 0)
+            with connections['profile_ro'].cursor() as cursor:
+                self.assertEqual(cursor.execute('PRAGMA query_only').fetchone()[0], 1)
+                with self.assertRaises(Exception):
+                    cursor.execute('INSERT INTO t VALUES (1)')
+
+        out = StringIO()
+        call_command('stress_sqlite', '--profile', 'production', '--workers', '4', '--operations', '25', stdout=out)
+        self.assertRegex(out.getvalue(), r'production\s+100 ok\s+0 locked')
+
+
+@override_settings(SERVER_TIMING=True, QUERY_DUPLICATE_THRESHOLD=3)
+class RequestMetricsTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='pass')
+        self.client.force_authenticate(self.user)
+        self.book = Book.objects.create(
+            title="Book", author="Author", genre="Fiction",
+            description="...", total_pages=100, total_chapters=1
+        )
+        self.group = ReadingGroup.objects.create(
+            name="Group", book=self.book, creator=self.user,
+            start_date="2025-01-01", end_date="2025-02-01", member_count=1
+        )
+        GroupMembership.objects.create(user=self.user, group=self.group)
+        metrics_registry.reset()
+
+    def timing(self, response):
+        return {
+            part.split(';')[0].strip(): part for part in response['Server-Timing'].split(',')
+        }
+
+    def test_server_timing_header(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/notifications/')
+        timing = self.timing(response)
+        self.assertIn(f'desc="{len(queries)} queries"', timing['db'])
+        self.assertIn('serialize', timing)
+        self.assertIn('total', timing)
+
+    def test_async_view_queries_are_counted(self):
+        response = self.client.get(f'/api/groups/{self.group.id}/')
+        self.assertRegex(self.timing(response)['db'], r'desc="[1-9]\d* queries"')
+
+    def test_repeated_queries_are_logged_with_location(self):
+        # The API has no N+1 left to trip over, so play the part of a view
+        metrics = RequestMetrics()
+        metrics.view_name = 'some-view'
+        token = current_request_metrics.set(metrics)
+        try:
+            with self.assertLogs('bookclub_app.instrumentation', 'WARNING') as logs:
+                for pk in range(3):
+                    User.objects.filter(pk=pk).exists()
+        finally:
+            current_request_metrics.reset(token)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('some-view', logs.output[0])
+        self.assertIn('bookclub_app/tests.py', logs.output[0])
+
+    def test_histograms_per_view(self):
+        for _ in range(2):
+            self.client.get('/api/notifications/')
+        self.client.get('/api/notifications/unread-count/')
+
+        response = self.client.get('/api/metrics/')
+        self.assertEqual(response.status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        snapshot = self.client.get('/api/metrics/').data
+        self.assertEqual(snapshot['notification-list']['requests'], 2)
+        self.assertEqual(sum(snapshot['notification-list']['latency_ms']['buckets'].values()), 2)
+        self.assertEqual(snapshot['notification-unread-count']['queries']['buckets']['<=1'], 1)
+
+
+class BenchmarkHarnessTests(TestCase):
+    def test_seed_replay_and_compare(self):
+        rng = random.Random(7)
+        counts = benchmarking.seed(benchmarking.SCALES['tiny'], rng)
+        self.assertEqual(User.objects.count(), counts['users'])
+        self.assertEqual(DiscussionPost.objects.count(), counts['posts'])
+        self.assertEqual(
+            GroupMembership.objects.count(),
+            sum(ReadingGroup.objects.values_list('member_count', flat=True)),
+        )
+
+        samples, elapsed = benchmarking.replay(60, rng, reader_count=5, warmup=5)
+        results = benchmarking.summarize(samples, elapsed, {'scale': 'tiny'})
+        self.assertEqual(results['overall']['requests'], len(samples))
+        self.assertEqual(results['overall']['errors'], 0)
+        self.assertGreater(results['overall']['mean_queries'], 0)
+        for stats in results['endpoints'].values():
+            self.assertLessEqual(stats['p50_ms'], stats['p95_ms'])
+            self.assertLessEqual(stats['p95_ms'], stats['p99_ms'])
+        json.dumps(results)
+
+        slower = json.loads(json.dumps(results))
+        name = next(iter(slower['endpoints']))
+        slower['endpoints'][name]['mean_queries'] += 5
+        _, regressions = benchmarking.compare(results, slower)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn(name, regressions[0])
+        self.assertEqual(benchmarking.compare(results, results)[1], [])
+
+        timings = benchmarking.time_serializers(rounds=1)
+        self.assertEqual(set(timings), set(benchmarking.SERIALIZER_CASES))
+        self.assertGreater(timings['book-list']['rows'], 0)
+        rendering = benchmarking.time_rendering(rounds=1)
+        self.assertGreater(rendering['group-discussion']['rows'], 0)
+        self.assertLessEqual(rendering['group-discussion']['wire_bytes'], rendering['group-discussion']['bytes'])
+
+
+class ImportCatalogTests(TestCase):
+    def import_catalog(self, text, suffix='.ndjson', *args):
+        with tempfile.NamedTemporaryFile('w', suffix=suffix, encoding='utf-8', delete=False) as handle:
+            handle.write(text)
+        self.addCleanup(os.remove, handle.name)
+        out = StringIO()
+        call_command('import_catalog', handle.name, *args, stdout=out)
+        return out.getvalue()
+
+    def test_ndjson_import_is_idempotent(self):
+        with open(settings.BASE_DIR / 'data' / 'popular_books.ndjson', encoding='utf-8') as handle:
+            catalog = handle.read()
+        self.assertIn("Books: 6 created", self.import_catalog(catalog))
+        thief = Book.objects.get(title='The Book Thief')
+        self.assertEqual((thief.total_chapters, thief.chapters.count()), (11, 11))
+        self.assertTrue(thief.cover_image.startswith('https://'))
+        if search.fts_available():
+            self.assertEqual(list(search.search_books('zusak')), [thief])
+
+        output = self.import_catalog(catalog)
+        self.assertIn("Books: 0 created, 0 updated, 6 unchanged", output)
+        self.assertIn("Chapters: 0 created, 0 retitled", output)
+        self.assertEqual(Book.objects.count(), 6)
+
+    def test_csv_updates_existing_books_and_chapters(self):
+        book = Book.objects.create(title='Dune', author='Frank Herbert', genre='SF', description='',
+                                   total_pages=600, total_chapters=2)
+        Chapter.objects.create(book=book, chapter_number=1, title='Old title')
+        catalog_version = get_version('catalog')
+        book_version = get_version('book', book.pk)
+
+        with self.assertRaisesMessage(CommandError, "line 3: no book 'Emma' by Jane Austen"):
+            self.import_catalog(
+                'title,author,cover_image,chapters\n'
+                'Dune,Frank Herbert,https://covers.example/dune.jpg,Book One|Book Two\n'
+                'Emma,Jane Austen,,\n',
+                '.csv', '--chunk-size', '1',
+            )
+        # The first chunk was committed before the bad record
+        book.refresh_from_db()
+        self.assertEqual(book.cover_image, 'https://covers.example/dune.jpg')
+        self.assertEqual(book.total_pages, 600)
+        self.assertEqual(list(book.chapters.values_list('title', flat=True)), ['Book One', 'Book Two'])
+        self.assertNotEqual(get_version('catalog'), catalog_version)
+        self.assertNotEqual(get_version('book', book.pk), book_version)
+
+        output = self.import_catalog(
+            'title,author,total_pages\nDune,Frank Herbert,700\n', '.csv', '--skip-existing',
+        )
+        self.assertIn("0 updated, 1 unchanged", output)
+        book.refresh_from_db()
+        self.assertEqual(book.total_pages, 600)
+
+    def test_books_are_written_with_one_upsert(self):
+        Book.objects.create(title='Dune', author='Frank Herbert', genre='SF', description='',
+                            total_pages=600, total_chapters=0)
+        records = [
+            (1, {'title': 'Dune', 'author': 'Frank Herbert', 'total_pages': 700}),
+            (2, {'title': 'Emma', 'author': 'Jane Austen', 'total_pages': 400, 'chapters': ['One']}),
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            stats = CatalogImport().run(records)
+        self.assertEqual((stats['created'], stats['updated'], stats['chapters_created']), (1, 1, 1))
+        book_writes = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith(('INSERT INTO "bookclub_app_book"', 'UPDATE "bookclub_app_book"'))
+        ]
+        self.assertEqual(len(book_writes), 1)
+        self.assertIn('ON CONFLICT("title", "author") DO UPDATE', book_writes[0])
+        self.assertEqual(Book.objects.get(title='Dune').total_pages, 700)
+        self.assertEqual(Book.objects.get(title='Emma').chapters.get().title, 'One')
+
+        lookup = next(query['sql'] for query in queries.captured_queries
+                      if query['sql'].startswith('SELECT') and '"bookclub_app_book"."title" IN' in query['sql'])
+        with connection.cursor() as cursor:
+            plan = [row[-1] for row in cursor.execute(f"EXPLAIN QUERY PLAN {lookup}").fetchall()]
+        self.assertTrue(all(step.startswith('SEARCH') for step in plan), plan)
+
+    def test_chapter_count_must_match_chapter_list(self):
+        with self.assertRaisesMessage(CommandError, "line 1: 'total_chapters' is 3 but 2 chapters are listed"):
+            self.import_catalog(json.dumps({'title': 'Dune', 'author': 'Frank Herbert', 'total_chapters': 3,
+                                            'chapters': ['Book One', 'Book Two']}) + '\n')
+        self.assertFalse(Book.objects.exists())
+
+    def test_synthetic_groups_members_and_progress(self):
+        self.import_catalog(
+            json.dumps([{'title': f'Book {n}', 'author': 'Anon', 'total_pages': 100} for n in range(3)]),
+            '.json', '--groups-per-book', '2', '--members-per-group', '4', '--users', '10',
+            '--with-progress', '--seed', '3',
+        )
+        self.assertEqual(User.objects.filter(username__startswith='reader').count(), 10)
+        self.assertEqual(ReadingGroup.objects.count(), 6)
+        self.assertEqual(GroupMembership.objects.count(), 24)
+        self.assertEqual(ReadingProgress.objects.count(), 24)
+        self.assertEqual(set(ReadingGroup.objects.values_list('member_count', flat=True)), {4})
+
+
+class CachedAuthenticationTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='reader', password='Secret123')
+        response = self.client.post('/api/auth/login/', {'username': 'reader', 'password': 'Secret123'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_signed_in_caller_is_identified_without_queries(self):
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/auth/user/')
+        self.assertEqual(response.data['username'], 'reader')
+
+    def test_password_change_revokes_sessions(self):
+        self.user.set_password('Changed123')
+        self.user.save()
+        self.assertEqual(self.client.get('/api/auth/user/').status_code, 403)
+
+    def test_logout_revokes_the_session(self):
+        session_cookie = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+        self.client.post('/api/auth/logout/')
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = session_cookie
+        self.assertEqual(self.client.get('/api/auth/user/').status_code, 403)
+
+    def test_deactivated_user_is_rejected(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/auth/user/').status_code, 403)
+
+
+class UsernameIndexTests(APITestCase):
+    def setUp(self):
+        username_index.reset()
+        UsernameCheckThrottle.reset()
+        self.addCleanup(username_index.reset)
+        self.addCleanup(UsernameCheckThrottle.reset)
+        self.user = User.objects.create_user(username='taken')
+
+    def check(self, username):
+        response = self.client.get('/api/check-username/', {'username': username})
+        self.assertEqual(response.status_code, 200)
+        return response.data['available']
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(1000, 0.01)
+        words = [f'user{n}' for n in range(1000)]
+        for word in words:
+            bloom.add(word)
+        self.assertTrue(all(word in bloom for word in words))
+        false_positives = sum(f'other{n}' in bloom for n in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_checks_are_answered_from_memory_once_warm(self):
+        self.assertFalse(self.check('taken'))  # builds the index
+        with self.assertNumQueries(0):
+            self.assertFalse(self.check('taken'))
+            self.assertTrue(self.check('someone-new'))
+
+    def test_signals_keep_the_index_current(self):
+        self.check('taken')
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(username='newcomer')
+            self.user.username = 'renamed'
+            self.user.save()
+        with self.assertNumQueries(0):
+            self.assertFalse(self.check('newcomer'))
+            self.assertFalse(self.check('renamed'))
+        # The filter cannot forget the old name, so the database decides
+        with self.assertNumQueries(1):
+            self.assertTrue(self.check('taken'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.get(username='newcomer').delete()
+        self.assertTrue(self.check('newcomer'))
+
+    def test_updates_wait_for_a_rebuild_in_progress(self):
+        self.check('taken')
+        # A signal update racing a rebuild (user 999 is not in the database,
+        # so the rebuild's query cannot pick it up) must reach the new index
+        update = threading.Thread(target=username_index.user_saved, args=(999, 'ghost'))
+        with username_index._lock:
+            update.start()
+            update.join(0.2)
+            username_index.rebuild()
+        update.join()
+        with self.assertNumQueries(0):
+            self.assertFalse(self.check('ghost'))
+
+    @override_settings(USERNAME_CHECK_RATE=0.01, USERNAME_CHECK_BURST=3)
+    def test_clients_are_throttled_per_ip(self):
+        for _ in range(3):
+            self.check('anyone')
+        response = self.client.get('/api/check-username/', {'username': 'anyone'})
+        self.assertEqual(response.status_code, 429)
+        other = self.client.get('/api/check-username/', {'username': 'anyone'}, REMOTE_ADDR='10.0.0.2')
+        self.assertEqual(other.status_code, 200)
+
+
+class ReactionCountTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('reader', password='pass')
+        self.other = User.objects.create_user('other', password='pass')
+        book = Book.objects.create(title="Book", author="Author", genre="Fiction", description="...",
+                                   total_pages=100, total_chapters=1)
+        group = ReadingGroup.objects.create(name="Group", book=book, creator=self.user,
+                                            start_date="2025-01-01", end_date="2025-02-01", member_count=2)
+        GroupMembership.objects.create(user=self.user, group=group)
+        GroupMembership.objects.create(user=self.other, group=group)
+        self.post = DiscussionPost.objects.create(group=group, author=self.other, content="Post")
+        self.url = f'/api/posts/{self.post.id}/reactions/'
+        self.client.force_authenticate(self.user)
+
+    def test_toggle_returns_totals_without_loading_every_reaction(self):
+        for n in range(30):
+            Reaction.objects.create(post=self.post, user=User.objects.create_user(f'fan{n}'), emoji='👍')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {'emoji': '👍'})
+        self.assertLess(len(queries), 12)
+        self.assertEqual(response.data, {
+            'action': 'added', 'reactions': [{'emoji': '👍', 'count': 31, 'reacted_by_me': True}],
+        })
+
+        response = self.client.post(self.url, {'emoji': '👍'})
+        self.assertEqual(response.data['action'], 'removed')
+        self.assertEqual(response.data['reactions'], [{'emoji': '👍', 'count': 30, 'reacted_by_me': False}])
+
+    def test_deleting_a_user_updates_the_counters(self):
+        fan = User.objects.create_user('fan')
+        self.client.post(self.url, {'emoji': '🔥'})
+        Reaction.objects.create(post=self.post, user=fan, emoji='🔥')
+        fan.delete()
+        self.assertEqual(ReactionCount.objects.get(post=self.post, emoji='🔥').count, 1)
+
+    def test_racing_removes_decrement_once(self):
+        Reaction.objects.create(post=self.post, user=self.other, emoji='👍')
+        Reaction.objects.create(post=self.post, user=self.user, emoji='👍')
+
+        def remove_first(sender, instance, **kwargs):
+            # A double click: the other request removes the reaction between
+            # this one's lookup and its delete
+            pre_delete.disconnect(remove_first, sender=Reaction)
+            reactions.toggle(self.post, self.user, '👍')
+
+        pre_delete.connect(remove_first, sender=Reaction)
+        self.addCleanup(pre_delete.disconnect, remove_first, sender=Reaction)
+        self.assertEqual(reactions.toggle(self.post, self.user, '👍'), 'removed')
+        self.assertEqual(ReactionCount.objects.get(post=self.post, emoji='👍').count, 1)
+
+    def test_reactors_are_paginated(self):
+        Reaction.objects.create(post=self.post, user=self.other, emoji='👍')
+        Reaction.objects.create(post=self.post, user=self.user, emoji='👍')
+        Reaction.objects.create(post=self.post, user=self.user, emoji='❤️')
+
+        response = self.client.get(self.url, {'emoji': '👍', 'page_size': 1})
+        self.assertEqual([r['user_name'] for r in response.data], ['other'])
+        self.assertIn('rel="next"', response['Link'])
+        self.assertEqual(len(self.client.get(self.url).data), 3)
+
+    def test_reconcile_repairs_bulk_loaded_reactions(self):
+        Reaction.objects.bulk_create([Reaction(post=self.post, user=self.other, emoji='😮')])
+        ReactionCount.objects.create(post=self.post, emoji='😢', count=4)
+        out = StringIO()
+        call_command('reconcile_reaction_counts', stdout=out)
+        self.assertIn("Repaired 2 drifted reaction counter(s).", out.getvalue())
+        self.assertEqual(
+            dict(ReactionCount.objects.values_list('emoji', 'count')), {'😮': 1, '😢': 0},
+        )
+
+
+@override_settings(COMMENT_PREVIEW_SIZE=2)
+class CommentThreadTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('reader', password='pass')
+        book = Book.objects.create(title="Book", author="Author", genre="Fiction", description="...",
+                                   total_pages=100, total_chapters=1)
+        self.group = ReadingGroup.objects.create(name="Group", book=book, creator=self.user,
+                                                 start_date="2025-01-01", end_date="2025-02-01", member_count=1)
+        GroupMembership.objects.create(user=self.user, group=self.group)
+        self.post = DiscussionPost.objects.create(group=self.group, author=self.user, content="Post")
+        self.client.force_authenticate(self.user)
+
+    def test_discussion_embeds_count_and_latest_comments(self):
+        for n in range(5):
+            self.client.post(f'/api/posts/{self.post.id}/comments/', {'content': f'Reply {n}'})
+        other = DiscussionPost.objects.create(group=self.group, author=self.user, content="Quiet")
+
+        response = self.client.get(f'/api/groups/{self.group.id}/discussion/')
+        by_id = {post['id']: post for post in response.data}
+        self.assertEqual(by_id[self.post.id]['comment_count'], 5)
+        self.assertEqual([c['content'] for c in by_id[self.post.id]['comments']], ['Reply 3', 'Reply 4'])
+        self.assertEqual((by_id[other.id]['comment_count'], by_id[other.id]['comments']), (0, []))
+
+    def test_comments_endpoint_pages_the_whole_thread(self):
+        for n in range(5):
+            Comment.objects.create(post=self.post, author=self.user, content=f'Reply {n}')
+        url = f'/api/posts/{self.post.id}/comments/?page_size=3'
+        first = self.client.get(url)
+        self.assertEqual([c['content'] for c in first.data], ['Reply 0', 'Reply 1', 'Reply 2'])
+        next_url = first['Link'].split(';')[0].strip('<>')
+        self.assertEqual([c['content'] for c in self.client.get(next_url).data], ['Reply 3', 'Reply 4'])
+
+    def test_count_follows_deletes_and_reconcile_repairs_drift(self):
+        comment = Comment.objects.create(post=self.post, author=self.user, content='Reply')
+        Comment.objects.create(post=self.post, author=self.user, content='Reply')
+        comment.delete()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+
+        Comment.objects.bulk_create([Comment(post=self.post, author=self.user, content='Bulk')])
+        call_command('reconcile_comment_counts', stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 2)
+
+
+class RowSerializerTests(APITestCase):
+    """The values()-based list endpoints answer exactly what the DRF serializers would."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('reader', password='pass')
+        self.book = Book.objects.create(title="Book", author="Author", genre="Fiction", description="...",
+                                        total_pages=100, total_chapters=2, cover_image=None)
+        Book.objects.create(title="Another Book", author="Writer", genre="Poetry", description="Verse",
+                            total_pages=50, total_chapters=1, cover_image="https://example.com/cover.jpg")
+        chapter = Chapter.objects.create(book=self.book, chapter_number=1, title="Opening")
+        full = ReadingGroup.objects.create(name="Full", book=self.book, creator=self.user, start_date="2025-01-01",
+                                           end_date="2025-02-01", member_count=ReadingGroup.MAX_MEMBERS)
+        open_group = ReadingGroup.objects.create(name="Open", book=self.book, creator=self.user,
+                                                 start_date="2025-03-01", end_date="2025-04-01", member_count=1)
+        for group in (full, open_group):
+            GroupMembership.objects.create(user=self.user, group=group)
+        ReadingProgress.objects.create(user=self.user, book=self.book, group=full, current_page=12,
+                                       current_chapter=chapter, chapter_deadline=datetime.date(2025, 1, 9))
+        ReadingProgress.objects.create(user=self.user, book=self.book, group=open_group)
+        self.client.force_authenticate(self.user)
+
+    def test_list_endpoints_match_drf_serializers(self):
+        cases = [
+            ('/api/books/', BookSerializer(Book.objects.order_by('title', 'id'), many=True)),
+            ('/api/books/?search=book', BookSerializer(search.search_books('book'), many=True)),
+            ('/api/groups/', ReadingGroupSerializer(ReadingGroup.objects.order_by('created_at', 'id'), many=True)),
+            ('/api/reading-progress/',
+             ReadingProgressSerializer(ReadingProgress.objects.order_by('created_at', 'id'), many=True)),
+        ]
+        for url, expected in cases:
+            with self.subTest(url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, JSONRenderer().render(expected.data))
+        progress = self.client.get('/api/reading-progress/').json()
+        self.assertEqual(progress[0]['chapter_title'], "Opening")
+        self.assertIsNone(progress[1]['chapter_title'])
+        self.assertEqual([group['is_full'] for group in self.client.get('/api/groups/').json()], [True, False])
+
+    def test_rows_page_with_cursors(self):
+        first = self.client.get('/api/reading-progress/?page_size=1')
+        self.assertEqual(len(first.data), 1)
+        second = self.client.get(first['Link'].split(';')[0].strip('<>'))
+        self.assertEqual([p['id'] for p in first.data + second.data],
+                         list(ReadingProgress.objects.order_by('created_at', 'id').values_list('id', flat=True)))
+
+    def test_one_query_per_page(self):
+        for url in ('/api/books/', '/api/groups/', '/api/reading-progress/'):
+            with self.subTest(url), CaptureQueriesContext(connection) as queries:
+                self.client.get(url)
+            self.assertEqual(len(queries), 1, [q['sql'] for q in queries])
+
+    def test_fields_without_a_column_must_be_computed(self):
+        with self.assertRaises(ImproperlyConfigured):
+            RowSerializer(DiscussionPostSerializer).columns
+
+
+class RenderingTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('reader', password='pass')
+        Book.objects.bulk_create(
+            Book(title=f"Book {n}", author="Author", genre="Fiction", description="A long description. " * 20,
+                 total_pages=100, total_chapters=1)
+            for n in range(10)
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_fast_renderer_matches_drf(self):
+        data = {
+            'text': 'naïve \u2028 line \u2029 café',
+            'when': datetime.datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+            'day': datetime.date(2025, 1, 2),
+            'price': decimal.Decimal('1.50'),
+            'lazy': gettext_lazy('Hello'),
+            'nested': [{1: None, 'ok': True}],
+            'huge': 2 ** 70,
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        indented = 'application/json; indent=2'
+        self.assertEqual(FastJSONRenderer().render(data, indented), JSONRenderer().render(data, indented))
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_large_responses_are_gzipped_when_accepted(self):
+        plain = self.client.get('/api/books/')
+        self.assertNotIn('Content-Encoding', plain)
+        self.assertGreaterEqual(len(plain.content), settings.GZIP_MIN_LENGTH)
+
+        compressed = self.client.get('/api/books/', HTTP_ACCEPT_ENCODING='gzip, deflate, br')
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', compressed['Vary'])
+        self.assertLess(len(compressed.content), len(plain.content))
+        self.assertEqual(json.loads(gzip.decompress(compressed.content)), plain.json())
+
+        # Weakened by the compression, the ETag still revalidates
+        revalidated = self.client.get('/api/books/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=compressed['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_small_responses_are_not_compressed(self):
+        small = self.client.get('/api/books/?page_size=1', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertLess(len(small.content), settings.GZIP_MIN_LENGTH)
+        self.assertNotIn('Content-Encoding', small)
+
+    async def test_event_stream_is_not_compressed(self):
+        group = await ReadingGroup.objects.acreate(
+            name="Group", book=await Book.objects.afirst(), creator=self.user,
+            start_date="2025-01-01", end_date="2025-02-01", member_count=1,
+        )
+        await GroupMembership.objects.acreate(user=self.user, group=group)
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(f'/api/groups/{group.id}/events/', ACCEPT_ENCODING='gzip')
+        self.assertNotIn('Content-Encoding', response)
+        self.assertEqual(await anext(response.streaming_content), b'retry: 3000\n\n')
+        await response.streaming_content.aclose()
+
+
+class QueryPlanTests(APITestCase):
+    """Every query behind the hot endpoints must be an index lookup.
+
+    EXPLAIN QUERY PLAN reports a full table scan as ``SCAN <table>``. A
+    ``SCAN <table> USING INDEX`` under a LIMIT is a first page read off its
+    index in order and stops at the page size, so it passes. Keyset pages in
+    ``PRESORTED`` must also come out of their index in order, not through a
+    temporary sort.
+
+    The only exception is ranked search: the FTS5 match is reported as a
+    scan of the virtual table, and ordering by rank needs a sort.
+    """
+    ALLOWED_SCANS = {'book-search': {'bookclub_app_book_fts', '<sort>'}}
+    # Keyset pages whose index must also deliver the rows in order (no sort)
+    PRESORTED = {'book-list', 'book-detail', 'group-discussion', 'comment-list', 'notification-list'}
+
+    def setUp(self):
+        self.user = User.objects.create_user('reader')
+        other = User.objects.create_user('other')
+        book = Book.objects.create(title="Book", author="Author", genre="Fiction", description="...",
+                                   total_pages=100, total_chapters=2)
+        chapter = Chapter.objects.create(book=book, chapter_number=1, title="One")
+        today = datetime.date.today()
+        self.group = ReadingGroup.objects.create(name="Group", book=book, creator=self.user,
+                                                 start_date=today, end_date=today, member_count=2)
+        for user in (self.user, other):
+            GroupMembership.objects.create(user=user, group=self.group)
+            ReadingProgress.objects.create(user=user, book=book, group=self.group, current_page=10)
+            ChapterSchedule.objects.create(user=user, group=self.group, chapter=chapter,
+                                           target_completion_date=today)
+        self.post = DiscussionPost.objects.create(group=self.group, author=other, chapter=chapter, content="Post")
+        Comment.objects.create(post=self.post, author=self.user, content="Reply")
+        Reaction.objects.create(post=self.post, user=self.user, emoji='👍')
+        self.client.force_authenticate(self.user)
+
+    def full_scans(self, queries):
+        tables = set(connection.introspection.table_names())
+        scans = []
+        with connection.cursor() as cursor:
+            for query in queries:
+                if not query['sql'].lstrip().upper().startswith('SELECT'):
+                    continue
+                cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+                for *_, detail in cursor.fetchall():
+                    words = detail.split()
+                    if detail.startswith(f'SCAN {words[1]} USING ') and ' LIMIT ' in query['sql']:
+                        continue
+                    if words[0] == 'SCAN' and words[1] in tables:
+                        scans.append((words[1], detail, query['sql']))
+                    elif detail == 'USE TEMP B-TREE FOR ORDER BY' and ' LIMIT ' in query['sql']:
+                        scans.append(('<sort>', detail, query['sql']))
+        return scans
+
+    def assert_no_full_scans(self, name, queries):
+        allowed = self.ALLOWED_SCANS.get(name, set())
+        if name not in self.PRESORTED:
+            allowed = allowed | {'<sort>'}
+        scans = [scan for scan in self.full_scans(queries) if scan[0] not in allowed]
+        self.assertFalse(
+            scans, f"{name} scans whole tables:\n" + "\n".join(f"  {detail}\n    {sql}" for _, detail, sql in scans)
+        )
+
+    def test_endpoints_use_indexes(self):
+        group, post = self.group.id, self.post.id
+        endpoints = {
+            'book-list': '/api/books/',
+            'book-search': '/api/books/?search=book',
+            'book-detail': f'/api/books/{self.group.book_id}/?upcoming=1',
+            'group-list': '/api/groups/',
+            'group-detail': f'/api/groups/{group}/',
+            'group-discussion': f'/api/groups/{group}/discussion/',
+            'comment-list': f'/api/posts/{post}/comments/',
+            'reactor-list': f'/api/posts/{post}/reactions/',
+            'reading-progress': f'/api/groups/{group}/progress/',
+            'group-progress-stats': f'/api/groups/{group}/progress-stats/',
+            'group-chapters': f'/api/groups/{group}/chapters/',
+            'chapter-schedules': f'/api/groups/{group}/chapter-schedules/',
+            'reading-progress-list': '/api/reading-progress/',
+            'dashboard': '/api/dashboard/',
+            'notification-list': '/api/notifications/?unread=true',
+            'notification-unread-count': '/api/notifications/unread-count/',
+        }
+        for name, url in endpoints.items():
+            cache.clear()
+            with self.subTest(name), CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200, url)
+                self.assert_no_full_scans(name, queries)
+
+    def test_deadline_reminders_use_indexes(self):
+        with CaptureQueriesContext(connection) as queries:
+            queue_deadline_reminders()
+        self.assert_no_full_scans('deadline-reminders', queries)
@@ -0,0 +1,64 @@
+# bookclub_app/throttling.py
+"""Per-client token-bucket throttles for cheap, chatty endpoints.
+
+Each client IP gets a bucket of ``burst`` tokens that refills at ``rate``
+tokens per second, and every request takes one. Short bursts (someone typing
+a username) pass untouched, while a steady stream above ``rate`` gets 429s.
+Buckets live in process memory, so with several workers each one allows the
+full rate.
+"""
+import threading
+import time
+
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Subclasses name the settings holding their rate and burst."""
+    rate_setting = None
+    burst_setting = None
+    max_clients = 10000
+
+    _lock = threading.Lock()
+    _buckets = None  # ident -> (tokens, updated); one dict per subclass
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._buckets = {}
+
+    def allow_request(self, request, view):
+        rate = getattr(settings, self.rate_setting)
+        burst = getattr(settings, self.burst_setting)
+        ident = self.get_ident(request)
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(ident, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            if len(self._buckets) >= self.max_clients and ident not in self._buckets:
+                self._forget_full_buckets(now, rate, burst)
+            if tokens < 1:
+                self._buckets[ident] = (tokens, now)
+                self.wait_seconds = (1 - tokens) / rate
+                return False
+            self._buckets[ident] = (tokens - 1, now)
+            return True
+
+    def wait(self):
+        return getattr(self, 'wait_seconds', None)
+
+    def _forget_full_buckets(self, now, rate, burst):
+        # A bucket that has refilled is the same as no bucket at all
+        for ident, (tokens, updated) in list(self._buckets.items()):
+            if tokens + (now - updated) * rate >= burst:
+                del self._buckets[ident]
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._buckets.clear()
+
+
+class UsernameCheckThrottle(TokenBucketThrottle):
+    rate_setting = 'USERNAME_CHECK_RATE'
+    burst_setting = 'USERNAME_CHECK_BURST'
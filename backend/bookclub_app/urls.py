@@ -1,6 +1,6 @@
 # bookclub_app/urls.py
 from django.urls import path
-from . import views
+from . import async_views, views
 
 urlpatterns = [
     # Auth
@@ -11,17 +11,18 @@ urlpatterns = [
     path('check-username/', views.check_username, name='check-username'),
 
     # Books
-    path('books/', views.book_list, name='book-list'),
+    path('books/', async_views.book_list, name='book-list'),
     path('books/<int:pk>/', views.book_detail, name='book-detail'),
 
     # Groups
     path('groups/', views.group_list_create, name='group-list-create'),
     path('groups/<int:pk>/join/', views.join_group, name='join-group'),
     path('groups/<int:pk>/leave/', views.leave_group, name='leave-group'),
-    path('groups/<int:group_id>/', views.group_detail, name='group-detail'),
-    path('groups/<int:group_id>/discussion/', views.group_discussion, name='group-discussion'),
+    path('groups/<int:group_id>/', async_views.group_detail, name='group-detail'),
+    path('groups/<int:group_id>/discussion/', async_views.group_discussion, name='group-discussion'),
+    path('groups/<int:group_id>/events/', views.group_events, name='group-events'),
     path('groups/<int:group_id>/progress/', views.reading_progress, name='reading-progress'),
-    path('groups/<int:group_id>/progress-stats/', views.group_progress_stats, name='group-progress-stats'),
+    path('groups/<int:group_id>/progress-stats/', async_views.group_progress_stats, name='group-progress-stats'),
     
     # Chapter Schedules
     path('groups/<int:group_id>/chapters/', views.get_group_chapters, name='group-chapters'),
@@ -30,6 +31,15 @@ urlpatterns = [
     
     # Reading Progress
     path('reading-progress/', views.reading_progress_list, name='reading-progress-list'),
+    path('dashboard/', async_views.dashboard, name='dashboard'),
+
+    # Notifications
+    path('notifications/', views.notification_list, name='notification-list'),
+    path('notifications/unread-count/', views.notification_unread_count, name='notification-unread-count'),
+    path('notifications/read/', views.notification_mark_read, name='notification-mark-read'),
+
+    # Instrumentation (staff only)
+    path('metrics/', views.request_metrics, name='request-metrics'),
     
     # Comments
     path('posts/<int:post_id>/comments/', views.add_comment, name='add-comment'),
@@ -0,0 +1,114 @@
+# bookclub_app/usernames.py
+"""Process-local index of taken usernames for ``check_username``.
+
+The signup form asks about every username the user pauses on. ``UsernameIndex``
+answers most of those questions from memory:
+
+* a Bloom filter over every username: a miss means the name is certainly
+  free (unless it was registered after the index was built, see below);
+* an exact set of the usernames this process knows are taken: a hit means
+  the name is taken.
+
+Only a Bloom hit that is not in the set goes to the database. That happens
+for filter false positives (about ``USERNAME_INDEX_ERROR_RATE`` of free
+names) and for users deleted or renamed since the build, which a Bloom
+filter cannot forget.
+
+The index is built on first use and kept current by ``User`` signals (see
+``signals.py``). Users created by other processes or with ``bulk_create``
+send no signals here, so the index is rebuilt once it is older than
+``USERNAME_INDEX_MAX_AGE`` seconds. ``register_user`` still checks the
+database, so a stale "available" only delays the "taken" error to submit.
+"""
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter of strings sized for ``capacity`` items."""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing: k positions from the two halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return ((first + n * second) % self.size for n in range(self.hash_count))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class UsernameIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._names = set()
+        self._names_by_id = {}
+        self._built_at = 0.0
+
+    def is_taken(self, username):
+        self._ensure_fresh()
+        if username in self._names:
+            return True
+        if username not in self._bloom:
+            return False
+        return User.objects.filter(username=username).exists()
+
+    def _ensure_fresh(self):
+        if self._bloom is not None and time.monotonic() - self._built_at < settings.USERNAME_INDEX_MAX_AGE:
+            return
+        with self._lock:
+            if self._bloom is None or time.monotonic() - self._built_at >= settings.USERNAME_INDEX_MAX_AGE:
+                self.rebuild()
+
+    def rebuild(self):
+        names_by_id = dict(User.objects.values_list('id', 'username').iterator(chunk_size=5000))
+        # Room to grow, so new signups do not push the error rate up quickly
+        bloom = BloomFilter(2 * len(names_by_id) + 1000, settings.USERNAME_INDEX_ERROR_RATE)
+        for username in names_by_id.values():
+            bloom.add(username)
+        self._bloom, self._names, self._names_by_id = bloom, set(names_by_id.values()), names_by_id
+        self._built_at = time.monotonic()
+
+    def reset(self):
+        """Drop the index; the next check rebuilds it."""
+        with self._lock:
+            self._bloom = None
+
+    # Both run under the lock so an update cannot land on the structures of
+    # a build that rebuild() is about to replace
+
+    def user_saved(self, user_id, username):
+        with self._lock:
+            if self._bloom is None:
+                return
+            previous = self._names_by_id.get(user_id)
+            if previous == username:
+                return
+            self._names.discard(previous)
+            self._names.add(username)
+            self._names_by_id[user_id] = username
+            self._bloom.add(username)
+
+    def user_deleted(self, user_id):
+        with self._lock:
+            if self._bloom is None:
+                return
+            self._names.discard(self._names_by_id.pop(user_id, None))
+
+
+username_index = UsernameIndex()
@@ -1,35 +1,57 @@
-from django.shortcuts import render, get_object_or_404
+from django.http import JsonResponse, StreamingHttpResponse
+from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, FilteredRelation, Prefetch, Q
+from django.utils import timezone
 from django.utils.dateparse import parse_date
 
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 
-from .models import Book, DiscussionPost, ReadingGroup, GroupMembership, ReadingProgress, Chapter, ChapterSchedule, Reaction
+from .models import Book, Comment, DiscussionPost, ReadingGroup, GroupMembership, ReadingProgress, Chapter, ChapterSchedule, Reaction, ReactionCount, Notification
 from .serializers import (
     DiscussionPostSerializer,
     UserSerializer,
     BookSerializer,
+    BookSummarySerializer,
     ReadingGroupSerializer,
     ReadingProgressSerializer,
     ChapterSerializer,
     ChapterScheduleSerializer,
+    CommentSerializer,
+    NotificationSerializer,
+    ReactionSerializer,
 )
+from . import notifications, reactions
+from .caching import get_version
+from .conditional import conditional
+from .instrumentation import registry as metrics_registry
+from .pagination import KeysetPagination, paginate, paginate_rows
+from .permissions import NOT_A_MEMBER, IsGroupMember, IsPostGroupMember, load_group, load_post
+from .row_serializers import book_rows, group_rows, progress_rows
+from .realtime import event_stream, publish_group_event
+from .progress_buffer import progress_buffer, write_behind_enabled
+from .search import search_books
+from .throttling import UsernameCheckThrottle
+from .usernames import username_index
 import re
 
 # ==== AUTH ====
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@throttle_classes([UsernameCheckThrottle])
 def check_username(request):
-    """Check if username is available."""
+    """Check if username is available (answered from memory, see usernames.py)."""
     username = request.GET.get("username")
     
     if not username:
@@ -38,8 +60,7 @@ def check_username(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
     
-    # Check if username exists
-    is_available = not User.objects.filter(username=username).exists()
+    is_available = not username_index.is_taken(username)
     
     return Response({
         "username": username,
@@ -150,37 +171,68 @@ def get_user(request):
 
 # ==== BOOKS ====
 
+def _catalog_validators(request):
+    return f"catalog-{get_version('catalog')}"
+
+
+def _book_validators(request, pk):
+    # The open-groups list changes with memberships, and ?upcoming with the date
+    book_version = get_version("book", pk)
+    groups_version = get_version("book-groups", pk)
+    return f"book-{pk}-{book_version}-{groups_version}-{timezone.localdate().isoformat()}"
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@conditional(_catalog_validators)
 def book_list(request):
-    """List or search for books."""
-    query = request.GET.get("search", "")
+    """List or search for books. Searches are ranked best match first."""
+    books, ordering = catalog_query(request)
+    return paginate_rows(request, books, ordering, book_rows)
+
+
+def catalog_query(request):
+    """The books matching ``?search=``/``?genre=`` and the keyset ordering to page them by."""
+    query = request.GET.get("search", "").strip()
     genre = request.GET.get("genre", "")
     books = Book.objects.all()
 
-    if query:
-        books = books.filter(Q(title__icontains=query) | Q(author__icontains=query))
     if genre:
         books = books.filter(genre__iexact=genre)
-
-    return Response(BookSerializer(books, many=True).data)
+    if query:
+        return search_books(query, books), ("search_rank", "id")
+    return books, ("title", "id")
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@conditional(_book_validators)
 def book_detail(request, pk):
-    """Get book details and available groups."""
+    """Get book details and a page of groups that still have open seats.
+
+    Pass ``?upcoming=true`` to only list groups that have not started yet.
+    """
     try:
-        book = Book.objects.prefetch_related("readinggroup_set").get(pk=pk)
+        book = Book.objects.get(pk=pk)
     except Book.DoesNotExist:
         return Response({"error": "Book not found"}, status=status.HTTP_404_NOT_FOUND)
 
-    available_groups = book.readinggroup_set.filter(memberships__isnull=False).distinct()
-    available_groups = [g for g in available_groups if not g.is_full]
+    # member_count is a column (see ReadingGroup), so "has members but is not
+    # full" is a plain WHERE clause rather than a per-group COUNT.
+    available_groups = ReadingGroup.objects.filter(
+        book=book,
+        member_count__gt=0,
+        member_count__lt=ReadingGroup.MAX_MEMBERS,
+    ).select_related("book", "creator")
+    if request.GET.get("upcoming", "").lower() in ("1", "true", "yes"):
+        available_groups = available_groups.filter(start_date__gt=timezone.localdate())
+
+    paginator = KeysetPagination(("start_date", "id"))
+    page = paginator.paginate_queryset(available_groups, request)
 
     data = BookSerializer(book).data
-    data["available_groups"] = ReadingGroupSerializer(available_groups, many=True).data
-    return Response(data)
+    data["available_groups"] = ReadingGroupSerializer(page, many=True).data
+    return paginator.get_paginated_response(data)
 
 
 # ==== GROUPS ====
@@ -192,16 +244,16 @@ def group_list_create(request):
     if request.method == "POST":
         serializer = ReadingGroupSerializer(data=request.data)
         if serializer.is_valid():
-            # Save the group with the creator
-            group = serializer.save(creator=request.user)
-            # Automatically add creator as a member
-            GroupMembership.objects.create(user=request.user, group=group)
+            with transaction.atomic():
+                # Save the group with the creator, who is automatically its first member
+                group = serializer.save(creator=request.user, member_count=1)
+                GroupMembership.objects.create(user=request.user, group=group)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     # GET: list user's groups
     user_groups = ReadingGroup.objects.filter(memberships__user=request.user)
-    return Response(ReadingGroupSerializer(user_groups, many=True).data)
+    return paginate_rows(request, user_groups, ("created_at", "id"), group_rows)
 
 
 @api_view(["POST"])
@@ -219,7 +271,18 @@ def join_group(request, pk):
     if GroupMembership.objects.filter(user=request.user, group=group).exists():
         return Response({"error": "Already a member"}, status=status.HTTP_400_BAD_REQUEST)
 
-    GroupMembership.objects.create(user=request.user, group=group)
+    try:
+        with transaction.atomic():
+            # Claim a seat atomically so concurrent joins cannot overfill the group
+            claimed = ReadingGroup.objects.filter(
+                pk=group.pk, member_count__lt=ReadingGroup.MAX_MEMBERS
+            ).update(member_count=F("member_count") + 1)
+            if not claimed:
+                return Response({"error": "Group is full"}, status=status.HTTP_400_BAD_REQUEST)
+            GroupMembership.objects.create(user=request.user, group=group)
+    except IntegrityError:
+        return Response({"error": "Already a member"}, status=status.HTTP_400_BAD_REQUEST)
+
     return Response({"message": "Joined group successfully"})
 
 
@@ -239,142 +302,178 @@ def leave_group(request, pk):
         return Response({"error": "Not a member of this group"}, status=status.HTTP_400_BAD_REQUEST)
 
     # Prevent creator from leaving if there are other members
-    if group.creator == request.user and group.member_count > 1:
+    if group.creator_id == request.user.id and group.member_count > 1:
         return Response(
             {"error": "As the group creator, you cannot leave while other members are present. Transfer ownership or wait for others to leave first."},
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    # Delete membership and related reading progress
-    membership.delete()
-    
-    # Also delete the user's reading progress for this group
-    ReadingProgress.objects.filter(user=request.user, group=group).delete()
+    with transaction.atomic():
+        # Delete membership and related reading progress
+        if membership.delete()[0]:
+            ReadingGroup.objects.filter(pk=group.pk, member_count__gt=0).update(
+                member_count=F("member_count") - 1
+            )
+
+        # Also delete the user's reading progress for this group
+        ReadingProgress.objects.filter(user=request.user, group=group).delete()
     
     return Response({"message": "Left group successfully"})
 
 
 # ==== DISCUSSIONS ====
 
+def discussion_posts(group, user):
+    """Posts of a group with every relation DiscussionPostSerializer reads.
+
+    Renders in a fixed number of queries (posts, the latest comments of each
+    post, reaction counters, ``user``'s own reactions) no matter how many
+    posts, comments or reactions the page holds.
+    """
+    return (
+        DiscussionPost.objects.filter(group=group)
+        .select_related("author", "chapter")
+        .prefetch_related(
+            Prefetch(
+                "comments",
+                queryset=Comment.objects.select_related("author")
+                .order_by("-created_at", "-id")[:settings.COMMENT_PREVIEW_SIZE],
+                to_attr="latest_comments",
+            ),
+            Prefetch("reaction_counts", queryset=ReactionCount.objects.filter(count__gt=0).order_by("id")),
+            Prefetch(
+                "reactions", queryset=Reaction.objects.filter(user=user).only("post_id", "emoji"),
+                to_attr="my_reactions",
+            ),
+        )
+    )
+
+
 @api_view(["GET", "POST"])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsGroupMember])
 def group_discussion(request, group_id):
     """
     List or create discussion posts in a group.
     Automatically attaches group and user to new posts.
     """
-    group = get_object_or_404(ReadingGroup, id=group_id)
-
-    # Check if user is a member
-    if not GroupMembership.objects.filter(group=group, user=request.user).exists():
-        return Response(
-            {"error": "Not a member of this group"},
-            status=status.HTTP_403_FORBIDDEN,
-        )
+    group = load_group(request, group_id)
 
     if request.method == "POST":
         # Automatically assign author and group
         serializer = DiscussionPostSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save(author=request.user, group=group)
+            publish_group_event(group.id, "post_created", {"post": serializer.data})
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    # GET: list all posts for the group
-    posts = DiscussionPost.objects.filter(group=group).prefetch_related("comments", "reactions")
-    return Response(DiscussionPostSerializer(posts, many=True).data)
+    # GET: list posts for the group, newest first
+    posts = discussion_posts(group, request.user)
+    return paginate(request, posts, ("-created_at", "-id"), DiscussionPostSerializer)
 
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
+@api_view(["GET", "POST"])
+@permission_classes([IsPostGroupMember])
 def add_comment(request, post_id):
-    """Add a comment/reply to a discussion post."""
-    try:
-        post = DiscussionPost.objects.get(id=post_id)
-    except DiscussionPost.DoesNotExist:
-        return Response({"error": "Post not found"}, status=status.HTTP_404_NOT_FOUND)
+    """List a post's comments, oldest first (GET), or add a comment/reply (POST)."""
+    post = load_post(request, post_id)
 
-    # Check if user is a member of the post's group
-    if not GroupMembership.objects.filter(group=post.group, user=request.user).exists():
-        return Response(
-            {"error": "Not a member of this group"},
-            status=status.HTTP_403_FORBIDDEN,
-        )
+    if request.method == "GET":
+        comments = Comment.objects.filter(post=post).select_related("author")
+        return paginate(request, comments, ("created_at", "id"), CommentSerializer)
 
-    # Create comment
-    from .serializers import CommentSerializer
     serializer = CommentSerializer(data=request.data)
     if serializer.is_valid():
         serializer.save(author=request.user, post=post)
+        comment_count = DiscussionPost.objects.filter(pk=post.pk).values_list("comment_count", flat=True).first()
+        publish_group_event(post.group_id, "comment_created", {
+            "post_id": post.id, "comment": serializer.data, "comment_count": comment_count,
+        })
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
+@api_view(["GET", "POST"])
+@permission_classes([IsPostGroupMember])
 def toggle_reaction(request, post_id):
-    """Toggle an emoji reaction for the authenticated user on a discussion post.
-    If the same emoji reaction exists from the user it will be removed, otherwise it will be added.
-    Returns the updated list of reactions for the post.
+    """List who reacted to a post (GET, ``?emoji=`` narrows it) or toggle an emoji reaction (POST).
+
+    POST removes the user's reaction with that emoji if there is one and adds
+    it otherwise, then returns the post's reaction totals.
     """
-    try:
-        post = DiscussionPost.objects.get(id=post_id)
-    except DiscussionPost.DoesNotExist:
-        return Response({"error": "Post not found"}, status=status.HTTP_404_NOT_FOUND)
+    post = load_post(request, post_id)
 
-    # Check membership
-    if not GroupMembership.objects.filter(group=post.group, user=request.user).exists():
-        return Response({"error": "Not a member of this group"}, status=status.HTTP_403_FORBIDDEN)
+    if request.method == "GET":
+        reactors = Reaction.objects.filter(post=post).select_related("user")
+        if request.GET.get("emoji"):
+            reactors = reactors.filter(emoji=request.GET["emoji"])
+        return paginate(request, reactors, ("created_at", "id"), ReactionSerializer)
 
     emoji = request.data.get('emoji')
     if not emoji:
         return Response({"error": "Emoji is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-    existing = Reaction.objects.filter(post=post, user=request.user, emoji=emoji).first()
-    if existing:
-        existing.delete()
-        action = 'removed'
-    else:
-        Reaction.objects.create(post=post, user=request.user, emoji=emoji)
-        action = 'added'
+    action = reactions.toggle(post, request.user, emoji)
+    summary = reactions.post_summary(post.id, request.user)
+    # Totals only: each client knows which reactions are its own
+    publish_group_event(post.group_id, "reaction_toggled", {
+        "post_id": post.id, "action": action, "emoji": emoji, "user": request.user.id,
+        "counts": [{"emoji": item["emoji"], "count": item["count"]} for item in summary],
+    })
+    return Response({'action': action, 'reactions': summary})
+
+
+async def group_events(request, group_id):
+    """Stream the group's discussion changes as Server-Sent Events.
+
+    A plain async Django view (DRF views are sync only): it authenticates off
+    the session, checks membership, then holds the connection open without
+    tying up a worker thread. Events: post_created, comment_created,
+    reaction_toggled, and resync when the client fell behind and should refetch.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+    if not await GroupMembership.objects.filter(group_id=group_id, user=user).aexists():
+        return JsonResponse({"error": NOT_A_MEMBER}, status=status.HTTP_403_FORBIDDEN)
 
-    # Return updated reactions
-    reactions_qs = Reaction.objects.filter(post=post)
-    from .serializers import ReactionSerializer
-    return Response({'action': action, 'reactions': ReactionSerializer(reactions_qs, many=True).data})
+    response = StreamingHttpResponse(event_stream(group_id), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # don't let nginx buffer the stream
+    return response
 
 
 # ==== GROUP DETAILS ====
 
 @api_view(["GET"])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsGroupMember])
 def group_detail(request, group_id):
     """Get group details including members list."""
-    try:
-        group = ReadingGroup.objects.prefetch_related('memberships__user', 'book').get(id=group_id)
-    except ReadingGroup.DoesNotExist:
-        return Response({"error": "Group not found"}, status=status.HTTP_404_NOT_FOUND)
+    group = load_group(request, group_id)
+    return Response(group_detail_data(group, group_members(group.id)))
 
-    # Check if user is a member
-    if not GroupMembership.objects.filter(group=group, user=request.user).exists():
-        return Response(
-            {"error": "Not a member of this group"},
-            status=status.HTTP_403_FORBIDDEN,
-        )
 
+def group_members(group_id):
+    return GroupMembership.objects.filter(group_id=group_id).select_related('user')
+
+
+def group_detail_data(group, memberships):
     members = [
         {
             'id': m.user.id,
             'username': m.user.username,
             'joined_at': m.joined_at
         }
-        for m in group.memberships.all()
+        for m in memberships
     ]
 
     data = ReadingGroupSerializer(group).data
     data['members'] = members
     data['book_details'] = BookSerializer(group.book).data
-    return Response(data)
+    return data
 
 
 # ==== READING PROGRESS ====
@@ -383,26 +482,17 @@ def group_detail(request, group_id):
 @permission_classes([IsAuthenticated])
 def reading_progress_list(request):
     """Get all reading progress for the current user across all groups."""
-    progress_list = ReadingProgress.objects.filter(user=request.user).select_related('book', 'group')
-    serializer = ReadingProgressSerializer(progress_list, many=True)
-    return Response(serializer.data)
+    progress_list = ReadingProgress.objects.filter(user=request.user)
+    return paginate_rows(
+        request, progress_list, ("created_at", "id"), progress_rows, prepare=progress_buffer.apply_pending_rows
+    )
 
 
 @api_view(["GET", "POST", "PUT"])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsGroupMember])
 def reading_progress(request, group_id):
     """Manage reading progress for a user in a group."""
-    try:
-        group = ReadingGroup.objects.select_related('book').get(id=group_id)
-    except ReadingGroup.DoesNotExist:
-        return Response({"error": "Group not found"}, status=status.HTTP_404_NOT_FOUND)
-
-    # Check membership
-    if not GroupMembership.objects.filter(group=group, user=request.user).exists():
-        return Response(
-            {"error": "Not a member of this group"},
-            status=status.HTTP_403_FORBIDDEN,
-        )
+    group = load_group(request, group_id)
 
     if request.method == "GET":
         # Get or create progress (don't set speed by default - let frontend show selection)
@@ -422,6 +512,7 @@ def reading_progress(request, group_id):
                 reading_speed_minutes=0,  # 0 means not set yet
                 current_page=1
             )
+        progress_buffer.apply_pending(progress)
         return Response(ReadingProgressSerializer(progress).data)
 
     elif request.method == "POST":
@@ -431,11 +522,7 @@ def reading_progress(request, group_id):
             book=group.book,
             group=group
         )
-        serializer = ReadingProgressSerializer(progress, data=request.data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return _save_progress(progress, request.data, status.HTTP_201_CREATED if created else status.HTTP_200_OK)
 
     elif request.method == "PUT":
         # Update progress (page navigation, chapter completion)
@@ -448,40 +535,87 @@ def reading_progress(request, group_id):
         except ReadingProgress.DoesNotExist:
             return Response({"error": "Progress not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        serializer = ReadingProgressSerializer(progress, data=request.data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        if write_behind_enabled() and set(request.data.keys()) == {"current_page"}:
+            # Page turn: buffer it instead of writing the row now
+            try:
+                current_page = int(request.data["current_page"])
+            except (TypeError, ValueError):
+                return Response(
+                    {"current_page": ["A valid integer is required."]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            progress_buffer.record(progress, current_page)
+            progress_buffer.apply_pending(progress)
+            return Response(ReadingProgressSerializer(progress).data)
+
+        return _save_progress(progress, request.data, status.HTTP_200_OK)
+
+
+def _save_progress(progress, data, success_status):
+    """Validate and save a progress update.
+
+    A page still waiting in the write-behind buffer is folded in first so this
+    save does not roll it back (``data`` may still set the page itself). It
+    leaves the buffer only once the save succeeded; a flush racing the save
+    skips the row because the save made it newer.
+    """
+    pending = progress_buffer.pending_for(progress.user_id, progress.group_id)
+    if pending is not None and pending.progress_id == progress.pk:
+        progress.current_page = pending.current_page
+    serializer = ReadingProgressSerializer(progress, data=data, partial=True)
+    if serializer.is_valid():
+        serializer.save()
+        if pending is not None:
+            progress_buffer.discard(progress.user_id, progress.group_id, pending)
+        return Response(serializer.data, status=success_status)
+    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 # ==== GROUP PROGRESS STATISTICS ====
 
 @api_view(["GET"])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsGroupMember])
 def group_progress_stats(request, group_id):
     """Get group progress statistics showing member completion status."""
-    try:
-        group = ReadingGroup.objects.select_related('book').get(id=group_id)
-    except ReadingGroup.DoesNotExist:
-        return Response({"error": "Group not found"}, status=status.HTTP_404_NOT_FOUND)
+    group = load_group(request, group_id)
+
+    today = timezone.localdate()
+    cache_key = group_stats_cache_key(group, get_version("group-progress", group.id), today)
+    stats = cache.get(cache_key)
+    if stats is None:
+        stats = compute_group_progress_stats(group, today)
+        cache.set(cache_key, stats, settings.GROUP_STATS_CACHE_TIMEOUT)
+    return Response(stats)
+
+
+def group_stats_cache_key(group, version, today):
+    return f"group-progress-stats:{group.id}:{version}:{today.isoformat()}"
+
+
+def group_progress_rows(group):
+    """Memberships, usernames and progress rows of ``group`` in one LEFT JOIN query."""
+    return (
+        GroupMembership.objects.filter(group=group)
+        .annotate(progress=FilteredRelation(
+            'user__readingprogress',
+            condition=Q(user__readingprogress__group=group, user__readingprogress__book=group.book_id),
+        ))
+        .order_by('id')
+        .values_list('user__username', 'progress__id', 'progress__current_page', 'progress__last_read_at')
+    )
 
-    # Check membership
-    if not GroupMembership.objects.filter(group=group, user=request.user).exists():
-        return Response(
-            {"error": "Not a member of this group"},
-            status=status.HTTP_403_FORBIDDEN,
-        )
 
-    # Get all members
-    members = GroupMembership.objects.filter(group=group).select_related('user')
-    total_members = members.count()
+def compute_group_progress_stats(group, today, members=None):
+    """Bucket every member of ``group`` by reading progress as of ``today``.
+
+    ``members`` are already fetched ``group_progress_rows``; they are queried
+    here when omitted.
+    """
+    if members is None:
+        members = list(group_progress_rows(group))
+    total_members = len(members)
     total_pages = group.book.total_pages if group.book else 100
 
-    # Calculate progress for each member
-    from datetime import datetime, timedelta
-    today = datetime.now().date()
-    
     # Calculate expected progress based on schedule
     start_date = group.start_date
     deadline = group.end_date  # Use end_date instead of deadline
@@ -508,39 +642,34 @@ def group_progress_stats(request, group_id):
     behind = []     # Progress < expected
     not_started = []  # No progress yet
 
-    for membership in members:
-        try:
-            progress = ReadingProgress.objects.get(
-                user=membership.user,
-                book=group.book,
-                group=group
-            )
-            current_page = progress.current_page or 1
-            progress_percent = (current_page / total_pages) * 100 if total_pages > 0 else 0
-            
-            member_data = {
-                'username': membership.user.username,
-                'current_page': current_page,
-                'progress_percent': round(progress_percent, 1),
-                'last_read': progress.last_read_at
-            }
-            
-            if current_page >= total_pages:
-                completed.append(member_data)
-            elif progress_percent >= expected_progress:
-                on_track.append(member_data)
-            else:
-                behind.append(member_data)
-                
-        except ReadingProgress.DoesNotExist:
+    for username, progress_id, current_page, last_read_at in members:
+        if progress_id is None:
             not_started.append({
-                'username': membership.user.username,
+                'username': username,
                 'current_page': 0,
                 'progress_percent': 0,
                 'last_read': None
             })
+            continue
 
-    return Response({
+        current_page = current_page or 1
+        progress_percent = (current_page / total_pages) * 100 if total_pages > 0 else 0
+
+        member_data = {
+            'username': username,
+            'current_page': current_page,
+            'progress_percent': round(progress_percent, 1),
+            'last_read': last_read_at
+        }
+
+        if current_page >= total_pages:
+            completed.append(member_data)
+        elif progress_percent >= expected_progress:
+            on_track.append(member_data)
+        else:
+            behind.append(member_data)
+
+    return {
         'total_members': total_members,
         'expected_progress': round(expected_progress, 1),
         'completed': {
@@ -559,26 +688,138 @@ def group_progress_stats(request, group_id):
             'count': len(not_started),
             'members': not_started
         }
-    })
+    }
 
 
-# ==== CHAPTER SCHEDULES ====
+# ==== DASHBOARD ====
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+def dashboard(request):
+    """Everything the home page needs for the current user in one response.
+
+    Returns each of the user's groups with a book summary, the user's
+    reading progress (null if they have not opened the book yet) and their
+    next unfinished chapter deadline. Runs a fixed three queries however many
+    groups the user is in, and never creates rows.
+    """
+    groups, progress, schedules = dashboard_querysets(request.user)
+    return Response(dashboard_data(list(groups), list(progress), list(schedules)))
+
+
+def dashboard_querysets(user):
+    """The three independent queries behind the dashboard (groups, progress, deadlines)."""
+    groups = (
+        ReadingGroup.objects.filter(memberships__user=user)
+        .select_related("book", "creator")
+        .order_by("created_at", "id")
+    )
+    # Progress and schedules are only kept for the user's groups, and both
+    # already imply membership, so they need not wait for the group ids.
+    progress = ReadingProgress.objects.filter(user=user, group__isnull=False)
+    # Earliest unfinished chapter per group; the ordering puts it first
+    schedules = (
+        ChapterSchedule.objects.filter(user=user, completed=False)
+        .select_related("chapter")
+        .order_by("group_id", "target_completion_date", "chapter__chapter_number")
+    )
+    return groups, progress, schedules
+
+
+def dashboard_data(groups, progress_rows, schedules):
+    group_ids = {group.id for group in groups}
+
+    progress_by_group = {}
+    for progress in progress_rows:
+        if progress.group_id in group_ids:
+            progress_by_group[progress.group_id] = progress_buffer.apply_pending(progress)
+
+    next_deadlines = {}
+    for schedule in schedules:
+        if schedule.group_id in group_ids:
+            next_deadlines.setdefault(schedule.group_id, schedule)
+
+    data = []
+    for group, group_data in zip(groups, ReadingGroupSerializer(groups, many=True).data):
+        total_pages = group.book.total_pages
+        group_data["book_details"] = BookSummarySerializer(group.book).data
+
+        progress = progress_by_group.get(group.id)
+        group_data["progress"] = None if progress is None else {
+            "current_page": progress.current_page,
+            "total_pages": total_pages,
+            "percentage": round(progress.current_page / total_pages * 100) if total_pages else 0,
+            "chapter_status": progress.chapter_status,
+            "last_read_at": progress.last_read_at,
+        }
+
+        schedule = next_deadlines.get(group.id)
+        group_data["next_deadline"] = None if schedule is None else {
+            "schedule_id": schedule.id,
+            "chapter": schedule.chapter_id,
+            "chapter_number": schedule.chapter.chapter_number,
+            "chapter_title": schedule.chapter.title,
+            "target_completion_date": schedule.target_completion_date,
+        }
+        data.append(group_data)
+
+    return {"groups": data}
+
+
+# ==== NOTIFICATIONS ====
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def notification_list(request):
+    """The user's notifications, newest first. ``?unread=true`` hides read ones."""
+    inbox = Notification.objects.filter(recipient=request.user).select_related("actor")
+    if request.query_params.get("unread") == "true":
+        inbox = inbox.filter(read_at__isnull=True)
+    return paginate(request, inbox, ("-created_at", "-id"), NotificationSerializer)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def notification_unread_count(request):
+    """Unread badge count, read from the user's counter (one primary-key lookup)."""
+    return Response({"unread_count": notifications.unread_count(request.user)})
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def notification_mark_read(request):
+    """Mark the listed notification ``ids`` read, or every notification if none are given."""
+    ids = request.data.get("ids")
+    if ids is not None:
+        if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+            return Response({"error": "ids must be a list of notification ids"}, status=status.HTTP_400_BAD_REQUEST)
+    marked = notifications.mark_read(request.user, ids)
+    return Response({"marked_read": marked, "unread_count": notifications.unread_count(request.user)})
+
+
+# ==== INSTRUMENTATION ====
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def request_metrics(request):
+    """Per-view latency, SQL and query-count histograms of this worker process."""
+    return Response(metrics_registry.snapshot())
+
+
+# ==== CHAPTER SCHEDULES ====
+
+def _group_chapters_validators(request, group_id):
+    group = load_group(request, group_id)  # already loaded by IsGroupMember
+    version = get_version("book", group.book_id)
+    return f"chapters-{group.id}-{version}-{group.start_date}-{group.end_date}"
+
+
+@api_view(["GET"])
+@permission_classes([IsGroupMember])
+@conditional(_group_chapters_validators)
 def get_group_chapters(request, group_id):
     """Get all chapters for a group's book"""
-    try:
-        group = ReadingGroup.objects.get(id=group_id)
-    except ReadingGroup.DoesNotExist:
-        return Response({"error": "Group not found"}, status=status.HTTP_404_NOT_FOUND)
-    
-    # Check if user is a member
-    if not GroupMembership.objects.filter(group=group, user=request.user).exists():
-        return Response(
-            {"error": "Not a member of this group"},
-            status=status.HTTP_403_FORBIDDEN,
-        )
+    group = load_group(request, group_id)
     
     chapters = Chapter.objects.filter(book=group.book).order_by('chapter_number')
     serializer = ChapterSerializer(chapters, many=True)
@@ -594,20 +835,10 @@ def get_group_chapters(request, group_id):
 
 
 @api_view(["GET", "POST"])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsGroupMember])
 def chapter_schedule_list(request, group_id):
     """Get or create chapter schedules for a user in a group"""
-    try:
-        group = ReadingGroup.objects.get(id=group_id)
-    except ReadingGroup.DoesNotExist:
-        return Response({"error": "Group not found"}, status=status.HTTP_404_NOT_FOUND)
-    
-    # Check if user is a member
-    if not GroupMembership.objects.filter(group=group, user=request.user).exists():
-        return Response(
-            {"error": "Not a member of this group"},
-            status=status.HTTP_403_FORBIDDEN,
-        )
+    group = load_group(request, group_id)
     
     if request.method == "GET":
         schedules = ChapterSchedule.objects.filter(
@@ -628,9 +859,17 @@ def chapter_schedule_list(request, group_id):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        created_schedules = []
         errors = []
-        
+        chapter_ids = set()
+        for schedule_data in schedules_data:
+            try:
+                chapter_ids.add(int(schedule_data.get('chapter')))
+            except (TypeError, ValueError):
+                pass
+        chapters = Chapter.objects.filter(book=group.book, id__in=chapter_ids).in_bulk()
+
+        # Validate everything in memory; later entries for a chapter win
+        pending = {}
         for schedule_data in schedules_data:
             chapter_id = schedule_data.get('chapter')
             target_date = schedule_data.get('target_completion_date')
@@ -640,26 +879,50 @@ def chapter_schedule_list(request, group_id):
                 continue
             
             try:
-                chapter = Chapter.objects.get(id=chapter_id, book=group.book)
-            except Chapter.DoesNotExist:
+                chapter = chapters[int(chapter_id)]
+            except (KeyError, TypeError, ValueError):
                 errors.append(f"Chapter {chapter_id} not found")
                 continue
             
             # Validate date is within group's schedule
-            target_date_obj = parse_date(target_date)
+            try:
+                target_date_obj = parse_date(str(target_date))
+            except ValueError:
+                target_date_obj = None
+            if target_date_obj is None:
+                errors.append(f"Chapter {chapter.chapter_number}: Invalid date {target_date}")
+                continue
             if target_date_obj < group.start_date or target_date_obj > group.end_date:
                 errors.append(f"Chapter {chapter.chapter_number}: Date must be between {group.start_date} and {group.end_date}")
                 continue
-            
-            # Create or update schedule
-            schedule, created = ChapterSchedule.objects.update_or_create(
+
+            pending[chapter.id] = ChapterSchedule(
                 user=request.user,
                 group=group,
                 chapter=chapter,
-                defaults={'target_completion_date': target_date}
+                target_completion_date=target_date_obj,
             )
-            
-            created_schedules.append(ChapterScheduleSerializer(schedule).data)
+
+        created_schedules = []
+        if pending:
+            # Create or update all schedules in a single upsert
+            with transaction.atomic():
+                ChapterSchedule.objects.bulk_create(
+                    list(pending.values()),
+                    update_conflicts=True,
+                    unique_fields=['user', 'group', 'chapter'],
+                    update_fields=['target_completion_date', 'updated_at'],
+                )
+                # Re-read so existing rows report their stored created_at/completed
+                saved = {
+                    schedule.chapter_id: schedule
+                    for schedule in ChapterSchedule.objects.filter(
+                        user=request.user, group=group, chapter_id__in=pending.keys()
+                    ).select_related('chapter')
+                }
+            created_schedules = ChapterScheduleSerializer(
+                [saved[chapter_id] for chapter_id in pending], many=True
+            ).data
         
         return Response({
             'created': len(created_schedules),
@@ -669,14 +932,11 @@ def chapter_schedule_list(request, group_id):
 
 
 @api_view(["PUT", "DELETE"])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsGroupMember])
 def chapter_schedule_detail(request, group_id, schedule_id):
     """Update or delete a specific chapter schedule"""
-    try:
-        group = ReadingGroup.objects.get(id=group_id)
-    except ReadingGroup.DoesNotExist:
-        return Response({"error": "Group not found"}, status=status.HTTP_404_NOT_FOUND)
-    
+    group = load_group(request, group_id)
+
     try:
         schedule = ChapterSchedule.objects.get(
             id=schedule_id,
@@ -703,7 +963,6 @@ def chapter_schedule_detail(request, group_id, schedule_id):
         if completed is not None:
             schedule.completed = completed
             if completed:
-                from django.utils import timezone
                 schedule.completed_at = timezone.now()
             else:
                 schedule.completed_at = None
@@ -31,4 +31,11 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// List endpoints return one page and point at the next one with a
+// `Link: <url>; rel="next"` header; null on the last page
+export const nextPageUrl = (res) => {
+  const next = /<([^>]+)>;\s*rel="next"/.exec(res.headers.link || '');
+  return next ? next[1] : null;
+};
+
 export default api;
\ No newline at end of file
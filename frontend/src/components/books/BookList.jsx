@@ -10,7 +10,7 @@ import {
   Box,
   Typography,
 } from '@mui/material';
-import api from '../../api/axiosConfig';
+import api, { nextPageUrl } from '../../api/axiosConfig';
 import BookCard from './BookCard'; // We'll keep BookCard as a sub-component
 
 export default function BookList({ onBookSelect }) {
@@ -18,6 +18,7 @@ export default function BookList({ onBookSelect }) {
   const [genre, setGenre] = useState('');
   const [books, setBooks] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextBooks, setNextBooks] = useState(null); // Link to the next page of results
   const [genres] = useState(['Fiction', 'Non-Fiction', 'Sci-Fi', 'Mystery', 'Biography', 'Fantasy', 'History']);
 
   const handleSearch = async () => {
@@ -28,14 +29,27 @@ export default function BookList({ onBookSelect }) {
       if (genre) params.genre = genre;
       const res = await api.get('/books/', { params });
       setBooks(res.data);
+      setNextBooks(nextPageUrl(res));
     } catch (err) {
       console.error('Failed to fetch books', err);
       setBooks([]);
+      setNextBooks(null);
     } finally {
       setLoading(false);
     }
   };
 
+  // The next page carries the search and genre in its cursor URL
+  const handleLoadMore = async () => {
+    try {
+      const res = await api.get(nextBooks);
+      setBooks((current) => [...current, ...res.data]);
+      setNextBooks(nextPageUrl(res));
+    } catch (err) {
+      console.error('Failed to fetch more books', err);
+    }
+  };
+
   useEffect(() => {
     handleSearch(); // Load all books on mount
   }, []);
@@ -106,6 +120,26 @@ export default function BookList({ onBookSelect }) {
           ))}
         </Grid>
       )}
+      {!loading && nextBooks && (
+        <Box sx={{ mt: 3, textAlign: 'center' }}>
+          <Box
+            component="button"
+            onClick={handleLoadMore}
+            sx={{
+              py: 1,
+              px: 2,
+              borderRadius: 1,
+              border: '1px solid',
+              borderColor: 'primary.main',
+              backgroundColor: 'white',
+              color: 'primary.main',
+              cursor: 'pointer',
+            }}
+          >
+            Load more
+          </Box>
+        </Box>
+      )}
     </Box>
   );
 }
\ No newline at end of file
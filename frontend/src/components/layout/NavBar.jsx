@@ -19,206 +19,57 @@ import { useAuth } from '../../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import api from '../../api/axiosConfig';
 
+const SEVERITY_BY_KIND = {
+  deadline: 'warning',
+  new_post: 'info',
+  new_comment: 'info',
+  member_joined: 'success',
+};
+
 export default function NavBar() {
   const { user, logout } = useAuth();
   const navigate = useNavigate();
   const [anchorEl, setAnchorEl] = useState(null);
   const [notifications, setNotifications] = useState([]);
+  const [unreadCount, setUnreadCount] = useState(0);
   const open = Boolean(anchorEl);
 
-  // Fetch notifications (smart reminders)
+  // Poll the unread badge; the server answers from a per-user counter
   useEffect(() => {
-    const fetchNotifications = async () => {
-      if (!user) return;
-      
-      try {
-        const [groupRes, progressRes] = await Promise.all([
-          api.get('/groups/'),
-          api.get('/reading-progress/')
-        ]);
-
-        // Create a map of group_id to progress
-        const progressMap = {};
-        progressRes.data.forEach(p => {
-          progressMap[p.group] = p;
-        });
-
-        // Generate smart reminders
-        const today = new Date();
-        today.setHours(0, 0, 0, 0);
+    if (!user) return;
 
-        const newNotifications = groupRes.data
-          .map((group) => {
-            const startDate = new Date(group.start_date);
-            startDate.setHours(0, 0, 0, 0);
-            const deadline = new Date(group.deadline || group.end_date);
-            deadline.setHours(0, 0, 0, 0);
-            
-            const totalDays = Math.max(1, (deadline - startDate) / (1000 * 60 * 60 * 24));
-            const elapsedDays = (today - startDate) / (1000 * 60 * 60 * 24);
-            const daysRemaining = (deadline - today) / (1000 * 60 * 60 * 24);
-            
-            const progress = progressMap[group.id];
-            const currentProgress = progress ? progress.percentage : 0;
-            
-            // Calculate expected progress
-            let scheduleProgress = 0;
-            if (elapsedDays < 0) {
-              scheduleProgress = 0;
-            } else if (elapsedDays > totalDays) {
-              scheduleProgress = 100;
-            } else {
-              scheduleProgress = (elapsedDays / totalDays) * 100;
-            }
-            
-            // Generate different types of notifications
-            const reminders = [];
-            
-            // 1. Urgent - Deadline approaching (within 3 days)
-            if (daysRemaining > 0 && daysRemaining <= 3 && currentProgress < 100) {
-              reminders.push({
-                groupId: group.id,
-                type: 'urgent',
-                severity: 'error',
-                message: `🚨 Deadline for "${group.name}" is in ${Math.ceil(daysRemaining)} day(s)! You're at ${currentProgress}%.`,
-              });
-            }
-            
-            // 2. Overdue - Past deadline
-            else if (daysRemaining < 0 && currentProgress < 100) {
-              reminders.push({
-                groupId: group.id,
-                type: 'overdue',
-                severity: 'error',
-                message: `📕 "${group.name}" deadline has passed! You're at ${currentProgress}%.`,
-              });
-            }
-            
-            // 3. Behind schedule (more than 15% behind)
-            else if (elapsedDays > 0 && scheduleProgress > currentProgress + 15) {
-              reminders.push({
-                groupId: group.id,
-                type: 'behind',
-                severity: 'warning',
-                message: `⚠️ You're falling behind in "${group.name}"! At ${currentProgress}% but should be at ${Math.round(scheduleProgress)}%.`,
-              });
-            }
-            
-            // 4. Warning - Slightly behind schedule (5-15% behind)
-            else if (elapsedDays > 0 && scheduleProgress > currentProgress + 5 && daysRemaining <= 7) {
-              reminders.push({
-                groupId: group.id,
-                type: 'warning',
-                severity: 'info',
-                message: `💡 "${group.name}": ${currentProgress}% complete with ${Math.ceil(daysRemaining)} days left.`,
-              });
-            }
-            
-            // 5. Success - On track
-            else if (elapsedDays > 0 && currentProgress >= scheduleProgress && currentProgress > 0 && currentProgress < 100 && daysRemaining > 3) {
-              reminders.push({
-                groupId: group.id,
-                type: 'success',
-                severity: 'success',
-                message: `✨ Great job! You're ${currentProgress}% through "${group.name}" and on schedule!`,
-              });
-            }
-            
-            return reminders;
-          })
-          .flat()
-          .filter(Boolean);
-
-        // Add some dummy notifications for demonstration
-        const dummyNotifications = [
-          {
-            groupId: null,
-            type: 'new_member',
-            severity: 'info',
-            message: '👥 New member "sarah" joined "To Kill a Mockingbird Discussion Group"!',
-          },
-          {
-            groupId: null,
-            type: 'new_post',
-            severity: 'info',
-            message: '💬 New discussion post in "1984 Book Club": "What did you think about the ending?"',
-          },
-          {
-            groupId: null,
-            type: 'milestone',
-            severity: 'success',
-            message: '🎉 Congratulations! You completed 50% of "The Great Gatsby"!',
-          },
-          {
-            groupId: null,
-            type: 'comment',
-            severity: 'info',
-            message: '💭 john replied to your post in "Pride and Prejudice" discussion.',
-          },
-          {
-            groupId: null,
-            type: 'achievement',
-            severity: 'success',
-            message: '🏆 Achievement unlocked: Read 3 books this month!',
-          },
-        ];
-
-        // Combine smart reminders with dummy notifications
-        const allNotifications = [...newNotifications, ...dummyNotifications];
-        setNotifications(allNotifications);
+    const fetchUnreadCount = async () => {
+      try {
+        const res = await api.get('/notifications/unread-count/');
+        setUnreadCount(res.data.unread_count);
       } catch (err) {
-        console.error('Failed to load notifications', err);
-        // Show dummy notifications even if API fails
-        const dummyNotifications = [
-          {
-            groupId: null,
-            type: 'new_member',
-            severity: 'info',
-            message: '👥 New member "sarah" joined "To Kill a Mockingbird Discussion Group"!',
-          },
-          {
-            groupId: null,
-            type: 'new_post',
-            severity: 'info',
-            message: '💬 New discussion post in "1984 Book Club": "What did you think about the ending?"',
-          },
-          {
-            groupId: null,
-            type: 'milestone',
-            severity: 'success',
-            message: '🎉 Congratulations! You completed 50% of "The Great Gatsby"!',
-          },
-          {
-            groupId: null,
-            type: 'comment',
-            severity: 'info',
-            message: '💭 john replied to your post in "Pride and Prejudice" discussion.',
-          },
-          {
-            groupId: null,
-            type: 'achievement',
-            severity: 'success',
-            message: '🏆 Achievement unlocked: Read 3 books this month!',
-          },
-          {
-            groupId: null,
-            type: 'reminder',
-            severity: 'warning',
-            message: '📖 Don\'t forget to update your reading progress today!',
-          },
-        ];
-        setNotifications(dummyNotifications);
+        console.error('Failed to load notification count', err);
       }
     };
 
-    fetchNotifications();
-    // Refresh notifications every 5 minutes
-    const interval = setInterval(fetchNotifications, 5 * 60 * 1000);
+    fetchUnreadCount();
+    const interval = setInterval(fetchUnreadCount, 60 * 1000);
     return () => clearInterval(interval);
   }, [user]);
 
+  const fetchNotifications = async () => {
+    try {
+      const res = await api.get('/notifications/', { params: { page_size: 20 } });
+      setNotifications(res.data);
+
+      const unreadIds = res.data.filter((n) => !n.is_read).map((n) => n.id);
+      if (unreadIds.length > 0) {
+        const readRes = await api.post('/notifications/read/', { ids: unreadIds });
+        setUnreadCount(readRes.data.unread_count);
+      }
+    } catch (err) {
+      console.error('Failed to load notifications', err);
+    }
+  };
+
   const handleNotificationClick = (event) => {
     setAnchorEl(event.currentTarget);
+    fetchNotifications();
   };
 
   const handleNotificationClose = () => {
@@ -230,7 +81,6 @@ export default function NavBar() {
     if (groupId) {
       navigate(`/groups/${groupId}`);
     }
-    // For dummy notifications without groupId, just close the menu
   };
 
   const handleLogout = async () => {
@@ -257,7 +107,7 @@ export default function NavBar() {
               sx={{ mr: 2 }}
               aria-label="notifications"
             >
-              <Badge badgeContent={notifications.length} color="error">
+              <Badge badgeContent={unreadCount} color="error">
                 <NotificationsIcon />
               </Badge>
             </IconButton>
@@ -293,9 +143,9 @@ export default function NavBar() {
                 </MenuItem>
               ) : (
                 notifications.map((notification, index) => (
-                  <React.Fragment key={index}>
+                  <React.Fragment key={notification.id}>
                     <MenuItem 
-                      onClick={() => handleNotificationItemClick(notification.groupId)}
+                      onClick={() => handleNotificationItemClick(notification.group)}
                       sx={{ 
                         whiteSpace: 'normal',
                         py: 1.5,
@@ -305,7 +155,8 @@ export default function NavBar() {
                       }}
                     >
                       <Alert 
-                        severity={notification.severity} 
+                        severity={SEVERITY_BY_KIND[notification.kind] || 'info'} 
+                        variant={notification.is_read ? 'outlined' : 'standard'}
                         sx={{ 
                           width: '100%',
                           '& .MuiAlert-message': {
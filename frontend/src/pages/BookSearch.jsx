@@ -14,7 +14,7 @@ import {
   Button,
 } from '@mui/material';
 import { useNavigate } from 'react-router-dom';
-import api from '../api/axiosConfig';
+import api, { nextPageUrl } from '../api/axiosConfig';
 import NavBar from '../components/layout/NavBar';
 
 export default function BookSearch() {
@@ -22,6 +22,7 @@ export default function BookSearch() {
   const [search, setSearch] = useState('');
   const [genre, setGenre] = useState('');
   const [books, setBooks] = useState([]);
+  const [nextBooks, setNextBooks] = useState(null); // Link to the next page of results
   const [genres] = useState(['Fiction', 'Non-Fiction', 'Sci-Fi', 'Mystery', 'Biography']);
 
   const handleSearch = async () => {
@@ -31,9 +32,22 @@ export default function BookSearch() {
       if (genre) params.genre = genre;
       const res = await api.get('/books/', { params });
       setBooks(res.data);
+      setNextBooks(nextPageUrl(res));
     } catch (err) {
       console.error('Search failed', err);
       setBooks([]);
+      setNextBooks(null);
+    }
+  };
+
+  // The next page carries the search and genre in its cursor URL
+  const handleLoadMore = async () => {
+    try {
+      const res = await api.get(nextBooks);
+      setBooks((current) => [...current, ...res.data]);
+      setNextBooks(nextPageUrl(res));
+    } catch (err) {
+      console.error('Failed to load more results', err);
     }
   };
 
@@ -97,6 +111,11 @@ export default function BookSearch() {
             </Grid>
           ))}
         </Grid>
+        {nextBooks && (
+          <Button variant="outlined" sx={{ mt: 3 }} fullWidth onClick={handleLoadMore}>
+            Load more
+          </Button>
+        )}
       </Box>
     </>
   );
@@ -14,7 +14,7 @@ import {
 } from '@mui/material';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
-import api from '../api/axiosConfig';
+import api, { nextPageUrl } from '../api/axiosConfig';
 import NavBar from '../components/layout/NavBar';
 
 export default function DiscussionForum() {
@@ -24,6 +24,7 @@ export default function DiscussionForum() {
   const [posts, setPosts] = useState([]);
   const [newPost, setNewPost] = useState('');
   const [loading, setLoading] = useState(true);
+  const [nextPosts, setNextPosts] = useState(null); // Link to the next page of older posts
   const [replyingTo, setReplyingTo] = useState(null); // Track which post is being replied to
   const [replyContent, setReplyContent] = useState(''); // Reply text
   const EMOJIS = ['👍', '❤️', '😂', '😮', '😢'];
@@ -32,6 +33,7 @@ export default function DiscussionForum() {
     try {
       const res = await api.get(`/groups/${groupId}/discussion/`);
       setPosts(res.data);
+      setNextPosts(nextPageUrl(res));
     } catch (err) {
       console.error('Failed to load discussion', err);
       alert('You must be a group member to view this forum');
@@ -41,10 +43,68 @@ export default function DiscussionForum() {
     }
   };
 
+  // Older posts, one page at a time; live updates may already have some of them
+  const fetchOlderPosts = async () => {
+    try {
+      const res = await api.get(nextPosts);
+      setPosts((current) => [
+        ...current,
+        ...res.data.filter((post) => !current.some((p) => p.id === post.id)),
+      ]);
+      setNextPosts(nextPageUrl(res));
+    } catch (err) {
+      console.error('Failed to load older posts', err);
+    }
+  };
+
   useEffect(() => {
     if (groupId) fetchPosts();
   }, [groupId]);
 
+  // Live updates: apply other members' posts, replies and reactions as they
+  // happen. Our own changes also echo back here, so every update is idempotent.
+  useEffect(() => {
+    if (!groupId) return undefined;
+    const source = new EventSource(`${api.defaults.baseURL}/groups/${groupId}/events/`, {
+      withCredentials: true,
+    });
+
+    source.addEventListener('post_created', (event) => {
+      const { post } = JSON.parse(event.data);
+      setPosts((current) => (current.some((p) => p.id === post.id) ? current : [post, ...current]));
+    });
+
+    source.addEventListener('comment_created', (event) => {
+      const { post_id: postId, comment, comment_count: commentCount } = JSON.parse(event.data);
+      setPosts((current) => current.map((post) => {
+        if (post.id !== postId || (post.comments || []).some((c) => c.id === comment.id)) return post;
+        return { ...post, comments: [...(post.comments || []), comment], comment_count: commentCount };
+      }));
+    });
+
+    // Events carry totals only; whether we reacted is kept from our own state
+    source.addEventListener('reaction_toggled', (event) => {
+      const { post_id: postId, action, emoji, user: reactor, counts } = JSON.parse(event.data);
+      setPosts((current) => current.map((post) => {
+        if (post.id !== postId) return post;
+        const mine = new Set((post.reactions || []).filter((r) => r.reacted_by_me).map((r) => r.emoji));
+        if (reactor === user?.id) {
+          if (action === 'added') mine.add(emoji);
+          else mine.delete(emoji);
+        }
+        return {
+          ...post,
+          reactions: counts.map((c) => ({ ...c, reacted_by_me: mine.has(c.emoji) })),
+        };
+      }));
+    });
+
+    // We fell too far behind the stream; reload the page of posts once
+    source.addEventListener('resync', () => fetchPosts());
+
+    return () => source.close();
+  }, [groupId, user?.id]);
+
   const handleCreatePost = async () => {
     if (!newPost.trim()) return;
     try {
@@ -71,7 +131,11 @@ export default function DiscussionForum() {
       // Update the post with the new comment
       setPosts(posts.map(post => 
         post.id === postId 
-          ? { ...post, comments: [...(post.comments || []), res.data] }
+          ? {
+            ...post,
+            comments: [...(post.comments || []), res.data],
+            comment_count: (post.comment_count || 0) + 1,
+          }
           : post
       ));
       setReplyContent('');
@@ -83,6 +147,25 @@ export default function DiscussionForum() {
     }
   };
 
+  // Posts arrive with only their latest replies; fetch the whole thread,
+  // following the Link header page by page
+  const handleShowAllReplies = async (postId) => {
+    try {
+      const comments = [];
+      let url = `/posts/${postId}/comments/`;
+      while (url) {
+        const res = await api.get(url);
+        comments.push(...res.data);
+        url = nextPageUrl(res);
+      }
+      setPosts((current) => current.map((post) => (
+        post.id === postId ? { ...post, comments, comment_count: comments.length } : post
+      )));
+    } catch (err) {
+      console.error('Failed to load replies', err);
+    }
+  };
+
   const handleToggleReaction = async (postId, emoji) => {
     try {
       const res = await api.post(`/posts/${postId}/reactions/`, { emoji });
@@ -152,6 +235,11 @@ export default function DiscussionForum() {
                 {/* Comments/Replies */}
                 {post.comments && post.comments.length > 0 && (
                   <Box sx={{ ml: 7, mt: 2, borderLeft: '2px solid #e0e0e0', pl: 2 }}>
+                    {post.comment_count > post.comments.length && (
+                      <Button size="small" sx={{ mb: 1 }} onClick={() => handleShowAllReplies(post.id)}>
+                        View all {post.comment_count} replies
+                      </Button>
+                    )}
                     {post.comments.map((comment) => (
                       <Box key={comment.id} sx={{ mb: 2 }}>
                         <Typography variant="subtitle2" sx={{ fontWeight: 'bold' }}>
@@ -173,8 +261,9 @@ export default function DiscussionForum() {
                   {/* Reactions row */}
                   <Box sx={{ display: 'flex', gap: 1, alignItems: 'center', mb: 1 }}>
                     {EMOJIS.map((emoji) => {
-                      const count = (post.reactions || []).filter(r => r.emoji === emoji).length;
-                      const userReacted = (post.reactions || []).some(r => r.emoji === emoji && r.user === user?.id);
+                      const reaction = (post.reactions || []).find(r => r.emoji === emoji);
+                      const count = reaction ? reaction.count : 0;
+                      const userReacted = Boolean(reaction?.reacted_by_me);
                       return (
                         <Button
                           key={emoji}
@@ -231,6 +320,11 @@ export default function DiscussionForum() {
             </React.Fragment>
           ))}
         </List>
+        {nextPosts && (
+          <Button variant="outlined" fullWidth onClick={fetchOlderPosts}>
+            Load older posts
+          </Button>
+        )}
       </Box>
     </>
   );
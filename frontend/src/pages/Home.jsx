@@ -36,41 +36,25 @@ export default function Home() {
         return;
       }
       try {
-        const groupRes = await api.get('/groups/');
-        setGroups(groupRes.data);
+        // One request returns groups, book summaries and this user's progress
+        const dashboardRes = await api.get('/dashboard/');
+        const userGroups = dashboardRes.data.groups;
+        setGroups(userGroups);
 
-        // Fetch reading progress for each group
-        const progressPromises = groupRes.data.map(async (group) => {
-          try {
-            const progressRes = await api.get(`/groups/${group.id}/progress/`);
-            return {
-              groupId: group.id,
-              currentPage: progressRes.data.current_page || 1,
-              totalPages: progressRes.data.book_details?.total_pages || 100,
-            };
-          } catch (err) {
-            console.error(`Failed to load progress for group ${group.id}`, err);
-            return {
-              groupId: group.id,
-              currentPage: 1,
-              totalPages: 100,
-            };
-          }
-        });
-
-        const progressData = await Promise.all(progressPromises);
         const progressMap = {};
-        progressData.forEach((p) => {
-          progressMap[p.groupId] = {
-            currentPage: p.currentPage,
-            totalPages: p.totalPages,
-            percentage: Math.round((p.currentPage / p.totalPages) * 100),
+        userGroups.forEach((group) => {
+          const currentPage = group.progress?.current_page || 1;
+          const totalPages = group.book_details?.total_pages || 100;
+          progressMap[group.id] = {
+            currentPage,
+            totalPages,
+            percentage: Math.round((currentPage / totalPages) * 100),
           };
         });
         setReadingProgress(progressMap);
 
         // Generate smart reminders based on actual reading progress vs schedule
-        const newReminders = groupRes.data
+        const newReminders = userGroups
           .map((group) => {
             const today = new Date();
             today.setHours(0, 0, 0, 0);